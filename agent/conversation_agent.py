@@ -157,10 +157,9 @@ class ConversationAgent:
 
         except Exception as e:
             elapsed = (datetime.now() - start).total_seconds()
-            logger.error(
-                f"[Agent] process() error — session={session_id} "
-                f"user={user_id} error={e}",
-                exc_info=True,
+            logger.exception(
+                "[Agent] process() error — session=%s user=%s error=%s",
+                session_id, user_id, e,
             )
             return self._error_response(str(e), session_id, user_id, elapsed)
 
@@ -369,7 +368,7 @@ class ConversationAgent:
 
         except Exception as e:
             # Never let persistence failures surface to the user
-            logger.error(f"[Agent] Persistence error (non-fatal): {e}", exc_info=True)
+            logger.exception("[Agent] Persistence error (non-fatal): %s", e)
 
     # ──────────────────────────────────────────────────────────────────
     # Helpers
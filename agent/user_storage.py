@@ -238,7 +238,7 @@ class UserStorage:
             return row_id
 
         except Exception as e:
-            logger.error(f"[Storage] save_conversation error: {e}", exc_info=True)
+            logger.exception("[Storage] save_conversation error: %s", e)
             return None
 
     async def get_conversation_history(
@@ -3,16 +3,77 @@ Local ML Service — Bank AI Assistant
 Uses custom domain-specific ML + NLP model for intent detection.
 100% on-premise — no data leaves your infrastructure.
 """
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import copy
 import json
 import logging
+import time
 
-from ml_intent_classifier import intent_classifier
-from client.mcp_client import bank_client_manager, gst_client_manager, info_client_manager
+try:
+    from orjson import loads as _json_loads     # C parser, 2–5× faster than stdlib
+except ImportError:
+    from json import loads as _json_loads
+
+from client.mcp_client import canonical_args, mcp_registry
 from config.config import settings          # FIX 4: module-level import, not per-call
 
 logger = logging.getLogger(__name__)
 
+# Info/onboarding server tools do NOT accept api_key — skip injection for them.
+# Built once at import rather than on every query.
+INFO_SERVER_TOOLS = frozenset({
+    # Onboarding info tools — no api_key param
+    "get_company_onboarding_guide", "get_company_required_documents",
+    "get_validation_formats", "get_onboarding_faq",
+    "get_bank_onboarding_guide", "get_vendor_onboarding_guide",
+    # GST calculator tools — no api_key param
+    "calculate_gst", "reverse_calculate_gst", "gst_breakdown",
+    "compare_gst_rates", "validate_gstin",
+})
+
+# Side-effect-free tools (GST maths, static onboarding docs). Only these are
+# safe to coalesce within a query or to serve from the result cache —
+# payments and other bank tools must run every time they are asked for, and
+# validate_gstin does a live GSTN lookup (same exclusion as CACHEABLE_TOOLS).
+PURE_TOOLS = INFO_SERVER_TOOLS - {"validate_gstin"}
+
+# Whole-query result cache — only used when every tool call is in PURE_TOOLS
+RESULT_CACHE_SIZE      = 256
+RESULT_CACHE_TTL_SECS  = 60.0
+
+# Classifier output per message. The classifier is deterministic, so entries
+# never go stale; the key is only whitespace-stripped because entity
+# extraction (transaction IDs, GSTINs) is case-sensitive.
+CLASSIFIER_CACHE_SIZE  = 1024
+
+
+def _call_key(tool_name: str, parameters: Dict[str, Any]) -> Tuple[str, bytes]:
+    """Hashable signature of a tool call; nested params are frozen via JSON."""
+    return tool_name, canonical_args(parameters)
+
+
+# Leading characters of a payload worth handing to the JSON parser. Plain-text
+# results (error strings, "OK") are recognised up front instead of being parsed
+# and caught on the way back out.
+_JSON_LEADS = frozenset({"{", "[", '"', b"{", b"[", b'"'})
+
+
+def _maybe_parse(raw: Any) -> Any:
+    """Decode a JSON tool payload. Values the transport already deserialized
+    (or text that isn't JSON) are returned unchanged."""
+    if not isinstance(raw, (str, bytes, bytearray)):
+        return raw
+    lead = raw.lstrip()[:1]
+    if (bytes(lead) if isinstance(lead, bytearray) else lead) not in _JSON_LEADS:
+        return raw
+    try:
+        return _json_loads(raw)
+    except json.JSONDecodeError:      # looked like JSON but wasn't
+        return raw
+
 
 class LocalMLService:
     """
@@ -21,7 +82,18 @@ class LocalMLService:
     """
 
     def __init__(self):
+        # Imported here, not at module top: the classifier module pulls in
+        # numpy / pandas / scikit-learn and loads the model on import, which
+        # only the process that actually builds the service should pay for.
+        from ml_intent_classifier import intent_classifier
         self.intent_classifier = intent_classifier
+        # tool name → MCP client; built on first query, reused afterwards
+        self._tool_client_map: Optional[Dict[str, Any]] = None
+        self._routing_clients: Optional[tuple] = None
+        # normalized message → (stored_at, result); LRU order, oldest first
+        self._result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # stripped message → classifier analysis; LRU order, oldest first
+        self._intent_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         logger.info("✓ Local ML Service initialized (NO external LLM)")
 
     async def process_query(
@@ -33,24 +105,21 @@ class LocalMLService:
         Process user query using LOCAL ML model.
         No data sent to external APIs — all processing on-premise.
         """
-        logger.info(f"Processing query locally: {user_message[:100]}...")
+        logger.info("Processing query locally: %s...", user_message[:100])
+
+        # Same key as the classifier cache — entities are case-sensitive
+        cache_key = user_message.strip()
+        cached    = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("✓ Result cache hit")
+            return cached
 
         # STEP 1: ML-based intent + entity detection
-        analysis         = self.intent_classifier.process_query(user_message)
+        analysis         = self._classify(user_message)
         intents_detected = analysis.get("intents_detected", [])
         tool_calls_specs = analysis.get("tool_calls", [])
 
         # Inject bank API key centrally — classifier never needs to know about it
-        # Info/onboarding server tools do NOT accept api_key — skip injection for them
-        INFO_SERVER_TOOLS = {
-            # Onboarding info tools — no api_key param
-            "get_company_onboarding_guide", "get_company_required_documents",
-            "get_validation_formats", "get_onboarding_faq",
-            "get_bank_onboarding_guide", "get_vendor_onboarding_guide",
-            # GST calculator tools — no api_key param
-            "calculate_gst", "reverse_calculate_gst", "gst_breakdown",
-            "compare_gst_rates", "validate_gstin",
-        }
         if settings.bank_api_key:
             for spec in tool_calls_specs:
                 tool_nm = spec.get("tool_name", "")
@@ -61,35 +130,60 @@ class LocalMLService:
                     params["api_key"] = settings.bank_api_key
                     spec["parameters"] = params
 
-        logger.info(f"✓ Intents detected : {intents_detected}")
-        logger.info(f"✓ Tool calls       : {len(tool_calls_specs)}")
+        logger.info("✓ Intents detected : %s", intents_detected)
+        logger.info("✓ Tool calls       : %s", len(tool_calls_specs))
 
-        # STEP 2: Get all 3 MCP clients and build routing map
-        bank_client = await bank_client_manager.get_client()
-        gst_client  = await gst_client_manager.get_client()
-        info_client = await info_client_manager.get_client()
+        # STEP 2: Get all 3 MCP clients (connected concurrently) and build routing map
+        bank_client, gst_client, info_client = await mcp_registry.get_all()
 
-        tool_client_map = {}
-        for tool in bank_client.available_tools:
-            tool_client_map[tool["name"]] = bank_client
-        for tool in gst_client.available_tools:
-            tool_client_map[tool["name"]] = gst_client
-        for tool in info_client.available_tools:
-            tool_client_map[tool["name"]] = info_client
+        tool_client_map = self._get_routing(bank_client, gst_client, info_client)
 
         # STEP 3: Execute tool calls via MCP
-        mcp_results = []
-
-        for idx, tool_spec in enumerate(tool_calls_specs, 1):
+        # Each call is an independent round-trip to its server, so they are
+        # dispatched concurrently — latency is max(t_i) rather than sum(t_i).
+        num_tools = len(tool_calls_specs)
+        clients   = [tool_client_map.get(spec["tool_name"]) for spec in tool_calls_specs]
+
+        # Per-tool status lines — the loop is skipped entirely when INFO is
+        # filtered out, and whole parameter dicts are only repr'd at DEBUG.
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        if log_info:
+            for idx, tool_spec in enumerate(tool_calls_specs, 1):
+                logger.info("[%s/%s] Executing: %s", idx, num_tools, tool_spec['tool_name'])
+                logger.debug("  Parameters: %r", tool_spec['parameters'])
+
+        # Identical calls to pure tools within one query are executed once;
+        # slots[i] is the index into `calls` whose outcome spec i receives.
+        calls: List[Any]                    = []
+        slots: List[Optional[int]]          = []
+        seen:  Dict[Tuple[str, bytes], int] = {}
+
+        for client, spec in zip(clients, tool_calls_specs):
+            if not client:
+                slots.append(None)
+                continue
+            key = None
+            if spec["tool_name"] in PURE_TOOLS:
+                key = _call_key(spec["tool_name"], spec["parameters"])
+                if key in seen:
+                    slots.append(seen[key])
+                    continue
+                seen[key] = len(calls)
+            slots.append(len(calls))
+            calls.append(client.call_tool(spec["tool_name"], spec["parameters"]))
+
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+
+        mcp_results   = []
+        success_count = 0
+
+        for idx, (tool_spec, slot) in enumerate(zip(tool_calls_specs, slots), 1):
             tool_name       = tool_spec["tool_name"]
             tool_parameters = tool_spec["parameters"]
 
-            logger.info(f"[{idx}/{len(tool_calls_specs)}] Executing: {tool_name}")
-            logger.info(f"  Parameters: {tool_parameters}")
-
-            client = tool_client_map.get(tool_name)
-            if not client:
-                logger.error(f"No client for tool: {tool_name}")
+            if slot is None:
+                logger.error("No client for tool: %s", tool_name)
                 mcp_results.append({
                     "tool":    tool_name,
                     "input":   tool_parameters,
@@ -98,50 +192,42 @@ class LocalMLService:
                 })
                 continue
 
-            try:
-                result = await client.call_tool(tool_name, tool_parameters)
-
-                if result.get("success") and result.get("result"):
-                    try:
-                        parsed = (
-                            json.loads(result["result"])
-                            if isinstance(result["result"], str)
-                            else result["result"]
-                        )
-                    except json.JSONDecodeError:
-                        parsed = result["result"]
-
-                    mcp_results.append({
-                        "tool":    tool_name,
-                        "input":   tool_parameters,
-                        "result":  parsed,
-                        "success": True,
-                    })
-                    logger.info(f"[{idx}/{len(tool_calls_specs)}] ✓ Success")
-
-                else:
-                    error_msg = result.get("error", "Tool returned no result")
-                    mcp_results.append({
-                        "tool":    tool_name,
-                        "input":   tool_parameters,
-                        "error":   error_msg,
-                        "success": False,
-                    })
-                    logger.error(f"[{idx}/{len(tool_calls_specs)}] ✗ Failed: {error_msg}")
-
-            except Exception as e:
-                logger.error(f"[{idx}/{len(tool_calls_specs)}] Exception: {e}")
+            result = outcomes[slot]
+
+            if isinstance(result, Exception):
+                logger.error("[%s/%s] Exception: %s", idx, num_tools, result)
+                mcp_results.append({
+                    "tool":    tool_name,
+                    "input":   tool_parameters,
+                    "error":   str(result),
+                    "success": False,
+                })
+
+            elif result.get("success") and result.get("result"):
+                mcp_results.append({
+                    "tool":    tool_name,
+                    "input":   tool_parameters,
+                    "result":  _maybe_parse(result["result"]),
+                    "success": True,
+                })
+                success_count += 1
+                if log_info:
+                    logger.info("[%s/%s] ✓ Success", idx, num_tools)
+
+            else:
+                error_msg = result.get("error", "Tool returned no result")
                 mcp_results.append({
                     "tool":    tool_name,
                     "input":   tool_parameters,
-                    "error":   str(e),
+                    "error":   error_msg,
                     "success": False,
                 })
+                logger.error("[%s/%s] ✗ Failed: %s", idx, num_tools, error_msg)
 
         # STEP 4: Generate response (template-based, NO LLM)
         response_text = self._generate_response(mcp_results, intents_detected, user_message)
 
-        return {
+        response = {
             "success":          True,
             "intents_detected": intents_detected,
             "is_multi_intent":  len(intents_detected) > 1,
@@ -151,12 +237,70 @@ class LocalMLService:
             "ml_model":         "local_domain_specific",
             "debug_info": {
                 "total_tools_called": len(mcp_results),
-                "successful_tools":   len([r for r in mcp_results if r.get("success")]),
+                "successful_tools":   success_count,
                 "intents":            intents_detected,
                 "entities_extracted": analysis.get("entities", {}),
             },
         }
 
+        if mcp_results and all(
+            r["success"] and r["tool"] in PURE_TOOLS for r in mcp_results
+        ):
+            self._cache_put(cache_key, response)
+
+        return response
+
+    # ─────────────────────────────────────────────────────────
+    # RESULT CACHE
+    # ─────────────────────────────────────────────────────────
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > RESULT_CACHE_TTL_SECS:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return copy.deepcopy(result)     # callers may mutate the returned dict
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        self._result_cache[key] = (time.monotonic(), copy.deepcopy(result))
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _classify(self, user_message: str) -> Dict[str, Any]:
+        """intent_classifier.process_query with an LRU in front of it.
+        Returns a private copy — the api_key injection mutates tool specs."""
+        key      = user_message.strip()
+        analysis = self._intent_cache.get(key)
+        if analysis is None:
+            analysis = self.intent_classifier.process_query(user_message)
+            self._intent_cache[key] = copy.deepcopy(analysis)
+            if len(self._intent_cache) > CLASSIFIER_CACHE_SIZE:
+                self._intent_cache.popitem(last=False)
+            return analysis
+        self._intent_cache.move_to_end(key)
+        return copy.deepcopy(analysis)
+
+    # ─────────────────────────────────────────────────────────
+    # ROUTING
+    # ─────────────────────────────────────────────────────────
+
+    def _get_routing(self, *clients) -> Dict[str, Any]:
+        """Return the tool → client map, rebuilding it only when the
+        managers hand back different client instances (e.g. reconnect)."""
+        if self._tool_client_map is None or self._routing_clients != clients:
+            self._tool_client_map = {
+                tool["name"]: client
+                for client in clients
+                for tool in client.available_tools
+            }
+            self._routing_clients = clients
+        return self._tool_client_map
+
     # ─────────────────────────────────────────────────────────
     # RESPONSE TEMPLATES
     # ─────────────────────────────────────────────────────────
@@ -194,754 +338,860 @@ class LocalMLService:
                 response_parts.append(f"⚠️ {tool_name} returned unexpected response: {data}")
                 continue
 
-            # ── CORE PAYMENT ──────────────────────────────────────────
-            if tool_name == "initiate_payment":
-                response_parts.append(
-                    f"**Payment Initiated ✅**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Amount         : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Mode           : {data.get('payment_mode', '')}\n"
-                    f"• Status         : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_payment_status":
-                response_parts.append(
-                    f"**Payment Status**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Status         : {data.get('status', '')}\n"
-                    f"• UTR Number     : {data.get('utr_number', '')}"
-                )
-
-            elif tool_name == "cancel_payment":
-                response_parts.append(
-                    f"**Payment Cancelled ✅**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Reason         : {data.get('reason', '')}"
-                )
-
-            elif tool_name == "retry_payment":
-                response_parts.append(
-                    f"**Payment Retry Initiated**\n"
-                    f"• Original TXN : {data.get('original_transaction_id', '')}\n"
-                    f"• New TXN ID   : {data.get('new_transaction_id', '')}\n"
-                    f"• Status       : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_payment_receipt":
-                response_parts.append(
-                    f"**Payment Receipt**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Format         : {data.get('format', '')}\n"
-                    f"• [Download Receipt]({data.get('download_url', '')})"
-                )
-
-            elif tool_name == "validate_beneficiary":
-                valid  = data.get("valid", False)
-                symbol = "✅" if valid else "❌"
-                response_parts.append(
-                    f"**Beneficiary Validation {symbol}**\n"
-                    f"• Account Holder : {data.get('account_holder_name', '')}\n"
-                    f"• Bank           : {data.get('bank', '')}\n"
-                    f"• Valid          : {valid}"
-                )
-
-            # ── UPLOAD PAYMENT ────────────────────────────────────────
-            elif tool_name == "upload_bulk_payment":
-                response_parts.append(
-                    f"**Bulk Payment Upload ✅**\n"
-                    f"• Upload ID       : {data.get('upload_id', '')}\n"
-                    f"• Total Records   : {data.get('total_records', 0)}\n"
-                    f"• Valid Records   : {data.get('valid_records', 0)}\n"
-                    f"• Invalid Records : {data.get('invalid_records', 0)}\n"
-                    f"• Total Amount    : ₹{data.get('total_amount', 0):,.2f}\n"
-                    f"• Status          : {data.get('status', '')}"
-                )
-
-            elif tool_name == "validate_payment_file":
-                response_parts.append(
-                    f"**File Validation: {data.get('validation_status', '')}**\n"
-                    f"• Errors   : {len(data.get('errors', []))}\n"
-                    f"• Warnings : {len(data.get('warnings', []))}"
-                )
-
-            # ── B2B ───────────────────────────────────────────────────
-            elif tool_name == "onboard_business_partner":
-                response_parts.append(
-                    f"**Partner Onboarded ✅**\n"
-                    f"• Partner ID : {data.get('partner_id', '')}\n"
-                    f"• Company    : {data.get('company_name', '')}\n"
-                    f"• KYC Status : {data.get('kyc_status', '')}\n"
-                    f"• Status     : {data.get('status', '')}"
-                )
-
-            elif tool_name == "send_invoice":
-                response_parts.append(
-                    f"**Invoice Sent ✅**\n"
-                    f"• Invoice ID : {data.get('invoice_id', '')}\n"
-                    f"• Amount     : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Total      : ₹{data.get('total_amount', 0):,.2f}\n"
-                    f"• Status     : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_received_invoices":
-                lines = [f"**Received Invoices ({data.get('total', 0)} total):**"]
-                for inv in data.get("invoices", [])[:5]:
-                    lines.append(
-                        f"• [{inv.get('invoice_id')}] {inv.get('partner')} — "
-                        f"₹{inv.get('amount', 0):,.2f} | Due: {inv.get('due_date')} | {inv.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "acknowledge_payment":
-                response_parts.append(
-                    f"**Payment Acknowledged ✅**\n"
-                    f"• ACK ID     : {data.get('acknowledgment_id', '')}\n"
-                    f"• Invoice ID : {data.get('invoice_id', '')}\n"
-                    f"• Status     : {data.get('status', '')}"
-                )
-
-            elif tool_name == "create_proforma_invoice":
-                response_parts.append(
-                    f"**Proforma Invoice Created ✅**\n"
-                    f"• Proforma ID : {data.get('proforma_id', '')}\n"
-                    f"• Amount      : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Valid Until : {data.get('validity_date', '')}"
-                )
-
-            elif tool_name == "create_cd_note":
-                response_parts.append(
-                    f"**{data.get('note_type', '')} Note Created ✅**\n"
-                    f"• Note ID : {data.get('note_id', '')}\n"
-                    f"• Amount  : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Reason  : {data.get('reason', '')}"
-                )
-
-            elif tool_name == "create_purchase_order":
-                response_parts.append(
-                    f"**Purchase Order Raised ✅**\n"
-                    f"• PO ID    : {data.get('po_id', '')}\n"
-                    f"• Amount   : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Delivery : {data.get('delivery_date', '')}"
-                )
-
-            # ── INSURANCE ─────────────────────────────────────────────
-            elif tool_name == "fetch_insurance_dues":
-                lines = [f"**Upcoming Insurance Dues ({len(data.get('dues', []))} policies):**"]
-                for d in data.get("dues", []):
-                    lines.append(
-                        f"• [{d.get('policy_number')}] {d.get('insurer')} — "
-                        f"₹{d.get('premium', 0):,.2f} | Due: {d.get('due_date')} | {d.get('type')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "pay_insurance_premium":
-                response_parts.append(
-                    f"**Insurance Premium Paid ✅**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Policy         : {data.get('policy_number', '')}\n"
-                    f"• Amount         : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Status         : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_insurance_payment_history":
-                lines = [f"**Insurance Payment History ({data.get('total', 0)} records)**"]
-                for p in data.get("payments", [])[:5]:
-                    lines.append(
-                        f"• {p.get('policy_number')} — ₹{p.get('amount', 0):,.2f} | {p.get('paid_on')} | {p.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── BANK STATEMENT ────────────────────────────────────────
-            elif tool_name == "fetch_bank_statement":
-                response_parts.append(
-                    f"**Bank Statement**\n"
-                    f"• Account       : {data.get('account_number', '')}\n"
-                    f"• Period        : {data.get('from_date', '')} → {data.get('to_date', '')}\n"
-                    f"• Opening Bal   : ₹{data.get('opening_balance', 0):,.2f}\n"
-                    f"• Closing Bal   : ₹{data.get('closing_balance', 0):,.2f}\n"
-                    f"• Total Credits : ₹{data.get('total_credits', 0):,.2f}\n"
-                    f"• Total Debits  : ₹{data.get('total_debits', 0):,.2f}"
-                )
-
-            elif tool_name == "download_bank_statement":
-                response_parts.append(
-                    f"**Statement Download Ready**\n"
-                    f"• Format : {data.get('format', '')}\n"
-                    f"• [Download Statement]({data.get('download_url', '')})"
-                )
-
-            elif tool_name == "get_account_balance":
-                response_parts.append(
-                    f"**Account Balance**\n"
-                    f"• Account           : {data.get('account_number', '')}\n"
-                    f"• Available Balance : ₹{data.get('available_balance', 0):,.2f}\n"
-                    f"• Current Balance   : ₹{data.get('current_balance', 0):,.2f}"
-                )
-
-            elif tool_name == "get_transaction_history":
-                txns  = data.get("transactions", [])
-                lines = [
-                    f"**Transaction History — {data.get('from_date', '')} → {data.get('to_date', '')}**\n"
-                    f"• Account  : {data.get('account_number', '') or 'Default'}\n"
-                    f"• Showing  : {data.get('returned', len(txns))} of {data.get('total', 0)} transactions"
-                ]
-                for t in txns:
-                    symbol = "⬆️" if t.get("type") == "CREDIT" else "⬇️"
-                    lines.append(
-                        f"{symbol} {t.get('date')} | {t.get('description', '')[:45]}\n"
-                        f"   ₹{t.get('amount', 0):,.2f} {t.get('type')} | {t.get('mode')} | Bal: ₹{t.get('balance', 0):,.2f}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── CUSTOM / SEZ ──────────────────────────────────────────
-            elif tool_name == "pay_custom_duty":
-                response_parts.append(
-                    f"**Custom Duty Paid ✅**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• BOE Number     : {data.get('bill_of_entry_number', '')}\n"
-                    f"• Amount         : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Challan        : {data.get('challan_number', '')}\n"
-                    f"• Status         : {data.get('status', '')}"
-                )
-
-            elif tool_name == "track_custom_duty_payment":
-                response_parts.append(
-                    f"**Custom Duty Payment Status**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Status         : {data.get('status', '')}\n"
-                    f"• Challan        : {data.get('challan_number', '')}"
-                )
-
-            elif tool_name == "get_custom_duty_history":
-                lines = [f"**Custom Duty History ({data.get('total', 0)} records)**"]
-                for p in data.get("payments", [])[:5]:
-                    lines.append(
-                        f"• TXN: {p.get('transaction_id')} — ₹{p.get('amount', 0):,.2f} | {p.get('paid_on')} | {p.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── GST (bank server — pay/fetch/history/challan) ─────────
-            elif tool_name == "fetch_gst_dues":
-                lines = [f"**GST Dues for {data.get('gstin', '')}:**"]
-                for d in data.get("dues", []):
-                    lines.append(
-                        f"• [{d.get('return_type')}] {d.get('period')} — "
-                        f"₹{d.get('amount', 0):,.2f} | Due: {d.get('due_date')} | {d.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "pay_gst":
-                response_parts.append(
-                    f"**GST Payment Successful ✅**\n"
-                    f"• Transaction ID    : {data.get('transaction_id', '')}\n"
-                    f"• GSTIN             : {data.get('gstin', '')}\n"
-                    f"• Amount            : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Tax Type          : {data.get('tax_type', '')}\n"
-                    f"• Payment Reference : {data.get('payment_reference', '')}"
-                )
-
-            elif tool_name == "create_gst_challan":
-                response_parts.append(
-                    f"**GST Challan (PMT-06) Created ✅**\n"
-                    f"• CPIN         : {data.get('cpin', '')}\n"
-                    f"• GSTIN        : {data.get('gstin', '')}\n"
-                    f"• Total Amount : ₹{data.get('total_amount', 0):,.2f}\n"
-                    f"• IGST         : ₹{data.get('igst', 0):,.2f}\n"
-                    f"• CGST         : ₹{data.get('cgst', 0):,.2f}\n"
-                    f"• SGST         : ₹{data.get('sgst', 0):,.2f}\n"
-                    f"• CESS         : ₹{data.get('cess', 0):,.2f}\n"
-                    f"• Valid Until  : {data.get('valid_until', '')}"
-                )
-
-            elif tool_name == "get_gst_payment_history":
-                lines = [f"**GST Payment History — {data.get('gstin', '')} ({data.get('total', 0)} records)**"]
-                for p in data.get("payments", [])[:5]:
-                    lines.append(
-                        f"• CPIN: {p.get('cpin')} — ₹{p.get('amount', 0):,.2f} | {p.get('paid_on')} | {p.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── ESIC ──────────────────────────────────────────────────
-            elif tool_name == "fetch_esic_dues":
-                response_parts.append(
-                    f"**ESIC Dues — {data.get('establishment_code', '')} ({data.get('month', '')})**\n"
-                    f"• Employees            : {data.get('employee_count', 0)}\n"
-                    f"• Employer Contribution: ₹{data.get('employer_contribution', 0):,.2f}\n"
-                    f"• Employee Contribution: ₹{data.get('employee_contribution', 0):,.2f}\n"
-                    f"• Total Due            : ₹{data.get('total_due', 0):,.2f}\n"
-                    f"• Due Date             : {data.get('due_date', '')}"
-                )
-
-            elif tool_name == "pay_esic":
-                response_parts.append(
-                    f"**ESIC Payment Successful ✅**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Establishment  : {data.get('establishment_code', '')}\n"
-                    f"• Month          : {data.get('month', '')}\n"
-                    f"• Amount         : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Challan        : {data.get('challan_number', '')}"
-                )
-
-            elif tool_name == "get_esic_payment_history":
-                lines = [f"**ESIC Payment History ({data.get('total', 0)} records)**"]
-                for p in data.get("payments", [])[:5]:
-                    lines.append(
-                        f"• {p.get('month')} — ₹{p.get('amount', 0):,.2f} | {p.get('paid_on')} | {p.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── EPF ───────────────────────────────────────────────────
-            elif tool_name == "fetch_epf_dues":
-                response_parts.append(
-                    f"**EPF Dues — {data.get('establishment_id', '')} ({data.get('month', '')})**\n"
-                    f"• Employees            : {data.get('employee_count', 0)}\n"
-                    f"• Employer Contribution: ₹{data.get('employer_contribution', 0):,.2f}\n"
-                    f"• Employee Contribution: ₹{data.get('employee_contribution', 0):,.2f}\n"
-                    f"• Admin Charges        : ₹{data.get('admin_charges', 0):,.2f}\n"
-                    f"• Total Due            : ₹{data.get('total_due', 0):,.2f}\n"
-                    f"• Due Date             : {data.get('due_date', '')}"
-                )
-
-            elif tool_name == "pay_epf":
-                response_parts.append(
-                    f"**EPF Payment Successful ✅**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• Establishment  : {data.get('establishment_id', '')}\n"
-                    f"• Month          : {data.get('month', '')}\n"
-                    f"• Amount         : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• TRRN           : {data.get('trrn', '')}"
-                )
-
-            elif tool_name == "get_epf_payment_history":
-                lines = [f"**EPF Payment History ({data.get('total', 0)} records)**"]
-                for p in data.get("payments", [])[:5]:
-                    lines.append(
-                        f"• {p.get('month')} — ₹{p.get('amount', 0):,.2f} | TRRN: {p.get('trrn')} | {p.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── PAYROLL ───────────────────────────────────────────────
-            elif tool_name == "fetch_payroll_summary":
-                response_parts.append(
-                    f"**Payroll Summary — {data.get('month', '')}**\n"
-                    f"• Total Employees : {data.get('total_employees', 0)}\n"
-                    f"• Gross           : ₹{data.get('total_gross', 0):,.2f}\n"
-                    f"• Deductions      : ₹{data.get('total_deductions', 0):,.2f}\n"
-                    f"• Net Payable     : ₹{data.get('total_net', 0):,.2f}\n"
-                    f"• Status          : {data.get('status', '')}"
-                )
-
-            elif tool_name == "process_payroll":
-                response_parts.append(
-                    f"**Payroll Processing Started ✅**\n"
-                    f"• Batch ID        : {data.get('batch_id', '')}\n"
-                    f"• Month           : {data.get('month', '')}\n"
-                    f"• Total Employees : {data.get('total_employees', 0)}\n"
-                    f"• Total Amount    : ₹{data.get('total_amount', 0):,.2f}\n"
-                    f"• Status          : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_payroll_history":
-                lines = [f"**Payroll History ({data.get('total', 0)} records)**"]
-                for p in data.get("payrolls", [])[:5]:
-                    lines.append(
-                        f"• {p.get('month')} — ₹{p.get('total_amount', 0):,.2f} | {p.get('employees')} employees | {p.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── TAXES ─────────────────────────────────────────────────
-            elif tool_name == "fetch_tax_dues":
-                lines = [f"**Pending Tax Dues — PAN: {data.get('pan', '')}**"]
-                for d in data.get("dues", []):
-                    lines.append(
-                        f"• [{d.get('type')}] {d.get('period', d.get('state', ''))} — "
-                        f"₹{d.get('amount', 0):,.2f} | Due: {d.get('due_date')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "pay_direct_tax":
-                response_parts.append(
-                    f"**Direct Tax Payment Successful ✅**\n"
-                    f"• Transaction ID  : {data.get('transaction_id', '')}\n"
-                    f"• Tax Type        : {data.get('tax_type', '')}\n"
-                    f"• Assessment Year : {data.get('assessment_year', '')}\n"
-                    f"• Amount          : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• CIN             : {data.get('cin', '')}"
-                )
-
-            elif tool_name == "pay_state_tax":
-                response_parts.append(
-                    f"**State Tax Payment Successful ✅**\n"
-                    f"• Transaction ID : {data.get('transaction_id', '')}\n"
-                    f"• State          : {data.get('state', '')}\n"
-                    f"• Category       : {data.get('tax_category', '')}\n"
-                    f"• Amount         : ₹{data.get('amount', 0):,.2f}"
-                )
-
-            elif tool_name == "pay_bulk_tax":
-                response_parts.append(
-                    f"**Bulk Tax Payment Queued ✅**\n"
-                    f"• Batch ID      : {data.get('batch_id', '')}\n"
-                    f"• Tax Type      : {data.get('tax_type', '')}\n"
-                    f"• Total Records : {data.get('total_records', 0)}\n"
-                    f"• Total Amount  : ₹{data.get('total_amount', 0):,.2f}\n"
-                    f"• Status        : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_tax_payment_history":
-                lines = [f"**Tax Payment History — PAN: {data.get('pan', '')} ({data.get('total', 0)} records)**"]
-                for p in data.get("payments", [])[:5]:
-                    lines.append(
-                        f"• [{p.get('type')}] ₹{p.get('amount', 0):,.2f} | CIN: {p.get('cin')} | {p.get('paid_on')} | {p.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── ACCOUNT MANAGEMENT ────────────────────────────────────
-            elif tool_name == "get_account_summary":
-                lines = [f"**Linked Accounts ({len(data.get('accounts', []))}):**"]
-                for acc in data.get("accounts", []):
-                    lines.append(
-                        f"• {acc.get('account_number')} | {acc.get('type')} | "
-                        f"₹{acc.get('balance', 0):,.2f} | {acc.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_account_details":
-                response_parts.append(
-                    f"**Account Details**\n"
-                    f"• Account : {data.get('account_number', '')}\n"
-                    f"• Type    : {data.get('type', '')}\n"
-                    f"• Bank    : {data.get('bank', '')}\n"
-                    f"• Branch  : {data.get('branch', '')}\n"
-                    f"• IFSC    : {data.get('ifsc', '')}\n"
-                    f"• Holder  : {data.get('holder_name', '')}\n"
-                    f"• Status  : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_linked_accounts":
-                lines = [f"**Linked Accounts ({data.get('total', 0)}):**"]
-                for acc in data.get("accounts", []):
-                    lines.append(f"• {acc.get('account_number')} | {acc.get('bank')} | {acc.get('type')}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "set_default_account":
-                response_parts.append(
-                    f"**Default Account Updated ✅**\n"
-                    f"• Account : {data.get('account_number', '')}\n"
-                    f"• Default : {data.get('is_default', False)}"
-                )
-
-            # ── TRANSACTION & HISTORY ─────────────────────────────────
-            elif tool_name == "search_transactions":
-                response_parts.append(f"**Transactions Found: {data.get('total', 0)}**")
-
-            elif tool_name == "get_transaction_details":
-                response_parts.append(
-                    f"**Transaction Details**\n"
-                    f"• TXN ID      : {data.get('transaction_id', '')}\n"
-                    f"• Amount      : ₹{data.get('amount', 0):,.2f}\n"
-                    f"• Type        : {data.get('txn_type', '')}\n"
-                    f"• Mode        : {data.get('mode', '')}\n"
-                    f"• Beneficiary : {data.get('beneficiary', '')}\n"
-                    f"• UTR         : {data.get('utr', '')}\n"
-                    f"• Status      : {data.get('status', '')}"
-                )
-
-            elif tool_name == "download_transaction_report":
-                response_parts.append(
-                    f"**Transaction Report Ready**\n"
-                    f"• Format : {data.get('format', '')}\n"
-                    f"• [Download Report]({data.get('download_url', '')})"
-                )
-
-            elif tool_name == "get_pending_transactions":
-                lines = [f"**Pending Transactions: {data.get('total', 0)}**"]
-                for txn in data.get("transactions", [])[:5]:
-                    lines.append(
-                        f"• {txn.get('transaction_id')} — ₹{txn.get('amount', 0):,.2f} | {txn.get('mode')} | {txn.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── DUES & REMINDERS ──────────────────────────────────────
-            elif tool_name == "get_upcoming_dues":
-                lines = [f"**Upcoming Dues (Next {data.get('days_ahead', 30)} days):**"]
-                for d in data.get("dues", []):
-                    lines.append(
-                        f"• [{d.get('type')}] ₹{d.get('amount', 0):,.2f} | Due: {d.get('due_date')} | {d.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_overdue_payments":
-                lines = [f"**Overdue Payments ({data.get('total', 0)}):**"]
-                for o in data.get("overdue", []):
-                    lines.append(
-                        f"• [{o.get('type')}] ₹{o.get('amount', 0):,.2f} | "
-                        f"Due: {o.get('due_date')} | {o.get('days_overdue')} days overdue ⚠️"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "set_payment_reminder":
-                response_parts.append(
-                    f"**Reminder Set ✅**\n"
-                    f"• Reminder ID   : {data.get('reminder_id', '')}\n"
-                    f"• Title         : {data.get('title', '')}\n"
-                    f"• Due Date      : {data.get('due_date', '')}\n"
-                    f"• Notify Before : {data.get('notify_days_before', 3)} days"
-                )
-
-            elif tool_name == "get_reminder_list":
-                lines = [f"**Active Reminders ({data.get('total', 0)}):**"]
-                for r in data.get("reminders", []):
-                    lines.append(f"• [{r.get('reminder_id')}] {r.get('title')} | Due: {r.get('due_date')}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "delete_reminder":
-                response_parts.append(
-                    f"**Reminder Deleted ✅**\n"
-                    f"• Reminder ID : {data.get('reminder_id', '')}"
-                )
-
-            # ── DASHBOARD & ANALYTICS ─────────────────────────────────
-            elif tool_name == "get_dashboard_summary":
-                response_parts.append(
-                    f"**Dashboard Summary**\n"
-                    f"• Total Balance    : ₹{data.get('total_balance', 0):,.2f}\n"
-                    f"• Pending Dues     : ₹{data.get('pending_dues', 0):,.2f}\n"
-                    f"• Overdue Amount   : ₹{data.get('overdue_amount', 0):,.2f}\n"
-                    f"• Payments (Month) : ₹{data.get('payments_this_month', 0):,.2f}\n"
-                    f"• Upcoming Dues    : {data.get('upcoming_dues_count', 0)}\n"
-                    f"• Account Health   : {data.get('account_health', '')}"
-                )
-
-            elif tool_name == "get_spending_analytics":
-                lines = ["**Spending Analytics:**"]
-                for cat in data.get("categories", []):
-                    lines.append(
-                        f"• {cat.get('category')}: ₹{cat.get('amount', 0):,.2f} ({cat.get('percentage')}%)"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_cashflow_summary":
-                response_parts.append(
-                    f"**Cash Flow Summary — {data.get('month', '')}**\n"
-                    f"• Total Inflow  : ₹{data.get('total_inflow', 0):,.2f}\n"
-                    f"• Total Outflow : ₹{data.get('total_outflow', 0):,.2f}\n"
-                    f"• Net Cash Flow : ₹{data.get('net_cashflow', 0):,.2f}"
-                )
-
-            elif tool_name == "get_monthly_report":
-                response_parts.append(
-                    f"**Monthly Report — {data.get('month', '')}**\n"
-                    f"• Total Payments  : {data.get('total_payments', 0)}\n"
-                    f"• Total Amount    : ₹{data.get('total_amount', 0):,.2f}\n"
-                    f"• Compliance Paid : ₹{data.get('compliance_paid', 0):,.2f}\n"
-                    f"• [Download Report]({data.get('download_url', '')})"
-                )
-
-            elif tool_name == "get_vendor_payment_summary":
-                lines = ["**Vendor Payment Summary:**"]
-                for v in data.get("vendors", []):
-                    lines.append(
-                        f"• {v.get('name')}: ₹{v.get('total_paid', 0):,.2f} ({v.get('payment_count')} payments)"
-                    )
-                response_parts.append("\n".join(lines))
-
-            # ── COMPANY MANAGEMENT ────────────────────────────────────
-            elif tool_name == "get_company_profile":
-                response_parts.append(
-                    f"**Company Profile**\n"
-                    f"• Name       : {data.get('company_name', '')}\n"
-                    f"• PAN        : {data.get('pan', '')}\n"
-                    f"• GSTIN      : {data.get('gstin', '')}\n"
-                    f"• CIN        : {data.get('cin', '')}\n"
-                    f"• KYC Status : {data.get('kyc_status', '')}"
-                )
-
-            elif tool_name == "update_company_details":
-                response_parts.append(
-                    f"**Company Details Updated ✅**\n"
-                    f"• Field   : {data.get('field', '')}\n"
-                    f"• Value   : {data.get('value', '')}\n"
-                    f"• Updated : {data.get('updated', False)}"
-                )
-
-            elif tool_name == "get_gst_profile":
-                lines = [f"**Linked GST Numbers ({len(data.get('gst_numbers', []))}):**"]
-                for g in data.get("gst_numbers", []):
-                    lines.append(f"• {g.get('gstin')} | {g.get('state')} | {g.get('status')}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_authorized_signatories":
-                lines = [f"**Authorized Signatories ({len(data.get('signatories', []))}):**"]
-                for s in data.get("signatories", []):
-                    lines.append(
-                        f"• {s.get('name')} | {s.get('role')} | PAN: {s.get('pan')} | {s.get('status')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "manage_user_roles":
-                response_parts.append(
-                    f"**User Role Updated ✅**\n"
-                    f"• User ID : {data.get('user_id', '')}\n"
-                    f"• Role    : {data.get('role', '')}\n"
-                    f"• Action  : {data.get('action', '')}"
-                )
-
-            # ── SUPPORT ───────────────────────────────────────────────
-            elif tool_name == "raise_support_ticket":
-                response_parts.append(
-                    f"**Support Ticket Raised ✅**\n"
-                    f"• Ticket ID : {data.get('ticket_id', '')}\n"
-                    f"• Category  : {data.get('category', '')}\n"
-                    f"• Subject   : {data.get('subject', '')}\n"
-                    f"• Priority  : {data.get('priority', '')}\n"
-                    f"• Status    : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_ticket_history":
-                lines = [f"**Support Tickets ({data.get('total', 0)}):**"]
-                for t in data.get("tickets", [])[:5]:
-                    lines.append(
-                        f"• [{t.get('ticket_id')}] {t.get('subject')} | {t.get('status')} | {t.get('created_at')}"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "chat_with_support":
-                response_parts.append(
-                    f"**Live Support Connected ✅**\n"
-                    f"• Session ID : {data.get('session_id', '')}\n"
-                    f"• Agent      : {data.get('agent', '')}\n"
-                    f"• Wait Time  : {data.get('wait_time_minutes', 0)} mins\n"
-                    f"• Status     : {data.get('status', '')}"
-                )
-
-            elif tool_name == "get_contact_details":
-                response_parts.append(
-                    f"**Support Contacts — {data.get('category', '')}**\n"
-                    f"• Phone          : {data.get('phone', '')}\n"
-                    f"• Email          : {data.get('email', '')}\n"
-                    f"• Hours          : {data.get('hours', '')}\n"
-                    f"• Chat Available : {data.get('chat_available', False)}"
-                )
-
-            # ── GST CALCULATOR (gst_client_manager / server.py) ───────
-            # FIX 1+2: These were (a) placed after `else` as a new if/elif
-            # block — making them unreachable — and (b) get_bank_onboarding_guide
-            # had `response_parts.ap\npend(...)` split across two lines.
-            # Both fixed by merging into the main elif chain here.
-            elif tool_name == "calculate_gst":
-                response_parts.append(
-                    f"**GST Calculation @ {data.get('gst_rate', 0)}%**\n"
-                    f"• Base Amount  : ₹{data.get('base_amount', 0):,.2f}\n"
-                    f"• GST Amount   : ₹{data.get('gst_amount', 0):,.2f}\n"
-                    f"• Total Amount : ₹{data.get('total_amount', 0):,.2f}"
-                )
-
-            elif tool_name == "reverse_calculate_gst":
-                response_parts.append(
-                    f"**Reverse GST Calculation @ {data.get('gst_rate', 0)}%**\n"
-                    f"• Total Amount            : ₹{data.get('total_amount', 0):,.2f}\n"
-                    f"• Base Amount (excl. GST) : ₹{data.get('base_amount', 0):,.2f}\n"
-                    f"• GST Amount              : ₹{data.get('gst_amount', 0):,.2f}"
-                )
-
-            elif tool_name == "gst_breakdown":
-                breakdown = data.get("breakdown", {})
-                response_parts.append(
-                    f"**GST Breakdown ({breakdown.get('type', '')})**\n"
-                    f"• Base Amount : ₹{data.get('base_amount', 0):,.2f}\n"
-                    f"• CGST        : ₹{breakdown.get('cgst', 0):,.2f}\n"
-                    f"• SGST        : ₹{breakdown.get('sgst', 0):,.2f}\n"
-                    f"• IGST        : ₹{breakdown.get('igst', 0):,.2f}"
-                )
-
-            elif tool_name == "compare_gst_rates":
-                lines = [f"**GST Rate Comparison for ₹{data.get('base_amount', 0):,.2f}:**"]
-                for comp in data.get("comparisons", []):
-                    lines.append(
-                        f"• {comp.get('rate')}% → Total: ₹{comp.get('total_amount', 0):,.2f}"
-                        f"  (+₹{comp.get('difference_from_lowest', 0):,.2f} vs lowest)"
-                    )
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "validate_gstin":
-                valid      = data.get("valid", False)
-                symbol     = "✅ Valid" if valid else "❌ Invalid"
-                components = data.get("components", {})
-                if valid:
-                    response_parts.append(
-                        f"**GSTIN Validation: {symbol}**\n"
-                        f"• GSTIN      : {data.get('gstin', '')}\n"
-                        f"• State Code : {components.get('state_code', '')}\n"
-                        f"• PAN        : {components.get('pan_number', '')}"
-                    )
-                else:
-                    response_parts.append(
-                        f"**GSTIN Validation: {symbol}**\n"
-                        f"• GSTIN  : {data.get('gstin', '')}\n"
-                        f"• Reason : {data.get('error', 'Invalid format')}"
-                    )
-
-            # ── ONBOARDING INFO (info_client_manager / info_server.py) ─
-            elif tool_name == "get_company_onboarding_guide":
-                lines = [f"**{data.get('title', 'Company Onboarding Guide')}**"]
-                for step in data.get("steps", []):
-                    lines.append(f"\n**Step {step.get('step_number')}: {step.get('title', '')}**")
-                    for action in step.get("actions", []):
-                        lines.append(f"  • {action}")
-                    for field in step.get("required_fields", [])[:5]:
-                        lines.append(f"    - {field.get('field', '')}")
-                if data.get("completion_message"):
-                    lines.append(f"\n{data['completion_message']}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_company_required_documents":
-                lines = [f"**{data.get('title', 'Required Documents')}**"]
-                for doc in data.get("documents", []):
-                    lines.append(f"• {doc.get('name', '')} — {doc.get('description', '')}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_validation_formats":
-                lines = ["**Validation Formats:**"]
-                for doc_type, doc_data in list(data.get("formats", {}).items())[:8]:
-                    lines.append(f"• {doc_type}: `{doc_data.get('pattern', '')}`")
-                    if doc_data.get("example"):
-                        lines.append(f"  Example: {doc_data['example']}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_onboarding_faq":
-                lines = [f"**{data.get('title', 'Onboarding FAQ')}**"]
-                for faq in data.get("faqs", [])[:5]:
-                    lines.append(f"**Q: {faq.get('question', '')}**")
-                    lines.append(f"A: {faq.get('answer', '')}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_bank_onboarding_guide":
-                # FIX 1: was `response_parts.ap\n                pend(...)` — broken across two lines
-                lines = [f"**{data.get('title', 'Bank Onboarding Guide')}**"]
-                for step in data.get("steps", []):
-                    lines.append(f"\n**Step {step.get('step_number')}: {step.get('title', '')}**")
-                    for action in step.get("actions", []):
-                        lines.append(f"  • {action}")
-                if data.get("completion_message"):
-                    lines.append(f"\n{data['completion_message']}")
-                response_parts.append("\n".join(lines))
-
-            elif tool_name == "get_vendor_onboarding_guide":
-                lines = [f"**{data.get('title', 'Vendor Onboarding Guide')}**"]
-                for step in data.get("steps", []):
-                    lines.append(f"\n**Step {step.get('step_number')}: {step.get('title', '')}**")
-                    for action in step.get("actions", []):
-                        lines.append(f"  • {action}")
-                if data.get("completion_message"):
-                    lines.append(f"\n{data['completion_message']}")
-                response_parts.append("\n".join(lines))
-
-            else:
-                response_parts.append(f"✓ {tool_name} executed successfully.")
+            formatter = _FORMATTERS.get(tool_name)
+            response_parts.append(
+                formatter(data) if formatter else f"✓ {tool_name} executed successfully."
+            )
 
         return "\n\n".join(response_parts)
 
 
-# Global service instance
-claude_service = LocalMLService()
\ No newline at end of file
+# ═════════════════════════════════════════════════════════════
+# RESPONSE FORMATTERS — per tool, looked up via _FORMATTERS
+# ═════════════════════════════════════════════════════════════
+
+def _rupee(amount: float, _fmt="₹{:,.2f}".format) -> str:
+    """₹ with thousands separators and 2 decimals — e.g. ₹11,800.00."""
+    return _fmt(amount)
+
+
+# ── CORE PAYMENT ──────────────────────────────────────────
+def _fmt_validate_beneficiary(data: Dict[str, Any]) -> str:
+    valid  = data.get("valid", False)
+    symbol = "✅" if valid else "❌"
+    return (
+        f"**Beneficiary Validation {symbol}**\n"
+        f"• Account Holder : {data.get('account_holder_name', '')}\n"
+        f"• Bank           : {data.get('bank', '')}\n"
+        f"• Valid          : {valid}"
+    )
+
+
+# ── UPLOAD PAYMENT ────────────────────────────────────────
+def _fmt_validate_payment_file(data: Dict[str, Any]) -> str:
+    return (
+        f"**File Validation: {data.get('validation_status', '')}**\n"
+        f"• Errors   : {len(data.get('errors', []))}\n"
+        f"• Warnings : {len(data.get('warnings', []))}"
+    )
+
+
+# ── B2B ───────────────────────────────────────────────────
+def _fmt_get_received_invoices(data: Dict[str, Any]) -> str:
+    lines = [f"**Received Invoices ({data.get('total', 0)} total):**"]
+    for inv in data.get("invoices", [])[:5]:
+        lines.append(
+            f"• [{inv.get('invoice_id')}] {inv.get('partner')} — "
+            f"{_rupee(inv.get('amount', 0))} | Due: {inv.get('due_date')} | {inv.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── INSURANCE ─────────────────────────────────────────────
+def _fmt_fetch_insurance_dues(data: Dict[str, Any]) -> str:
+    lines = [f"**Upcoming Insurance Dues ({len(data.get('dues', []))} policies):**"]
+    for d in data.get("dues", []):
+        lines.append(
+            f"• [{d.get('policy_number')}] {d.get('insurer')} — "
+            f"{_rupee(d.get('premium', 0))} | Due: {d.get('due_date')} | {d.get('type')}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_get_insurance_payment_history(data: Dict[str, Any]) -> str:
+    lines = [f"**Insurance Payment History ({data.get('total', 0)} records)**"]
+    for p in data.get("payments", [])[:5]:
+        lines.append(
+            f"• {p.get('policy_number')} — {_rupee(p.get('amount', 0))} | {p.get('paid_on')} | {p.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── BANK STATEMENT ────────────────────────────────────────
+def _fmt_fetch_bank_statement(data: Dict[str, Any]) -> str:
+    return (
+        f"**Bank Statement**\n"
+        f"• Account       : {data.get('account_number', '')}\n"
+        f"• Period        : {data.get('from_date', '')} → {data.get('to_date', '')}\n"
+        f"• Opening Bal   : {_rupee(data.get('opening_balance', 0))}\n"
+        f"• Closing Bal   : {_rupee(data.get('closing_balance', 0))}\n"
+        f"• Total Credits : {_rupee(data.get('total_credits', 0))}\n"
+        f"• Total Debits  : {_rupee(data.get('total_debits', 0))}"
+    )
+
+
+def _fmt_get_transaction_history(data: Dict[str, Any]) -> str:
+    txns  = data.get("transactions", [])
+    lines = [
+        f"**Transaction History — {data.get('from_date', '')} → {data.get('to_date', '')}**\n"
+        f"• Account  : {data.get('account_number', '') or 'Default'}\n"
+        f"• Showing  : {data.get('returned', len(txns))} of {data.get('total', 0)} transactions"
+    ]
+    for t in txns:
+        symbol = "⬆️" if t.get("type") == "CREDIT" else "⬇️"
+        lines.append(
+            f"{symbol} {t.get('date')} | {t.get('description', '')[:45]}\n"
+            f"   {_rupee(t.get('amount', 0))} {t.get('type')} | {t.get('mode')} | Bal: {_rupee(t.get('balance', 0))}"
+        )
+    return "\n".join(lines)
+
+
+# ── CUSTOM / SEZ ──────────────────────────────────────────
+def _fmt_get_custom_duty_history(data: Dict[str, Any]) -> str:
+    lines = [f"**Custom Duty History ({data.get('total', 0)} records)**"]
+    for p in data.get("payments", [])[:5]:
+        lines.append(
+            f"• TXN: {p.get('transaction_id')} — {_rupee(p.get('amount', 0))} | {p.get('paid_on')} | {p.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── GST (bank server — pay/fetch/history/challan) ─────────
+def _fmt_fetch_gst_dues(data: Dict[str, Any]) -> str:
+    lines = [f"**GST Dues for {data.get('gstin', '')}:**"]
+    for d in data.get("dues", []):
+        lines.append(
+            f"• [{d.get('return_type')}] {d.get('period')} — "
+            f"{_rupee(d.get('amount', 0))} | Due: {d.get('due_date')} | {d.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_get_gst_payment_history(data: Dict[str, Any]) -> str:
+    lines = [f"**GST Payment History — {data.get('gstin', '')} ({data.get('total', 0)} records)**"]
+    for p in data.get("payments", [])[:5]:
+        lines.append(
+            f"• CPIN: {p.get('cpin')} — {_rupee(p.get('amount', 0))} | {p.get('paid_on')} | {p.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── ESIC ──────────────────────────────────────────────────
+def _fmt_fetch_esic_dues(data: Dict[str, Any]) -> str:
+    return (
+        f"**ESIC Dues — {data.get('establishment_code', '')} ({data.get('month', '')})**\n"
+        f"• Employees            : {data.get('employee_count', 0)}\n"
+        f"• Employer Contribution: {_rupee(data.get('employer_contribution', 0))}\n"
+        f"• Employee Contribution: {_rupee(data.get('employee_contribution', 0))}\n"
+        f"• Total Due            : {_rupee(data.get('total_due', 0))}\n"
+        f"• Due Date             : {data.get('due_date', '')}"
+    )
+
+
+def _fmt_get_esic_payment_history(data: Dict[str, Any]) -> str:
+    lines = [f"**ESIC Payment History ({data.get('total', 0)} records)**"]
+    for p in data.get("payments", [])[:5]:
+        lines.append(
+            f"• {p.get('month')} — {_rupee(p.get('amount', 0))} | {p.get('paid_on')} | {p.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── EPF ───────────────────────────────────────────────────
+def _fmt_fetch_epf_dues(data: Dict[str, Any]) -> str:
+    return (
+        f"**EPF Dues — {data.get('establishment_id', '')} ({data.get('month', '')})**\n"
+        f"• Employees            : {data.get('employee_count', 0)}\n"
+        f"• Employer Contribution: {_rupee(data.get('employer_contribution', 0))}\n"
+        f"• Employee Contribution: {_rupee(data.get('employee_contribution', 0))}\n"
+        f"• Admin Charges        : {_rupee(data.get('admin_charges', 0))}\n"
+        f"• Total Due            : {_rupee(data.get('total_due', 0))}\n"
+        f"• Due Date             : {data.get('due_date', '')}"
+    )
+
+
+def _fmt_get_epf_payment_history(data: Dict[str, Any]) -> str:
+    lines = [f"**EPF Payment History ({data.get('total', 0)} records)**"]
+    for p in data.get("payments", [])[:5]:
+        lines.append(
+            f"• {p.get('month')} — {_rupee(p.get('amount', 0))} | TRRN: {p.get('trrn')} | {p.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── PAYROLL ───────────────────────────────────────────────
+def _fmt_get_payroll_history(data: Dict[str, Any]) -> str:
+    lines = [f"**Payroll History ({data.get('total', 0)} records)**"]
+    for p in data.get("payrolls", [])[:5]:
+        lines.append(
+            f"• {p.get('month')} — {_rupee(p.get('total_amount', 0))} | {p.get('employees')} employees | {p.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── TAXES ─────────────────────────────────────────────────
+def _fmt_fetch_tax_dues(data: Dict[str, Any]) -> str:
+    lines = [f"**Pending Tax Dues — PAN: {data.get('pan', '')}**"]
+    for d in data.get("dues", []):
+        lines.append(
+            f"• [{d.get('type')}] {d.get('period', d.get('state', ''))} — "
+            f"{_rupee(d.get('amount', 0))} | Due: {d.get('due_date')}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_get_tax_payment_history(data: Dict[str, Any]) -> str:
+    lines = [f"**Tax Payment History — PAN: {data.get('pan', '')} ({data.get('total', 0)} records)**"]
+    for p in data.get("payments", [])[:5]:
+        lines.append(
+            f"• [{p.get('type')}] {_rupee(p.get('amount', 0))} | CIN: {p.get('cin')} | {p.get('paid_on')} | {p.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── ACCOUNT MANAGEMENT ────────────────────────────────────
+def _fmt_get_account_summary(data: Dict[str, Any]) -> str:
+    lines = [f"**Linked Accounts ({len(data.get('accounts', []))}):**"]
+    for acc in data.get("accounts", []):
+        lines.append(
+            f"• {acc.get('account_number')} | {acc.get('type')} | "
+            f"{_rupee(acc.get('balance', 0))} | {acc.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_get_linked_accounts(data: Dict[str, Any]) -> str:
+    lines = [f"**Linked Accounts ({data.get('total', 0)}):**"]
+    for acc in data.get("accounts", []):
+        lines.append(f"• {acc.get('account_number')} | {acc.get('bank')} | {acc.get('type')}")
+    return "\n".join(lines)
+
+
+# ── TRANSACTION & HISTORY ─────────────────────────────────
+def _fmt_search_transactions(data: Dict[str, Any]) -> str:
+    return f"**Transactions Found: {data.get('total', 0)}**"
+
+
+def _fmt_get_pending_transactions(data: Dict[str, Any]) -> str:
+    lines = [f"**Pending Transactions: {data.get('total', 0)}**"]
+    for txn in data.get("transactions", [])[:5]:
+        lines.append(
+            f"• {txn.get('transaction_id')} — {_rupee(txn.get('amount', 0))} | {txn.get('mode')} | {txn.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── DUES & REMINDERS ──────────────────────────────────────
+def _fmt_get_upcoming_dues(data: Dict[str, Any]) -> str:
+    lines = [f"**Upcoming Dues (Next {data.get('days_ahead', 30)} days):**"]
+    for d in data.get("dues", []):
+        lines.append(
+            f"• [{d.get('type')}] {_rupee(d.get('amount', 0))} | Due: {d.get('due_date')} | {d.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_get_overdue_payments(data: Dict[str, Any]) -> str:
+    lines = [f"**Overdue Payments ({data.get('total', 0)}):**"]
+    for o in data.get("overdue", []):
+        lines.append(
+            f"• [{o.get('type')}] {_rupee(o.get('amount', 0))} | "
+            f"Due: {o.get('due_date')} | {o.get('days_overdue')} days overdue ⚠️"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_set_payment_reminder(data: Dict[str, Any]) -> str:
+    return (
+        f"**Reminder Set ✅**\n"
+        f"• Reminder ID   : {data.get('reminder_id', '')}\n"
+        f"• Title         : {data.get('title', '')}\n"
+        f"• Due Date      : {data.get('due_date', '')}\n"
+        f"• Notify Before : {data.get('notify_days_before', 3)} days"
+    )
+
+
+def _fmt_get_reminder_list(data: Dict[str, Any]) -> str:
+    lines = [f"**Active Reminders ({data.get('total', 0)}):**"]
+    for r in data.get("reminders", []):
+        lines.append(f"• [{r.get('reminder_id')}] {r.get('title')} | Due: {r.get('due_date')}")
+    return "\n".join(lines)
+
+
+# ── DASHBOARD & ANALYTICS ─────────────────────────────────
+def _fmt_get_spending_analytics(data: Dict[str, Any]) -> str:
+    lines = ["**Spending Analytics:**"]
+    for cat in data.get("categories", []):
+        lines.append(
+            f"• {cat.get('category')}: {_rupee(cat.get('amount', 0))} ({cat.get('percentage')}%)"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_get_vendor_payment_summary(data: Dict[str, Any]) -> str:
+    lines = ["**Vendor Payment Summary:**"]
+    for v in data.get("vendors", []):
+        lines.append(
+            f"• {v.get('name')}: {_rupee(v.get('total_paid', 0))} ({v.get('payment_count')} payments)"
+        )
+    return "\n".join(lines)
+
+
+# ── COMPANY MANAGEMENT ────────────────────────────────────
+def _fmt_get_gst_profile(data: Dict[str, Any]) -> str:
+    lines = [f"**Linked GST Numbers ({len(data.get('gst_numbers', []))}):**"]
+    for g in data.get("gst_numbers", []):
+        lines.append(f"• {g.get('gstin')} | {g.get('state')} | {g.get('status')}")
+    return "\n".join(lines)
+
+
+def _fmt_get_authorized_signatories(data: Dict[str, Any]) -> str:
+    lines = [f"**Authorized Signatories ({len(data.get('signatories', []))}):**"]
+    for s in data.get("signatories", []):
+        lines.append(
+            f"• {s.get('name')} | {s.get('role')} | PAN: {s.get('pan')} | {s.get('status')}"
+        )
+    return "\n".join(lines)
+
+
+# ── SUPPORT ───────────────────────────────────────────────
+def _fmt_get_ticket_history(data: Dict[str, Any]) -> str:
+    lines = [f"**Support Tickets ({data.get('total', 0)}):**"]
+    for t in data.get("tickets", [])[:5]:
+        lines.append(
+            f"• [{t.get('ticket_id')}] {t.get('subject')} | {t.get('status')} | {t.get('created_at')}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_chat_with_support(data: Dict[str, Any]) -> str:
+    return (
+        f"**Live Support Connected ✅**\n"
+        f"• Session ID : {data.get('session_id', '')}\n"
+        f"• Agent      : {data.get('agent', '')}\n"
+        f"• Wait Time  : {data.get('wait_time_minutes', 0)} mins\n"
+        f"• Status     : {data.get('status', '')}"
+    )
+
+
+# ── GST CALCULATOR (gst_client_manager / server.py) ───────
+def _fmt_gst_breakdown(data: Dict[str, Any]) -> str:
+    breakdown = data.get("breakdown", {})
+    return (
+        f"**GST Breakdown ({breakdown.get('type', '')})**\n"
+        f"• Base Amount : {_rupee(data.get('base_amount', 0))}\n"
+        f"• CGST        : {_rupee(breakdown.get('cgst', 0))}\n"
+        f"• SGST        : {_rupee(breakdown.get('sgst', 0))}\n"
+        f"• IGST        : {_rupee(breakdown.get('igst', 0))}"
+    )
+
+
+def _fmt_compare_gst_rates(data: Dict[str, Any]) -> str:
+    lines = [f"**GST Rate Comparison for {_rupee(data.get('base_amount', 0))}:**"]
+    for comp in data.get("comparisons", []):
+        lines.append(
+            f"• {comp.get('rate')}% → Total: {_rupee(comp.get('total_amount', 0))}"
+            f"  (+{_rupee(comp.get('difference_from_lowest', 0))} vs lowest)"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_validate_gstin(data: Dict[str, Any]) -> str:
+    valid      = data.get("valid", False)
+    symbol     = "✅ Valid" if valid else "❌ Invalid"
+    components = data.get("components", {})
+    if valid:
+        return (
+            f"**GSTIN Validation: {symbol}**\n"
+            f"• GSTIN      : {data.get('gstin', '')}\n"
+            f"• State Code : {components.get('state_code', '')}\n"
+            f"• PAN        : {components.get('pan_number', '')}"
+        )
+    else:
+        return (
+            f"**GSTIN Validation: {symbol}**\n"
+            f"• GSTIN  : {data.get('gstin', '')}\n"
+            f"• Reason : {data.get('error', 'Invalid format')}"
+        )
+
+
+# ── ONBOARDING INFO (info_client_manager / info_server.py) ─
+def _onboarding_lines(
+    data: Dict[str, Any],
+    default_title: str,
+    include_fields: bool,
+) -> Iterator[str]:
+    yield f"**{data.get('title', default_title)}**"
+    for step in data.get("steps", []):
+        yield f"\n**Step {step.get('step_number')}: {step.get('title', '')}**"
+        yield from (f"  • {action}" for action in step.get("actions", []))
+        if include_fields:
+            yield from (f"    - {field.get('field', '')}" for field in step.get("required_fields", [])[:5])
+    if data.get("completion_message"):
+        yield f"\n{data['completion_message']}"
+
+
+def _fmt_onboarding_guide(
+    data: Dict[str, Any],
+    default_title: str,
+    include_fields: bool = False,
+) -> str:
+    """Shared by the company / bank / vendor onboarding guides."""
+    return "\n".join(_onboarding_lines(data, default_title, include_fields))
+
+
+def _fmt_get_company_required_documents(data: Dict[str, Any]) -> str:
+    lines = [f"**{data.get('title', 'Required Documents')}**"]
+    for doc in data.get("documents", []):
+        lines.append(f"• {doc.get('name', '')} — {doc.get('description', '')}")
+    return "\n".join(lines)
+
+
+def _fmt_get_validation_formats(data: Dict[str, Any]) -> str:
+    lines = ["**Validation Formats:**"]
+    for doc_type, doc_data in list(data.get("formats", {}).items())[:8]:
+        lines.append(f"• {doc_type}: `{doc_data.get('pattern', '')}`")
+        if doc_data.get("example"):
+            lines.append(f"  Example: {doc_data['example']}")
+    return "\n".join(lines)
+
+
+def _fmt_get_onboarding_faq(data: Dict[str, Any]) -> str:
+    lines = [f"**{data.get('title', 'Onboarding FAQ')}**"]
+    for faq in data.get("faqs", [])[:5]:
+        lines.append(f"**Q: {faq.get('question', '')}**")
+        lines.append(f"A: {faq.get('answer', '')}")
+    return "\n".join(lines)
+
+
+# ── TABLE-DRIVEN FORMATTERS ───────────────────────────────
+# Most tools render as a bold title plus one aligned "• Label : value" bullet
+# per field, so they are described here as data instead of code. Field kinds:
+#   "str"      → data.get(key, "")
+#   "num"      → data.get(key, 0)
+#   "bool"     → data.get(key, False)
+#   "currency" → _rupee(data.get(key, 0))
+#   "link"     → "[Label](url)" bullet, not aligned with the others
+# Tools with lists, conditionals or nested fields keep a _fmt_* function above.
+
+_FIELD_DEFAULTS = {"str": "", "num": 0, "bool": False, "currency": 0}
+
+
+def _spec(title: str, *fields: Tuple[str, str, str], **title_defaults: Any) -> Dict[str, Any]:
+    """Build one _TOOL_FORMAT_SPEC entry. ``title`` may contain ``{key}``
+    placeholders, filled from data with the defaults given as keywords."""
+    width = max((len(label) for label, _, kind in fields if kind != "link"), default=0)
+    return {
+        "title":          title,
+        "title_defaults": title_defaults,
+        "fields": tuple(
+            (label if kind == "link" else label.ljust(width), key, kind, _FIELD_DEFAULTS.get(kind))
+            for label, key, kind in fields
+        ),
+    }
+
+
+def _format_from_spec(spec: Dict[str, Any], data: Dict[str, Any]) -> str:
+    title = spec["title"]
+    if spec["title_defaults"]:
+        title = title.format(**{k: data.get(k, d) for k, d in spec["title_defaults"].items()})
+    lines = [f"**{title}**"]
+    for label, key, kind, default in spec["fields"]:
+        if kind == "link":
+            lines.append(f"• [{label}]({data.get(key, '')})")
+        elif kind == "currency":
+            lines.append(f"• {label} : {_rupee(data.get(key, default))}")
+        else:
+            lines.append(f"• {label} : {data.get(key, default)}")
+    return "\n".join(lines)
+
+
+_TOOL_FORMAT_SPEC: Dict[str, Dict[str, Any]] = {
+    # ── CORE PAYMENT ──────────────────────────────────────────
+    "initiate_payment": _spec(
+        "Payment Initiated ✅",
+        ("Transaction ID", "transaction_id", "str"),
+        ("Amount",         "amount",         "currency"),
+        ("Mode",           "payment_mode",   "str"),
+        ("Status",         "status",         "str"),
+    ),
+    "get_payment_status": _spec(
+        "Payment Status",
+        ("Transaction ID", "transaction_id", "str"),
+        ("Status",         "status",         "str"),
+        ("UTR Number",     "utr_number",     "str"),
+    ),
+    "cancel_payment": _spec(
+        "Payment Cancelled ✅",
+        ("Transaction ID", "transaction_id", "str"),
+        ("Reason",         "reason",         "str"),
+    ),
+    "retry_payment": _spec(
+        "Payment Retry Initiated",
+        ("Original TXN", "original_transaction_id", "str"),
+        ("New TXN ID",   "new_transaction_id",      "str"),
+        ("Status",       "status",                  "str"),
+    ),
+    "get_payment_receipt": _spec(
+        "Payment Receipt",
+        ("Transaction ID",   "transaction_id", "str"),
+        ("Format",           "format",         "str"),
+        ("Download Receipt", "download_url",   "link"),
+    ),
+
+    # ── UPLOAD PAYMENT ────────────────────────────────────────
+    "upload_bulk_payment": _spec(
+        "Bulk Payment Upload ✅",
+        ("Upload ID",       "upload_id",       "str"),
+        ("Total Records",   "total_records",   "num"),
+        ("Valid Records",   "valid_records",   "num"),
+        ("Invalid Records", "invalid_records", "num"),
+        ("Total Amount",    "total_amount",    "currency"),
+        ("Status",          "status",          "str"),
+    ),
+
+    # ── B2B ───────────────────────────────────────────────────
+    "onboard_business_partner": _spec(
+        "Partner Onboarded ✅",
+        ("Partner ID", "partner_id",   "str"),
+        ("Company",    "company_name", "str"),
+        ("KYC Status", "kyc_status",   "str"),
+        ("Status",     "status",       "str"),
+    ),
+    "send_invoice": _spec(
+        "Invoice Sent ✅",
+        ("Invoice ID", "invoice_id",   "str"),
+        ("Amount",     "amount",       "currency"),
+        ("Total",      "total_amount", "currency"),
+        ("Status",     "status",       "str"),
+    ),
+    "acknowledge_payment": _spec(
+        "Payment Acknowledged ✅",
+        ("ACK ID",     "acknowledgment_id", "str"),
+        ("Invoice ID", "invoice_id",        "str"),
+        ("Status",     "status",            "str"),
+    ),
+    "create_proforma_invoice": _spec(
+        "Proforma Invoice Created ✅",
+        ("Proforma ID", "proforma_id",   "str"),
+        ("Amount",      "amount",        "currency"),
+        ("Valid Until", "validity_date", "str"),
+    ),
+    "create_cd_note": _spec(
+        "{note_type} Note Created ✅",
+        ("Note ID", "note_id", "str"),
+        ("Amount",  "amount",  "currency"),
+        ("Reason",  "reason",  "str"),
+        note_type="",
+    ),
+    "create_purchase_order": _spec(
+        "Purchase Order Raised ✅",
+        ("PO ID",    "po_id",         "str"),
+        ("Amount",   "amount",        "currency"),
+        ("Delivery", "delivery_date", "str"),
+    ),
+
+    # ── INSURANCE ─────────────────────────────────────────────
+    "pay_insurance_premium": _spec(
+        "Insurance Premium Paid ✅",
+        ("Transaction ID", "transaction_id", "str"),
+        ("Policy",         "policy_number",  "str"),
+        ("Amount",         "amount",         "currency"),
+        ("Status",         "status",         "str"),
+    ),
+
+    # ── BANK STATEMENT ────────────────────────────────────────
+    "download_bank_statement": _spec(
+        "Statement Download Ready",
+        ("Format",             "format",       "str"),
+        ("Download Statement", "download_url", "link"),
+    ),
+    "get_account_balance": _spec(
+        "Account Balance",
+        ("Account",           "account_number",    "str"),
+        ("Available Balance", "available_balance", "currency"),
+        ("Current Balance",   "current_balance",   "currency"),
+    ),
+
+    # ── CUSTOM / SEZ ──────────────────────────────────────────
+    "pay_custom_duty": _spec(
+        "Custom Duty Paid ✅",
+        ("Transaction ID", "transaction_id",       "str"),
+        ("BOE Number",     "bill_of_entry_number", "str"),
+        ("Amount",         "amount",               "currency"),
+        ("Challan",        "challan_number",       "str"),
+        ("Status",         "status",               "str"),
+    ),
+    "track_custom_duty_payment": _spec(
+        "Custom Duty Payment Status",
+        ("Transaction ID", "transaction_id", "str"),
+        ("Status",         "status",         "str"),
+        ("Challan",        "challan_number", "str"),
+    ),
+
+    # ── GST (bank server — pay/fetch/history/challan) ─────────
+    "pay_gst": _spec(
+        "GST Payment Successful ✅",
+        ("Transaction ID",    "transaction_id",    "str"),
+        ("GSTIN",             "gstin",             "str"),
+        ("Amount",            "amount",            "currency"),
+        ("Tax Type",          "tax_type",          "str"),
+        ("Payment Reference", "payment_reference", "str"),
+    ),
+    "create_gst_challan": _spec(
+        "GST Challan (PMT-06) Created ✅",
+        ("CPIN",         "cpin",         "str"),
+        ("GSTIN",        "gstin",        "str"),
+        ("Total Amount", "total_amount", "currency"),
+        ("IGST",         "igst",         "currency"),
+        ("CGST",         "cgst",         "currency"),
+        ("SGST",         "sgst",         "currency"),
+        ("CESS",         "cess",         "currency"),
+        ("Valid Until",  "valid_until",  "str"),
+    ),
+
+    # ── ESIC ──────────────────────────────────────────────────
+    "pay_esic": _spec(
+        "ESIC Payment Successful ✅",
+        ("Transaction ID", "transaction_id",     "str"),
+        ("Establishment",  "establishment_code", "str"),
+        ("Month",          "month",              "str"),
+        ("Amount",         "amount",             "currency"),
+        ("Challan",        "challan_number",     "str"),
+    ),
+
+    # ── EPF ───────────────────────────────────────────────────
+    "pay_epf": _spec(
+        "EPF Payment Successful ✅",
+        ("Transaction ID", "transaction_id",   "str"),
+        ("Establishment",  "establishment_id", "str"),
+        ("Month",          "month",            "str"),
+        ("Amount",         "amount",           "currency"),
+        ("TRRN",           "trrn",             "str"),
+    ),
+
+    # ── PAYROLL ───────────────────────────────────────────────
+    "fetch_payroll_summary": _spec(
+        "Payroll Summary — {month}",
+        ("Total Employees", "total_employees",  "num"),
+        ("Gross",           "total_gross",      "currency"),
+        ("Deductions",      "total_deductions", "currency"),
+        ("Net Payable",     "total_net",        "currency"),
+        ("Status",          "status",           "str"),
+        month="",
+    ),
+    "process_payroll": _spec(
+        "Payroll Processing Started ✅",
+        ("Batch ID",        "batch_id",        "str"),
+        ("Month",           "month",           "str"),
+        ("Total Employees", "total_employees", "num"),
+        ("Total Amount",    "total_amount",    "currency"),
+        ("Status",          "status",          "str"),
+    ),
+
+    # ── TAXES ─────────────────────────────────────────────────
+    "pay_direct_tax": _spec(
+        "Direct Tax Payment Successful ✅",
+        ("Transaction ID",  "transaction_id",  "str"),
+        ("Tax Type",        "tax_type",        "str"),
+        ("Assessment Year", "assessment_year", "str"),
+        ("Amount",          "amount",          "currency"),
+        ("CIN",             "cin",             "str"),
+    ),
+    "pay_state_tax": _spec(
+        "State Tax Payment Successful ✅",
+        ("Transaction ID", "transaction_id", "str"),
+        ("State",          "state",          "str"),
+        ("Category",       "tax_category",   "str"),
+        ("Amount",         "amount",         "currency"),
+    ),
+    "pay_bulk_tax": _spec(
+        "Bulk Tax Payment Queued ✅",
+        ("Batch ID",      "batch_id",      "str"),
+        ("Tax Type",      "tax_type",      "str"),
+        ("Total Records", "total_records", "num"),
+        ("Total Amount",  "total_amount",  "currency"),
+        ("Status",        "status",        "str"),
+    ),
+
+    # ── ACCOUNT MANAGEMENT ────────────────────────────────────
+    "get_account_details": _spec(
+        "Account Details",
+        ("Account", "account_number", "str"),
+        ("Type",    "type",           "str"),
+        ("Bank",    "bank",           "str"),
+        ("Branch",  "branch",         "str"),
+        ("IFSC",    "ifsc",           "str"),
+        ("Holder",  "holder_name",    "str"),
+        ("Status",  "status",         "str"),
+    ),
+    "set_default_account": _spec(
+        "Default Account Updated ✅",
+        ("Account", "account_number", "str"),
+        ("Default", "is_default",     "bool"),
+    ),
+
+    # ── TRANSACTION & HISTORY ─────────────────────────────────
+    "get_transaction_details": _spec(
+        "Transaction Details",
+        ("TXN ID",      "transaction_id", "str"),
+        ("Amount",      "amount",         "currency"),
+        ("Type",        "txn_type",       "str"),
+        ("Mode",        "mode",           "str"),
+        ("Beneficiary", "beneficiary",    "str"),
+        ("UTR",         "utr",            "str"),
+        ("Status",      "status",         "str"),
+    ),
+    "download_transaction_report": _spec(
+        "Transaction Report Ready",
+        ("Format",          "format",       "str"),
+        ("Download Report", "download_url", "link"),
+    ),
+
+    # ── DUES & REMINDERS ──────────────────────────────────────
+    "delete_reminder": _spec(
+        "Reminder Deleted ✅",
+        ("Reminder ID", "reminder_id", "str"),
+    ),
+
+    # ── DASHBOARD & ANALYTICS ─────────────────────────────────
+    "get_dashboard_summary": _spec(
+        "Dashboard Summary",
+        ("Total Balance",    "total_balance",       "currency"),
+        ("Pending Dues",     "pending_dues",        "currency"),
+        ("Overdue Amount",   "overdue_amount",      "currency"),
+        ("Payments (Month)", "payments_this_month", "currency"),
+        ("Upcoming Dues",    "upcoming_dues_count", "num"),
+        ("Account Health",   "account_health",      "str"),
+    ),
+    "get_cashflow_summary": _spec(
+        "Cash Flow Summary — {month}",
+        ("Total Inflow",  "total_inflow",  "currency"),
+        ("Total Outflow", "total_outflow", "currency"),
+        ("Net Cash Flow", "net_cashflow",  "currency"),
+        month="",
+    ),
+    "get_monthly_report": _spec(
+        "Monthly Report — {month}",
+        ("Total Payments",  "total_payments",  "num"),
+        ("Total Amount",    "total_amount",    "currency"),
+        ("Compliance Paid", "compliance_paid", "currency"),
+        ("Download Report", "download_url",    "link"),
+        month="",
+    ),
+
+    # ── COMPANY MANAGEMENT ────────────────────────────────────
+    "get_company_profile": _spec(
+        "Company Profile",
+        ("Name",       "company_name", "str"),
+        ("PAN",        "pan",          "str"),
+        ("GSTIN",      "gstin",        "str"),
+        ("CIN",        "cin",          "str"),
+        ("KYC Status", "kyc_status",   "str"),
+    ),
+    "update_company_details": _spec(
+        "Company Details Updated ✅",
+        ("Field",   "field",   "str"),
+        ("Value",   "value",   "str"),
+        ("Updated", "updated", "bool"),
+    ),
+    "manage_user_roles": _spec(
+        "User Role Updated ✅",
+        ("User ID", "user_id", "str"),
+        ("Role",    "role",    "str"),
+        ("Action",  "action",  "str"),
+    ),
+
+    # ── SUPPORT ───────────────────────────────────────────────
+    "raise_support_ticket": _spec(
+        "Support Ticket Raised ✅",
+        ("Ticket ID", "ticket_id", "str"),
+        ("Category",  "category",  "str"),
+        ("Subject",   "subject",   "str"),
+        ("Priority",  "priority",  "str"),
+        ("Status",    "status",    "str"),
+    ),
+    "get_contact_details": _spec(
+        "Support Contacts — {category}",
+        ("Phone",          "phone",          "str"),
+        ("Email",          "email",          "str"),
+        ("Hours",          "hours",          "str"),
+        ("Chat Available", "chat_available", "bool"),
+        category="",
+    ),
+
+    # ── GST CALCULATOR (gst_client_manager / server.py) ───────
+    "calculate_gst": _spec(
+        "GST Calculation @ {gst_rate}%",
+        ("Base Amount",  "base_amount",  "currency"),
+        ("GST Amount",   "gst_amount",   "currency"),
+        ("Total Amount", "total_amount", "currency"),
+        gst_rate=0,
+    ),
+    "reverse_calculate_gst": _spec(
+        "Reverse GST Calculation @ {gst_rate}%",
+        ("Total Amount",            "total_amount", "currency"),
+        ("Base Amount (excl. GST)", "base_amount",  "currency"),
+        ("GST Amount",              "gst_amount",   "currency"),
+        gst_rate=0,
+    ),
+}
+
+
+# tool name → formatter; tools without an entry get a generic success line
+_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "validate_beneficiary":           _fmt_validate_beneficiary,
+    "validate_payment_file":          _fmt_validate_payment_file,
+    "get_received_invoices":          _fmt_get_received_invoices,
+    "fetch_insurance_dues":           _fmt_fetch_insurance_dues,
+    "get_insurance_payment_history":  _fmt_get_insurance_payment_history,
+    "fetch_bank_statement":           _fmt_fetch_bank_statement,
+    "get_transaction_history":        _fmt_get_transaction_history,
+    "get_custom_duty_history":        _fmt_get_custom_duty_history,
+    "fetch_gst_dues":                 _fmt_fetch_gst_dues,
+    "get_gst_payment_history":        _fmt_get_gst_payment_history,
+    "fetch_esic_dues":                _fmt_fetch_esic_dues,
+    "get_esic_payment_history":       _fmt_get_esic_payment_history,
+    "fetch_epf_dues":                 _fmt_fetch_epf_dues,
+    "get_epf_payment_history":        _fmt_get_epf_payment_history,
+    "get_payroll_history":            _fmt_get_payroll_history,
+    "fetch_tax_dues":                 _fmt_fetch_tax_dues,
+    "get_tax_payment_history":        _fmt_get_tax_payment_history,
+    "get_account_summary":            _fmt_get_account_summary,
+    "get_linked_accounts":            _fmt_get_linked_accounts,
+    "search_transactions":            _fmt_search_transactions,
+    "get_pending_transactions":       _fmt_get_pending_transactions,
+    "get_upcoming_dues":              _fmt_get_upcoming_dues,
+    "get_overdue_payments":           _fmt_get_overdue_payments,
+    "set_payment_reminder":           _fmt_set_payment_reminder,
+    "get_reminder_list":              _fmt_get_reminder_list,
+    "get_spending_analytics":         _fmt_get_spending_analytics,
+    "get_vendor_payment_summary":     _fmt_get_vendor_payment_summary,
+    "get_gst_profile":                _fmt_get_gst_profile,
+    "get_authorized_signatories":     _fmt_get_authorized_signatories,
+    "get_ticket_history":             _fmt_get_ticket_history,
+    "chat_with_support":              _fmt_chat_with_support,
+    "gst_breakdown":                  _fmt_gst_breakdown,
+    "compare_gst_rates":              _fmt_compare_gst_rates,
+    "validate_gstin":                 _fmt_validate_gstin,
+    "get_company_onboarding_guide":   partial(_fmt_onboarding_guide, default_title="Company Onboarding Guide",
+                                              include_fields=True),
+    "get_company_required_documents": _fmt_get_company_required_documents,
+    "get_validation_formats":         _fmt_get_validation_formats,
+    "get_onboarding_faq":             _fmt_get_onboarding_faq,
+    "get_bank_onboarding_guide":      partial(_fmt_onboarding_guide, default_title="Bank Onboarding Guide"),
+    "get_vendor_onboarding_guide":    partial(_fmt_onboarding_guide, default_title="Vendor Onboarding Guide"),
+}
+_FORMATTERS.update(
+    (name, partial(_format_from_spec, spec)) for name, spec in _TOOL_FORMAT_SPEC.items()
+)
+
+
+# Global service instance — created on first use, not at import
+_service: Optional[LocalMLService] = None
+
+
+def get_service() -> LocalMLService:
+    """Return the process-wide LocalMLService, creating it on first call."""
+    global _service
+    if _service is None:
+        _service = LocalMLService()
+    return _service
+
+
+def __getattr__(name: str) -> Any:
+    # Back-compat: `from client.llm_service import claude_service` keeps
+    # working, but only instantiates the service when actually imported.
+    if name == "claude_service":
+        return get_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
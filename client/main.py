@@ -24,11 +24,12 @@ from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation, field_validator
 
 from config.config import settings
-from client.mcp_client import bank_client_manager, gst_client_manager, info_client_manager
+from client.mcp_client import mcp_registry
 from manager import agent_manager          # ← NEW: replaces direct claude_service usage
 
 logging.basicConfig(
@@ -47,6 +48,21 @@ else:
     query_logger   = None
     _query_logging = False
 
+# ── JSON responses ─────────────────────────────────────────────────────
+# Plain-dict endpoints return this directly, so FastAPI skips the
+# jsonable_encoder walk and stdlib json.dumps. /api/chat keeps its
+# response_model — FastAPI already serializes that through pydantic-core.
+try:
+    import orjson
+
+    class FastJSONResponse(Response):
+        media_type = "application/json"
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    FastJSONResponse = JSONResponse
+
 # ── Config ─────────────────────────────────────────────────────────────
 REQUEST_TIMEOUT_SECS = int(os.getenv("REQUEST_TIMEOUT_SECS", "30"))
 
@@ -63,41 +79,31 @@ ALLOWED_ORIGINS: List[str] = (
 # ══════════════════════════════════════════════════════════════════════
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info("=" * 60)
-    logger.info("Starting Bank AI Assistant v3.1.0")
-    logger.info(f"LLM Provider : {settings.llm_provider}")
-    logger.info("=" * 60)
-
-    # ── MCP clients ───────────────────────────────────────────────
-    for name, mgr in (
-        ("Bank MCP Server ", bank_client_manager),
-        ("GST Calculator  ", gst_client_manager),
-        ("Onboarding Info ", info_client_manager),
-    ):
-        try:
-            client = await mgr.get_client()
-            logger.info(f"✓ {name}: {len(client.available_tools)} tools")
-        except Exception as e:
-            logger.error(f"✗ {name}: {e}")
+    # ── MCP clients (started concurrently — startup ≈ slowest server) ─
+    results = await mcp_registry.get_all(return_exceptions=True)
+    servers = []
+    for key, name, client in zip(mcp_registry.keys, mcp_registry.names, results):
+        if isinstance(client, Exception):
+            logger.error("✗ %s: %s", name, client)
+            servers.append(f"{key}=down")
+        else:
+            servers.append(f"{key}={len(client.available_tools)}")
 
     # ── Agent (memory + PostgreSQL) ───────────────────────────────
     await agent_manager.initialize()
 
-    if _query_logging:
-        logger.info("✓ Query logging enabled → logs/queries.jsonl")
-
-    logger.info("=" * 60)
-    logger.info("Bank AI Assistant ready!")
-    logger.info("=" * 60)
+    # One line per cold start — per-server detail is logged by the clients
+    logger.info(
+        "Bank AI Assistant v3.1.0 ready — provider=%s tools=%s query_logging=%s",
+        settings.llm_provider, ",".join(servers), _query_logging,
+    )
 
     yield
 
     # ── Graceful shutdown ─────────────────────────────────────────
     logger.info("Shutting down...")
     await agent_manager.shutdown()
-    await bank_client_manager.close()
-    await gst_client_manager.close()
-    await info_client_manager.close()
+    await mcp_registry.close_all()
     logger.info("Goodbye!")
 
 
@@ -133,6 +139,7 @@ if metrics_router:
 # ══════════════════════════════════════════════════════════════════════
 class ChatRequest(BaseModel):
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={"examples": [
             {"message": "Show my account balance",
              "session_id": "sess-abc-123", "user_id": "user-001"},
@@ -143,11 +150,28 @@ class ChatRequest(BaseModel):
     message:    str           = Field(...,            description="User's natural language banking query")
     session_id: Optional[str] = Field(default=None,  description="Session ID — auto-generated if omitted")
     user_id:    Optional[str] = Field(default=None,  description="Authenticated user ID — 'anonymous' if omitted")
-    # kept for backwards compatibility (ignored when agent_manager is active)
-    conversation_history: Optional[List[Dict[str, str]]] = Field(default=None)
+    # kept for backwards compatibility (ignored when agent_manager is active).
+    # Only the shape is checked (a list of {role, content} dicts); the strings
+    # themselves aren't re-validated, so long histories stay cheap.
+    conversation_history: Optional[SkipValidation[List[Dict[str, str]]]] = Field(default=None)
+
+    @field_validator("conversation_history")
+    @classmethod
+    def _history_shape(cls, history):
+        if history is None:
+            return history
+        if not isinstance(history, list):
+            raise ValueError("conversation_history must be a list of {role, content} messages")
+        for i, msg in enumerate(history):
+            if not isinstance(msg, dict) or "role" not in msg or "content" not in msg:
+                raise ValueError(f"conversation_history[{i}] must be an object with role and content")
+        return history
 
 
 class ChatResponse(BaseModel):
+    # Built once per request via model_construct and never mutated
+    model_config = ConfigDict(frozen=True)
+
     success:          bool
     intents_detected: List[str]
     is_multi_intent:  bool
@@ -165,13 +189,13 @@ class ChatResponse(BaseModel):
 # ══════════════════════════════════════════════════════════════════════
 @app.get("/")
 async def root():
-    return {
+    return FastJSONResponse({
         "message":      "Bank AI Assistant",
         "version":      "3.1.0",
         "llm_provider": settings.llm_provider,
         "docs":         "/docs",
         "health":       "/health",
-    }
+    })
 
 
 @app.get("/health")
@@ -185,30 +209,36 @@ async def health():
     server_status: Dict[str, Any] = {}
     total_tools = 0
 
-    for name, mgr in (
-        ("bank", bank_client_manager),
-        ("gst",  gst_client_manager),
-        ("info", info_client_manager),
-    ):
-        try:
-            client = await mgr.get_client()
+    # MCP servers + DB probes are independent — run them all at once
+    clients, db_healthy, storage = await asyncio.gather(
+        mcp_registry.get_all(return_exceptions=True),
+        agent_manager.db_health(),
+        agent_manager.storage_stats(),
+        return_exceptions=True,
+    )
+    for name, client in zip(mcp_registry.keys, clients):
+        if isinstance(client, Exception):
+            server_status[name] = {"connected": False, "error": str(client)}
+        else:
             server_status[name] = {"connected": True, "tools": len(client.available_tools)}
             total_tools += len(client.available_tools)
-        except Exception as e:
-            server_status[name] = {"connected": False, "error": str(e)}
+    if isinstance(db_healthy, Exception):
+        db_healthy = False
+    if isinstance(storage, Exception):
+        storage = {"status": "error", "error": str(storage)}
 
-    return {
+    return FastJSONResponse({
         "status":        "healthy",
         "version":       "3.1.0",
         "llm_provider":  settings.llm_provider,
         "total_tools":   total_tools,
         "agent_ready":   agent_manager.is_ready(),          # ← NEW
-        "db_healthy":    await agent_manager.db_health(),   # ← NEW
+        "db_healthy":    db_healthy,                        # ← NEW
         "query_logging": _query_logging,
         "cors_origins":  ALLOWED_ORIGINS,
         "servers":       server_status,
-        "storage":       await agent_manager.storage_stats(),  # ← NEW
-    }
+        "storage":       storage,                           # ← NEW
+    })
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -225,7 +255,7 @@ async def chat(request: ChatRequest):
     session_id = (request.session_id or str(uuid.uuid4())).strip()
     user_id    = (request.user_id    or "anonymous").strip()
 
-    logger.info(f"[Chat] session={session_id} user={user_id} msg={request.message[:80]!r}")
+    logger.info("[Chat] session=%s user=%s msg=%r", session_id, user_id, request.message[:80])
 
     try:
         # ── Timeout guard — prevents MCP slow calls hanging the server ──
@@ -249,7 +279,10 @@ async def chat(request: ChatRequest):
                 success    = True,
             )
 
-        return ChatResponse(
+        # Everything below came out of our own pipeline, already typed —
+        # model_construct skips re-validating each field and every
+        # tool_calls dict. Inbound ChatRequest is still fully validated.
+        return ChatResponse.model_construct(
             success          = True,
             intents_detected = result["intents_detected"],
             is_multi_intent  = result["is_multi_intent"],
@@ -259,17 +292,18 @@ async def chat(request: ChatRequest):
             session_id       = session_id,
             context_used     = result.get("context_used"),
             memory_snapshot  = result.get("memory_snapshot"),
+            error            = None,
         )
 
     except asyncio.TimeoutError:
-        logger.error(f"[Chat] Timeout after {REQUEST_TIMEOUT_SECS}s — session={session_id}")
+        logger.error("[Chat] Timeout after %ss — session=%s", REQUEST_TIMEOUT_SECS, session_id)
         if _query_logging:
             query_logger.log_query(
                 query=request.message, intents=[], tools=[],
                 latency_ms=REQUEST_TIMEOUT_SECS * 1000,
                 success=False, error="timeout",
             )
-        return ChatResponse(
+        return ChatResponse.model_construct(
             success=False, intents_detected=[], is_multi_intent=False,
             response="Request timed out. Please try again.",
             tool_calls=[], llm_provider=settings.llm_provider,
@@ -277,13 +311,18 @@ async def chat(request: ChatRequest):
         )
 
     except Exception as e:
-        logger.error(f"[Chat] Error session={session_id}: {e}", exc_info=True)
+        # Tracebacks only at DEBUG — upstream MCP failures are routine
+        # enough under load that formatting one per error costs real CPU.
+        logger.error(
+            "[Chat] Error session=%s: %s", session_id, e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         if _query_logging:
             query_logger.log_query(
                 query=request.message, intents=[], tools=[],
                 latency_ms=0, success=False, error=str(e),
             )
-        return ChatResponse(
+        return ChatResponse.model_construct(
             success=False, intents_detected=[], is_multi_intent=False,
             response="I encountered an error. Please try again.",
             tool_calls=[], llm_provider=settings.llm_provider,
@@ -302,10 +341,10 @@ async def get_session_context(session_id: str):
     """
     if not agent_manager.is_ready():
         raise HTTPException(status_code=503, detail="Agent not ready")
-    return {
+    return FastJSONResponse({
         "session_id": session_id,
         "context":    agent_manager.get_context(session_id),
-    }
+    })
 
 
 @app.get("/api/session/{session_id}/history")
@@ -313,10 +352,10 @@ async def get_session_history(session_id: str):
     """Return in-memory conversation history for a session."""
     if not agent_manager.is_ready():
         raise HTTPException(status_code=503, detail="Agent not ready")
-    return {
+    return FastJSONResponse({
         "session_id": session_id,
         "history":    agent_manager.get_history(session_id),
-    }
+    })
 
 
 @app.delete("/api/session/{session_id}")
@@ -345,7 +384,7 @@ async def intent_analytics(days: int = 7):
 # ══════════════════════════════════════════════════════════════════════
 @app.get("/api/info")
 async def info():
-    return {
+    return FastJSONResponse({
         "api_version":  "3.1.0",
         "llm_provider": settings.llm_provider,
         "platform":     "Bank AI Assistant",
@@ -424,7 +463,7 @@ async def info():
                 "chat_with_support", "get_contact_details",
             ]
         }
-    }
+    })
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -435,18 +474,14 @@ async def list_all_tools():
     """List all available tools from all MCP servers."""
     all_tools: Dict[str, Any] = {}
     total = 0
-    for name, mgr in (
-        ("bank", bank_client_manager),
-        ("gst",  gst_client_manager),
-        ("info", info_client_manager),
-    ):
-        try:
-            client = await mgr.get_client()
+    results = await mcp_registry.get_all(return_exceptions=True)
+    for name, client in zip(mcp_registry.keys, results):
+        if isinstance(client, Exception):
+            all_tools[name] = {"error": str(client)}
+        else:
             all_tools[name] = client.available_tools
             total += len(client.available_tools)
-        except Exception as e:
-            all_tools[name] = {"error": str(e)}
-    return {"total_tools": total, "servers": all_tools}
+    return FastJSONResponse({"total_tools": total, "servers": all_tools})
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -454,9 +489,22 @@ async def list_all_tools():
 # ══════════════════════════════════════════════════════════════════════
 if __name__ == "__main__":
     import uvicorn
+
+    # reload and workers>1 are mutually exclusive in uvicorn. Each worker
+    # runs its own MCP subprocesses and in-process session memory — set
+    # USE_REDIS=true so sessions survive landing on a different worker.
+    workers = 1 if settings.debug else settings.workers
+    if workers > 1 and not settings.use_redis:
+        logger.warning("%s workers without Redis — session memory is per-worker", workers)
+
     uvicorn.run(
         "client.main:app",
-        host   = settings.host,
-        port   = settings.port,
-        reload = settings.debug,
+        host    = settings.host,
+        port    = settings.port,
+        reload  = settings.debug,
+        workers = workers,
+        # Per-request access lines are debug-only; production keeps the
+        # configured app log level (warning recommended).
+        access_log = settings.debug,
+        log_level  = settings.log_level.lower(),
     )
\ No newline at end of file
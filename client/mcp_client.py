@@ -1,180 +1,550 @@
 """
 MCP Client Wrapper — Bank AI Assistant
 Single bank MCP server: data_server.py
+Each client keeps one server subprocess + session open for its lifetime.
 """
+from collections import OrderedDict
+from contextlib import AsyncExitStack
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+import importlib
+import json
 import logging
 import asyncio
+import time
+import anyio
 
 logger = logging.getLogger(__name__)
 
+# Canonical argument encoding for cache/dedup keys. The MCP wire itself is
+# already encoded by pydantic-core, so keys are the only json.dumps left.
+try:
+    import orjson
+
+    _KEY_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def canonical_args(arguments: Dict[str, Any]) -> bytes:
+        try:
+            return orjson.dumps(arguments, default=str, option=_KEY_OPTS)
+        except TypeError:      # e.g. ints wider than 64 bits
+            return json.dumps(arguments, sort_keys=True, default=str).encode()
+except ImportError:
+    def canonical_args(arguments: Dict[str, Any]) -> bytes:
+        return json.dumps(arguments, sort_keys=True, default=str).encode()
+
+# JSON-schema type → Python type name used in get_tools_for_schema()
+_JSON_TYPE_MAP: Dict[str, str] = {
+    "string":  "str",
+    "number":  "float",
+    "integer": "int",
+    "boolean": "bool",
+    "array":   "list",
+    "object":  "dict"
+}
+
+# Tools whose output depends only on their arguments — GST maths and the
+# static onboarding docs. Successful results are memoized per client.
+# validate_gstin is left out: with an API key it does a live GSTN lookup.
+CACHEABLE_TOOLS = frozenset({
+    "calculate_gst", "reverse_calculate_gst", "gst_breakdown", "compare_gst_rates",
+    "get_company_onboarding_guide", "get_company_required_documents",
+    "get_bank_onboarding_guide", "get_supported_banks", "get_vendor_onboarding_guide",
+    "get_validation_formats", "get_onboarding_faq", "get_common_errors",
+})
+TOOL_CACHE_SIZE     = 4096
+TOOL_CACHE_TTL_SECS = 3600.0
+
+# Circuit breaker: after this many consecutive transport/exception or connect
+# failures a server slot short-circuits calls and reconnects for the cooldown
+# instead of piling more requests onto a server that is not answering.
+# Tool-level errors don't count.
+CIRCUIT_FAIL_THRESHOLD = 5
+CIRCUIT_COOLDOWN_SECS  = 30.0
+
+
+def _parameter_definitions(input_schema: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    required = frozenset(input_schema.get("required", ()))
+    return {
+        param_name: {
+            "description": param_schema.get("description", f"Parameter {param_name}"),
+            "type":        _JSON_TYPE_MAP.get(param_schema.get("type", "string"), "str"),
+            "required":    param_name in required
+        }
+        for param_name, param_schema in input_schema.get("properties", {}).items()
+    }
+
+
+class CircuitBreaker:
+    """Consecutive-failure count and cooldown for one server.
+
+    Owned by the registry slot rather than the MCPClient, so it survives the
+    client being replaced when a dead server is reconnected.
+    """
+
+    __slots__ = ("server_name", "fail_count", "open_until")
+
+    def __init__(self, server_name: str):
+        self.server_name = server_name
+        self.fail_count  = 0
+        self.open_until  = 0.0
+
+    def is_open(self) -> bool:
+        return bool(self.open_until) and time.monotonic() < self.open_until
+
+    def record_success(self) -> None:
+        # only an answered call resets the count — a server that connects
+        # and then dies on every request still trips the breaker
+        self.fail_count = 0
+
+    def record_failure(self) -> None:
+        self.fail_count += 1
+        if self.fail_count >= CIRCUIT_FAIL_THRESHOLD:
+            # stays tripped after the cooldown: one more failure re-opens it
+            self.open_until = time.monotonic() + CIRCUIT_COOLDOWN_SECS
+            logger.warning(
+                "%s: %s consecutive failures — circuit open for %ss",
+                self.server_name, self.fail_count, CIRCUIT_COOLDOWN_SECS,
+            )
 
-class MCPClient:
-    """Client for a single MCP server."""
 
-    def __init__(self, server_module: str, server_name: str):
+class MCPClient:
+    """Client for a single MCP server.
+
+    One server subprocess and one initialized ClientSession are kept open
+    from connect() until close(); call_tool reuses that session instead of
+    spawning and handshaking a fresh subprocess per call.
+
+    With in_process=True the server module is imported instead and its
+    FastMCP instance (module attribute ``mcp``) is called directly — no
+    subprocess, no stdio JSON framing. Only for first-party servers, and
+    only ones whose sync tools are CPU-trivial: FastMCP runs a sync tool
+    inline, so it blocks the host's event loop for its whole run. The GST
+    and info servers qualify — their sync tools return static dicts or do
+    a line of arithmetic, and anything touching the network is async.
+    """
+
+    __slots__ = (
+        "server_module", "server_name", "in_process", "_server_params",
+        "available_tools", "_schema_tools", "_schema_by_name", "_tool_summaries",
+        "_required", "_local", "_session", "_runner", "_stop", "_tool_cache",
+        "_breaker", "_local_close",
+    )
+
+    def __init__(self, server_module: str, server_name: str, in_process: bool = False,
+                 breaker: Optional[CircuitBreaker] = None):
         self.server_module  = server_module
         self.server_name    = server_name
+        self.in_process     = in_process
+        self._server_params = StdioServerParameters(
+            command="python",
+            args=["-m", server_module],
+            env=None
+        )
         self.available_tools: List[Dict[str, Any]] = []
+        self._schema_tools:   List[Dict[str, Any]] = []
+        self._schema_by_name: Dict[str, Dict[str, Any]] = {}
+        self._tool_summaries: List[Dict[str, str]]  = []
+        self._required:       Dict[str, frozenset]  = {}
+        self._local:   Optional[Any]                 = None   # FastMCP instance when in_process
+        self._local_close: Optional[Any]             = None   # module-level aclose() hook, if any
+        self._session: Optional[ClientSession]       = None
+        self._runner:  Optional[asyncio.Task]        = None
+        self._stop     = asyncio.Event()
+        self._breaker  = breaker if breaker is not None else CircuitBreaker(server_name)
+        # (tool, canonical args) → (stored_at, response); LRU order, oldest first
+        self._tool_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @property
+    def connected(self) -> bool:
+        return self._session is not None or self._local is not None
 
     async def connect(self):
-        """Connect to discover available tools."""
-        try:
-            server_params = StdioServerParameters(
-                command="python",
-                args=["-m", self.server_module],
-                env=None
-            )
-
-            logger.info(f"Connecting to {self.server_name}...")
+        """Start the server, initialize the session and discover tools."""
+        logger.info("Connecting to %s...", self.server_name)
 
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
+        try:
+            if self.in_process:
+                await self._load_local()
+            else:
+                ready: asyncio.Future = asyncio.get_running_loop().create_future()
+                self._runner = asyncio.create_task(self._run_session(ready))
+                await ready
+        except Exception as e:
+            logger.error("✗ %s connection failed: %s", self.server_name, e)
+            raise
 
-                    tools_list = await session.list_tools()
-                    self.available_tools = [
-                        {
-                            "name":         tool.name,
-                            "description":  tool.description,
-                            "input_schema": tool.inputSchema
-                        }
-                        for tool in tools_list.tools
-                    ]
+        logger.info("✓ %s: %s tools", self.server_name, len(self.available_tools))
+        logger.debug("  Tools: %s", [t['name'] for t in self.available_tools])
+        return self.available_tools
 
-            logger.info(f"✓ {self.server_name}: {len(self.available_tools)} tools")
-            logger.info(f"  Tools: {[t['name'] for t in self.available_tools]}")
-            return self.available_tools
+    async def _load_local(self) -> None:
+        # FastMCP() calls logging.basicConfig when the module builds its
+        # server; put the root logger back so the host's setup wins
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        try:
+            module = importlib.import_module(self.server_module)
+        finally:
+            root.handlers[:] = handlers
+            root.setLevel(level)
+        server = module.mcp
+        self.available_tools = [
+            {
+                "name":         tool.name,
+                "description":  tool.description,
+                "input_schema": tool.inputSchema
+            }
+            for tool in await server.list_tools()
+        ]
+        self._index_tools()
+        self._local       = server
+        self._local_close = getattr(module, "aclose", None)
+
+    async def _run_session(self, ready: asyncio.Future) -> None:
+        """Own the stdio transport + session for the client's lifetime.
+
+        The transport's task group has to be entered and exited by the same
+        task, so it lives here rather than in whichever request happened to
+        call connect() first. close() sets _stop to unwind it.
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                read, write = await stack.enter_async_context(stdio_client(self._server_params))
+                session     = await stack.enter_async_context(ClientSession(read, write))
+                await session.initialize()
+
+                tools_list = await session.list_tools()
+                self.available_tools = [
+                    {
+                        "name":         tool.name,
+                        "description":  tool.description,
+                        "input_schema": tool.inputSchema
+                    }
+                    for tool in tools_list.tools
+                ]
+                self._index_tools()
 
+                self._session = session
+                ready.set_result(None)
+                await self._stop.wait()
         except Exception as e:
-            logger.error(f"✗ {self.server_name} connection failed: {e}")
-            raise
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error("✗ %s session ended: %s", self.server_name, e)
+        finally:
+            self._session = None
+            if not ready.done():
+                ready.set_exception(ConnectionError(f"{self.server_name} session closed during startup"))
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call an MCP tool using a fresh connection."""
-        logger.info(f"→ [{self.server_name}] {tool_name}")
-
+        """Call an MCP tool over the persistent session."""
+        logger.info("→ [%s] %s", self.server_name, tool_name)
+
+        cache_key = None
+        if tool_name in CACHEABLE_TOOLS:
+            cache_key = (tool_name, canonical_args(arguments))
+            cached    = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("✓ [%s] %s (cached)", self.server_name, tool_name)
+                return cached
+
+        # Fail fast on a missing required argument instead of paying a round
+        # trip for the server's own validation error
+        missing = self._required.get(tool_name, frozenset()).difference(arguments)
+        if missing:
+            text = f"Missing required argument(s) for {tool_name}: {', '.join(sorted(missing))}"
+            logger.error("✗ [%s] %s: %s", self.server_name, tool_name, text)
+            return {"success": False, "result": text, "error": text, "is_error": True}
+
+        if self._breaker.is_open():
+            logger.warning("✗ [%s] %s: circuit open", self.server_name, tool_name)
+            return {"success": False, "error": f"{self.server_name} is unavailable (circuit open)"}
+
+        if self._local is not None:
+            response = await self._call_local(tool_name, arguments)
+        else:
+            response = await self._call_session(tool_name, arguments)
+
+        if cache_key is not None and response["success"] and response.get("result") is not None:
+            self._cache_put(cache_key, response)
+        return response
+
+    async def _call_local(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            server_params = StdioServerParameters(
-                command="python",
-                args=["-m", self.server_module],
-                env=None
-            )
+            # FastMCP.call_tool catches tool exceptions itself and returns
+            # them as a TextContent flagged is_error
+            content  = await self._local.call_tool(tool_name, arguments)
+            is_error = bool(content) and getattr(content[0], "is_error", False)
 
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    result = await session.call_tool(tool_name, arguments)
-
-                    logger.info(f"✓ [{self.server_name}] {tool_name} executed")
-
-                    if result.content:
-                        result_text = result.content[0].text if result.content else None
-                        return {
-                            "success":  not result.isError,
-                            "result":   result_text,
-                            "is_error": result.isError
-                        }
-
-                    return {
-                        "success":  not result.isError,
-                        "result":   None,
-                        "is_error": result.isError
-                    }
+            text     = content[0].text if content else None
+
+            self._breaker.record_success()   # the server answered, even if the tool failed
+            if is_error:
+                logger.error("✗ [%s] %s: %s", self.server_name, tool_name, text)
+                return {"success": False, "result": text, "error": text, "is_error": True}
+
+            logger.info("✓ [%s] %s executed", self.server_name, tool_name)
+
+            return {
+                "success":  True,
+                "result":   text,
+                "is_error": False
+            }
 
         except Exception as e:
-            logger.error(f"✗ [{self.server_name}] {tool_name}: {e}")
+            logger.error("✗ [%s] %s: %s", self.server_name, tool_name, e)
+            self._breaker.record_failure()
             return {"success": False, "error": str(e)}
 
-    def get_tools_for_schema(self) -> List[Dict[str, Any]]:
-        """Get tools in a generic schema format."""
-        schema_tools = []
+    async def _call_session(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        session = self._session
+        if session is None:
+            return {"success": False, "error": f"{self.server_name} is not connected"}
 
-        for tool in self.available_tools:
-            parameter_definitions = {}
+        try:
+            result = await session.call_tool(tool_name, arguments)
+            self._breaker.record_success()
 
-            if "properties" in tool["input_schema"]:
-                for param_name, param_schema in tool["input_schema"]["properties"].items():
-                    param_type  = param_schema.get("type", "string")
-                    mapped_type = self._map_type(param_type)
+            logger.info("✓ [%s] %s executed", self.server_name, tool_name)
 
-                    parameter_definitions[param_name] = {
-                        "description": param_schema.get("description", f"Parameter {param_name}"),
-                        "type":        mapped_type,
-                        "required":    param_name in tool["input_schema"].get("required", [])
-                    }
+            return {
+                "success":  not result.isError,
+                "result":   result.content[0].text if result.content else None,
+                "is_error": result.isError
+            }
+
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream) as e:
+            # server process is gone — drop the session so the manager reconnects
+            logger.error("✗ [%s] %s: transport closed", self.server_name, tool_name)
+            self._session = None
+            self._stop.set()
+            self._breaker.record_failure()
+            return {"success": False, "error": f"{self.server_name} connection lost ({type(e).__name__})"}
+
+        except Exception as e:
+            logger.error("✗ [%s] %s: %s", self.server_name, tool_name, e)
+            self._breaker.record_failure()
+            return {"success": False, "error": str(e)}
 
-            schema_tools.append({
+    async def stream_tool(self, tool_name: str, arguments: Dict[str, Any]) -> AsyncIterator[str]:
+        """Yield every text part of a tool result, in order.
+
+        call_tool keeps returning only the first part (what the formatters
+        parse as JSON); this exposes multi-part results to callers that
+        render progressively. MCP delivers a result as one frame, so parts
+        become available together. Non-text parts are skipped; failures
+        raise instead of being folded into a response dict. Not cached.
+        """
+        if self._local is not None:
+            content = await self._local.call_tool(tool_name, arguments)
+        elif self._session is not None:
+            content = (await self._session.call_tool(tool_name, arguments)).content
+        else:
+            raise ConnectionError(f"{self.server_name} is not connected")
+
+        for part in content:
+            text = getattr(part, "text", None)
+            if text is not None:
+                yield text
+
+    async def call_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Run independent (tool_name, arguments) calls concurrently.
+
+        Requests interleave over the one session (JSON-RPC ids keep them
+        apart), so wall time is the slowest call rather than the sum.
+        Results come back in call order; a raised exception is returned
+        in its slot instead of cancelling the rest.
+        """
+        return await asyncio.gather(
+            *(self.call_tool(name, args) for name, args in calls),
+            return_exceptions=True,
+        )
+
+    def _cache_get(self, key: Tuple[str, bytes]) -> Optional[Dict[str, Any]]:
+        entry = self._tool_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > TOOL_CACHE_TTL_SECS:
+            del self._tool_cache[key]
+            return None
+        self._tool_cache.move_to_end(key)
+        return dict(response)     # values are str/bool — a shallow copy is enough
+
+    def _cache_put(self, key: Tuple[str, bytes], response: Dict[str, Any]) -> None:
+        self._tool_cache[key] = (time.monotonic(), dict(response))
+        self._tool_cache.move_to_end(key)
+        while len(self._tool_cache) > TOOL_CACHE_SIZE:
+            self._tool_cache.popitem(last=False)
+
+    def get_tools_for_schema(self) -> List[Dict[str, Any]]:
+        """Get tools in a generic schema format (built once per connect)."""
+        return self._schema_tools
+
+    # ── Two-phase tool definitions ─────────────────────────────────────
+    # Phase 1 sends only name + description for every tool; phase 2
+    # promotes the full parameter schema for the tools actually picked.
+
+    def get_tool_summaries(self) -> List[Dict[str, str]]:
+        """Name + description for every tool — the cheap always-sent pool."""
+        return self._tool_summaries
+
+    def get_tool_schema(self, name: str) -> Optional[Dict[str, Any]]:
+        """Full schema-format definition for one tool, or None if unknown."""
+        return self._schema_by_name.get(name)
+
+    def promote_tools(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Full definitions for the selected tools; unknown names are skipped."""
+        return [self._schema_by_name[n] for n in names if n in self._schema_by_name]
+
+    def _index_tools(self) -> None:
+        self._schema_tools   = self._build_schema_tools()
+        self._schema_by_name = {t["name"]: t for t in self._schema_tools}
+        self._required = {
+            t["name"]: frozenset(t["input_schema"].get("required", ()))
+            for t in self.available_tools
+        }
+        self._tool_summaries = [
+            {"name": t["name"], "description": t["description"]}
+            for t in self._schema_tools
+        ]
+
+    def _build_schema_tools(self) -> List[Dict[str, Any]]:
+        return [
+            {
                 "name":                 tool["name"],
                 "description":          tool["description"],
-                "parameter_definitions": parameter_definitions
-            })
+                "parameter_definitions": _parameter_definitions(tool["input_schema"])
+            }
+            for tool in self.available_tools
+        ]
+
+    async def close(self):
+        self._local = None
+        if self._local_close is not None:
+            # In-process servers own HTTP pools that nothing else releases
+            try:
+                await self._local_close()
+            except Exception as e:
+                logger.warning("%s shutdown hook failed: %s", self.server_name, e)
+            self._local_close = None
+        self._stop.set()
+        if self._runner is not None:
+            await self._runner
+            self._runner = None
+        logger.info("%s client closed", self.server_name)
+
+
+class MCPRegistry:
+    """Owns every MCP client, stored column-wise.
+
+    Slot i across the parallel lists is one server: keys[i] is the short
+    name used in API payloads, names[i] the display name. get_all() is the
+    single place the "every client" fan-out happens. breakers[i] outlives
+    the clients[i] it guards, so a crash-looping server stays tripped
+    across reconnects.
+    """
+
+    __slots__ = ("keys", "names", "modules", "in_process", "clients", "locks", "breakers")
+
+    def __init__(self, configs: List[Tuple[str, str, str, bool]]):
+        self.keys       = [c[0] for c in configs]
+        self.names      = [c[1] for c in configs]
+        self.modules    = [c[2] for c in configs]
+        self.in_process = [c[3] for c in configs]
+        self.clients: List[Optional[MCPClient]] = [None] * len(configs)
+        self.locks = [asyncio.Lock() for _ in configs]
+        self.breakers = [CircuitBreaker(name) for name in self.names]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    async def get(self, i: int) -> MCPClient:
+        # Fast path: once connected, no lock is taken. Only first connect and
+        # reconnect go through the lock, where the state is checked again.
+        client = self.clients[i]
+        if client is not None and client.connected:
+            return client
+        async with self.locks[i]:
+            client = self.clients[i]
+            if client is not None and not client.connected:
+                # server process died — tear down what's left and reconnect
+                logger.warning("%s session lost — reconnecting", self.names[i])
+                await client.close()
+                client = self.clients[i] = None
+            if client is None:
+                breaker = self.breakers[i]
+                if breaker.is_open():
+                    # don't respawn a server that keeps dying inside the cooldown
+                    raise ConnectionError(f"{self.names[i]} is unavailable (circuit open)")
+                client = MCPClient(self.modules[i], self.names[i], self.in_process[i], breaker)
+                try:
+                    await client.connect()
+                except Exception as e:
+                    logger.error("Failed to initialize %s: %s", self.names[i], e)
+                    breaker.record_failure()
+                    raise
+                self.clients[i] = client
+            return client
 
-        return schema_tools
+    async def get_all(self, return_exceptions: bool = False) -> List[Any]:
+        """Every client in slot order, connected concurrently."""
+        return await asyncio.gather(
+            *(self.get(i) for i in range(len(self))),
+            return_exceptions=return_exceptions,
+        )
 
-    def _map_type(self, json_type: str) -> str:
-        return {
-            "string":  "str",
-            "number":  "float",
-            "integer": "int",
-            "boolean": "bool",
-            "array":   "list",
-            "object":  "dict"
-        }.get(json_type, "str")
+    async def close(self, i: int):
+        async with self.locks[i]:
+            if self.clients[i]:
+                await self.clients[i].close()
+                self.clients[i] = None
 
-    async def close(self):
-        logger.info(f"{self.server_name} client closed")
+    async def close_all(self):
+        await asyncio.gather(*(self.close(i) for i in range(len(self))))
 
 
 class MCPClientManager:
-    """Manages lifecycle of a single MCP client."""
+    """Handle on one registry slot — the per-server get_client()/close() API."""
 
-    def __init__(self, server_module: str, server_name: str):
-        self.server_module = server_module
-        self.server_name   = server_name
-        self._client: Optional[MCPClient] = None
-        self._lock = asyncio.Lock()
+    __slots__ = ("_registry", "_index")
+
+    def __init__(self, registry: MCPRegistry, index: int):
+        self._registry = registry
+        self._index    = index
+
+    @property
+    def server_name(self) -> str:
+        return self._registry.names[self._index]
 
     async def get_client(self) -> MCPClient:
-        async with self._lock:
-            if self._client is None:
-                self._client = MCPClient(self.server_module, self.server_name)
-                try:
-                    await self._client.connect()
-                except Exception as e:
-                    logger.error(f"Failed to initialize {self.server_name}: {e}")
-                    self._client = None
-                    raise
-            return self._client
+        return await self._registry.get(self._index)
 
     async def close(self):
-        async with self._lock:
-            if self._client:
-                await self._client.close()
-                self._client = None
+        await self._registry.close(self._index)
 
 
 # ═══════════════════════════════════════════════════════════════════════
-# THREE MANAGERS
+# REGISTRY — one slot per server, in (key, name, module, in_process) form
 # ═══════════════════════════════════════════════════════════════════════
 
-# Bank AI Assistant — all payment/compliance/account tools
-bank_client_manager = MCPClientManager(
-    server_module="mcp_server.data_server",
-    server_name="Bank AI Assistant"
-)
-
-# GST Calculator — calculate_gst, reverse_calculate_gst, gst_breakdown,
-#                  compare_gst_rates, validate_gstin
-gst_client_manager = MCPClientManager(
-    server_module="mcp_server.server",
-    server_name="GST Calculator"
-)
-
-# Onboarding Info — company, bank, vendor onboarding guides & FAQs
-info_client_manager = MCPClientManager(
-    server_module="mcp_server.info_server",
-    server_name="Onboarding Info"
-)
\ No newline at end of file
+mcp_registry = MCPRegistry([
+    # Bank AI Assistant — all payment/compliance/account tools. Kept in its
+    # own process: it holds the bank API key and refuses to import without it.
+    ("bank", "Bank AI Assistant", "mcp_server.data_server", False),
+
+    # GST Calculator — calculate_gst, reverse_calculate_gst, gst_breakdown,
+    #                  compare_gst_rates, validate_gstin
+    # In-process servers run sync tools on the API event loop — keep any
+    # tool added to them either async or CPU-trivial.
+    ("gst",  "GST Calculator",    "mcp_server.server",      True),
+
+    # Onboarding Info — company, bank, vendor onboarding guides & FAQs
+    ("info", "Onboarding Info",   "mcp_server.info_server", True),
+])
+
+bank_client_manager = MCPClientManager(mcp_registry, 0)
+gst_client_manager  = MCPClientManager(mcp_registry, 1)
+info_client_manager = MCPClientManager(mcp_registry, 2)
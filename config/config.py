@@ -3,6 +3,9 @@ config/config.py — Bank AI Assistant
 Configuration Management.
 Local ML model — NO external LLM API keys required.
 """
+import os
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional
@@ -23,9 +26,11 @@ class Settings(BaseSettings):
     gst_api_key: Optional[str] = None
 
     # ── Server ────────────────────────────────────────────────
-    host:  str  = "0.0.0.0"
-    port:  int  = 8000
-    debug: bool = True
+    host:    str  = "0.0.0.0"
+    port:    int  = 8000
+    debug:   bool = True
+    # uvicorn worker processes when debug is off (reload forces a single one)
+    workers: int  = Field(default_factory=lambda: min(os.cpu_count() or 1, 4))
 
     # ── Logging ───────────────────────────────────────────────
     log_level: str = "INFO"
@@ -69,4 +74,11 @@ class Settings(BaseSettings):
     }
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide Settings — .env is parsed once, on first call.
+    Usable as a FastAPI dependency: Depends(get_settings)."""
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
@@ -32,7 +32,7 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
-from client.llm_service import claude_service        # LocalMLService — UNCHANGED
+from client.llm_service import get_service           # LocalMLService — UNCHANGED
 from agent.conversation_agent import ConversationAgent
 from agent.user_storage import create_user_storage
 
@@ -58,16 +58,12 @@ class AgentManager:
         Connect storage, build agent. Call once in FastAPI lifespan
         AFTER MCP clients have connected.
         """
-        logger.info("=" * 55)
-        logger.info("AgentManager: initializing")
-        logger.info("=" * 55)
-
         storage      = await self._init_postgres()
         redis_client = self._init_redis()
         memory_ttl   = int(os.getenv("AGENT_MEMORY_TTL_MINUTES", "60"))
 
         self.agent = ConversationAgent(
-            llm_service  = claude_service,   # LocalMLService — untouched
+            llm_service  = get_service(),    # LocalMLService — untouched
             user_storage = storage,
             memory_ttl   = memory_ttl,
             redis_client = redis_client,
@@ -75,7 +71,6 @@ class AgentManager:
 
         self._ready = True
         logger.info("✓ AgentManager ready")
-        logger.info("=" * 55)
 
     async def shutdown(self) -> None:
         """Graceful shutdown — close DB pool."""
@@ -0,0 +1,140 @@
+"""
+Request coalescer / short-TTL result cache for read-only MCP tools.
+
+Identical calls (same arguments, api_key excluded) that arrive while one is
+in flight share its result instead of each recomputing it; the result is
+then kept for the decorator's ttl so repeats inside that window reuse it.
+
+    from mcp_server.coalescer import coalesce, coalescer
+
+    @mcp.tool()
+    @tool_handler          # still authenticates every caller
+    @coalesce(ttl=15.0)
+    def get_gst_payment_history(api_key: str, gstin: str, ...) -> dict:
+        ...
+
+    # in a write tool — drop stale snapshots for that GSTIN
+    coalescer.invalidate("get_gst_payment_history", gstin=gstin)
+
+Coroutine functions share one pending Future per key. Sync functions run to
+completion on the event loop, so for them only the ttl window applies.
+"""
+import asyncio
+import inspect
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Keys that never affect a read-only result
+_IGNORED_ARGS = frozenset({"api_key"})
+
+DEFAULT_TTL  = 0.25
+MAX_ENTRIES  = 4096
+
+
+def _default_key(args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+    # Tools take api_key first; FastMCP passes everything else as keywords
+    return args[1:], tuple(sorted(
+        (k, v) for k, v in kwargs.items() if k not in _IGNORED_ARGS
+    ))
+
+
+class Coalescer:
+    """Shares results between identical calls for a per-function ttl."""
+
+    __slots__ = ("maxsize", "_pending", "_done")
+
+    def __init__(self, maxsize: int = MAX_ENTRIES):
+        self.maxsize = maxsize
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        # (name, key) -> (expires_at, result), least recently used first
+        self._done: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def wrap(self, fn: Callable, key: Optional[Callable] = None,
+             ttl: float = DEFAULT_TTL) -> Callable:
+        key = key or _default_key
+        name = fn.__name__
+
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    k = (name, key(args, kwargs))
+                    fut = self._pending.get(k)
+                except TypeError:                 # unhashable argument
+                    return await fn(*args, **kwargs)
+                if fut is None:
+                    fut = asyncio.ensure_future(fn(*args, **kwargs))
+                    self._pending[k] = fut
+                    fut.add_done_callback(lambda f, k=k: self._expire(k, f, ttl))
+                # shield: one caller cancelling must not cancel the others
+                return await asyncio.shield(fut)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            try:
+                k = (name, key(args, kwargs))
+                hit = self._done.get(k)
+            except TypeError:                     # unhashable argument
+                return fn(*args, **kwargs)
+            if hit is not None:
+                if hit[0] > now:
+                    self._done.move_to_end(k)
+                    return hit[1]
+                del self._done[k]
+            result = fn(*args, **kwargs)
+            self._done[k] = (now + ttl, result)
+            if len(self._done) > self.maxsize:
+                self._done.popitem(last=False)
+            return result
+        return wrapper
+
+    def invalidate(self, name: str, **match: Any) -> None:
+        """Drop cached results of tool ``name``. With ``match``, only entries
+        whose keyword arguments agree with it (or leave that argument unset,
+        e.g. an unfiltered history) are dropped."""
+        for table in (self._done, self._pending):
+            stale = [
+                k for k in table
+                if k[0] == name and _matches(k[1], match)
+            ]
+            for k in stale:
+                del table[k]
+
+    def _expire(self, k: Hashable, fut: asyncio.Future, ttl: float) -> None:
+        # Failures are not kept; successes stay shareable for ttl
+        if fut.cancelled() or fut.exception() is not None or ttl <= 0:
+            self._pending.pop(k, None)
+        else:
+            asyncio.get_running_loop().call_later(ttl, self._drop_pending, k, fut)
+
+    def _drop_pending(self, k: Hashable, fut: asyncio.Future) -> None:
+        # Only drop the future this timer was set for — an invalidate may
+        # already have replaced it with a newer call
+        if self._pending.get(k) is fut:
+            del self._pending[k]
+
+
+def _matches(key: Hashable, match: Dict[str, Any]) -> bool:
+    if not match:
+        return True
+    try:
+        kwargs = dict(key[1])
+    except (TypeError, ValueError, IndexError):   # custom key shape
+        return True
+    return all(kwargs.get(f, v) == v for f, v in match.items())
+
+
+# Process-wide coalescer shared by the decorated tools
+coalescer = Coalescer()
+
+
+def coalesce(key: Optional[Callable] = None, ttl: float = DEFAULT_TTL) -> Callable:
+    """Decorator form of ``coalescer.wrap``. ``key(args, kwargs)`` must return
+    a hashable; by default it is every argument except api_key."""
+    def decorator(fn: Callable) -> Callable:
+        return coalescer.wrap(fn, key, ttl)
+    return decorator
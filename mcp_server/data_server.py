@@ -11,14 +11,41 @@ Authentication:
 """
 
 import os
+import re
+import io
+import csv
+import hmac
+import base64
+import binascii
+import asyncio
 import json
+import itertools
 import time
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import math
 from typing import List, Optional
-from functools import wraps
+from functools import lru_cache, wraps
+from dataclasses import dataclass, asdict, is_dataclass
 
 from fastmcp import FastMCP
+from mcp.types import TextContent
+from pydantic import ValidationError, validate_call
+
+from mcp_server.coalescer import coalesce, coalescer
+
+try:
+    import orjson
+except ImportError:          # FastMCP's json.dumps fallback still works
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.compute as pc
+except ImportError:          # bulk uploads fall back to the csv module
+    pacsv = None
 
 # ─────────────────────────────────────────────
 # Logging
@@ -26,6 +53,30 @@ from fastmcp import FastMCP
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records as-is; the listener thread does the %-formatting.
+
+    The stock prepare() formats the message in the calling thread so records
+    can be pickled — not needed for an in-process queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Move the root handlers behind a queue so tool calls never block on
+    stderr writes; the returned listener must be stopped to flush."""
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [_DeferredQueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 # ─────────────────────────────────────────────
 # Load .env if available
 # ─────────────────────────────────────────────
@@ -49,6 +100,20 @@ if not BANK_API_KEY:
         "      BANK_API_KEY=your_secret_key_here\n"
     )
 
+
+@lru_cache(maxsize=1)
+def _bank_key_bytes() -> bytes:
+    """BANK_API_KEY encoded once for _auth's constant-time compare.
+
+    After rotating the key in the environment, call
+    _bank_key_bytes.cache_clear() to pick up the new value.
+    """
+    key = os.environ.get("BANK_API_KEY", "")
+    if not key:
+        raise EnvironmentError("BANK_API_KEY is not set")
+    return key.encode("utf-8")
+
+
 # ─────────────────────────────────────────────
 # Initialize MCP Server
 # ─────────────────────────────────────────────
@@ -58,27 +123,303 @@ mcp = FastMCP("Bank AI Assistant")
 # ─────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────
+# (epoch second, formatted) — most tool calls in a second share one string
+_TS_CACHE: list = [0, ""]
+
+
+# Identifier formats — compiled once, matched against stripped/upper-cased input
+_IFSC_RE  = re.compile(r"^[A-Z]{4}0[A-Z0-9]{6}$")
+_GSTIN_RE = re.compile(r"^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][A-Z0-9]Z[A-Z0-9]$")
+_PAN_RE   = re.compile(r"^[A-Z]{5}[0-9]{4}[A-Z]$")
+_UPI_RE   = re.compile(r"^[\w.\-]+@[\w\-]+$")
+
+# Download file extension per format — lower() only for formats not listed
+_FMT_EXT = {"PDF": "pdf", "JSON": "json", "XLSX": "xlsx", "CSV": "csv"}
+_RECEIPT_URL = "https://bank.example.com/receipts/{}.{}".format
+
+
 def _ts() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    """UTC ISO-8601 timestamp at second resolution, e.g. 2026-03-01T09:30:00Z."""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    return _TS_CACHE[1]
+
+
+_uid_seq = itertools.count()
 
 
 def _uid(prefix: str = "ID") -> str:
-    return f"{prefix}{int(time.time() * 1000)}"
+    """prefix + epoch-ms + 4-digit sequence — unique within a millisecond,
+    e.g. for every row of a bulk upload."""
+    return f"{prefix}{time.time_ns() // 1_000_000}{next(_uid_seq) % 10000:04d}"
 
 
 def _auth(api_key: str) -> None:
     """Raise ValueError if the provided api_key is invalid."""
     if not api_key:
         raise ValueError("API key is missing.")
-    if api_key != BANK_API_KEY:
+    if not hmac.compare_digest(api_key.encode("utf-8"), _bank_key_bytes()):
         raise ValueError("Invalid API key. Access denied.")
 
 
+def _json_default(obj):
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _to_content(result):
+    """Serialize a tool result with orjson instead of FastMCP's json.dumps.
+
+    Same shape FastMCP would produce (one indented JSON TextContent); non-ASCII
+    text is emitted as UTF-8 rather than \\u escapes, which parses identically.
+    Slotted response dataclasses are serialized field by field, in order.
+    """
+    if orjson is not None:
+        try:
+            return TextContent(type="text", text=orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        except TypeError:    # e.g. ints beyond 64 bits — use the stdlib encoder
+            pass
+    return TextContent(type="text", text=json.dumps(result, indent=2, default=_json_default))
+
+
+# History / account snapshot tools reuse a result for this long; the write
+# tools below invalidate the affected snapshots as soon as they change them
+SNAPSHOT_TTL = 15.0
+
+_ACCOUNT_VIEWS = ("get_account_summary", "get_account_details", "get_transaction_history")
+
+
+def _invalidate(*tools: str, **match) -> None:
+    """Drop cached reads that a money movement just made stale."""
+    for name in tools:
+        coalescer.invalidate(name, **match)
+    for name in _ACCOUNT_VIEWS:
+        coalescer.invalidate(name)
+
+
+# name -> undecorated tool body, for batch_execute
+_TOOL_IMPLS: dict = {}
+
+
+def tool_handler(fn):
+    """Authenticate and run one bank tool.
+
+    Every tool takes api_key as its first parameter; the wrapped body only
+    builds the result, which is serialized here. Errors propagate untouched:
+    FastMCP.call_tool is the single place that logs them and turns them into
+    an error result for the client. Goes under @mcp.tool() — @wraps keeps the
+    original signature and docstring for the tool schema.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        _auth(kwargs["api_key"] if "api_key" in kwargs else args[0])
+        return _to_content(fn(*args, **kwargs))
+    _TOOL_IMPLS[fn.__name__] = fn
+    return wrapper
+
+
+# name -> tool body behind the same argument validation FastMCP applies
+_VALIDATED_IMPLS: dict = {}
+
+
+def _call_impl(name: str, api_key: str, args: dict):
+    """Run a registered tool's body on already-authenticated args.
+
+    The args go through the registered tool's argument model first, so they
+    are coerced ("5" -> 5) and unknown keys are rejected exactly as for a
+    direct tools/call. A rejection is raised as a one-line ValueError of
+    "field: msg" pairs rather than pydantic's multi-line report.
+    """
+    fn = _VALIDATED_IMPLS.get(name)
+    if fn is None:
+        if name not in _TOOL_IMPLS or mcp._tool_manager.get_tool(name) is None:
+            raise ValueError(f"Unknown tool: {name}")
+        fn = _VALIDATED_IMPLS[name] = validate_call(_TOOL_IMPLS[name])
+    if not isinstance(args, dict):
+        raise ValueError(f"Arguments for {name} must be an object.")
+    if "api_key" in args:
+        raise ValueError("api_key is passed once for the whole request, not per call.")
+    try:
+        return fn(api_key=api_key, **args)
+    except ValidationError as e:
+        raise ValueError(f"Invalid arguments for {name}: {_validation_summary(e)}") from None
+
+
+def _validation_summary(e: ValidationError) -> str:
+    """pydantic errors as "field: msg" pairs, without input dumps or doc links."""
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'arguments'}: {err['msg']}"
+        for err in e.errors()
+    )
+
+
+def _pay_bulk(tool: str, api_key: str, payments: List[dict]) -> dict:
+    """Run one payment tool body per record after a single _auth.
+
+    Each record is validated like a direct call to ``tool``; a failing record
+    is reported in its result slot and the rest still go through. The total
+    is summed with fsum and rounded to paise, so it carries no float drift.
+    """
+    results = []
+    amounts = []
+    for payment in payments:
+        try:
+            paid = _call_impl(tool, api_key, payment)
+            results.append(paid)
+            amounts.append(paid.amount)
+        except Exception as e:
+            results.append({"error": str(e), "payment": payment})
+    return {
+        "batch_id": _uid("BATCH"),
+        "total_records": len(payments),
+        "succeeded": len(amounts),
+        "failed": len(payments) - len(amounts),
+        "total_amount": round(math.fsum(amounts), 2),
+        "results": results,
+    }
+
+
+# Base64 text decoded per step; a multiple of 4 so chunks never split a quantum
+_B64_CHUNK = 4 * 256 * 1024
+
+
+def _b64decode(text: str) -> memoryview:
+    """Decode a base64 upload chunk by chunk into one pre-sized bytearray.
+
+    b64decode(str) first copies the whole payload to ASCII bytes and then
+    allocates the result; here only the decoded buffer is held alongside the
+    caller's str. Payloads with line breaks take the plain b64decode path.
+    """
+    if len(text) <= _B64_CHUNK or "\n" in text or len(text) % 4:
+        return memoryview(base64.b64decode(text))
+    size = len(text) // 4 * 3 - (text[-2:].count("="))
+    out = bytearray(size)
+    pos = 0
+    for i in range(0, len(text), _B64_CHUNK):
+        part = binascii.a2b_base64(text[i:i + _B64_CHUNK])
+        out[pos:pos + len(part)] = part
+        pos += len(part)
+    return memoryview(out)[:pos]
+
+
+def _parse_amount(cell) -> Optional[float]:
+    """One bulk-file amount cell as a finite float, or None if it is not one.
+
+    Both CSV paths use it, so a file's totals do not depend on whether
+    pyarrow is installed.
+    """
+    try:
+        amount = float(cell)
+    except (TypeError, ValueError):
+        return None
+    return amount if math.isfinite(amount) else None
+
+
+def _bulk_csv_summary(raw: memoryview) -> dict:
+    """Count valid rows (amount > 0) and their total in a bulk-payment CSV.
+
+    Parsed column-wise with pyarrow when installed, row-wise with csv
+    otherwise. Raises ValueError when the file has no ``amount`` column.
+    """
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            pa.BufferReader(raw), read_options=pacsv.ReadOptions(use_threads=True)
+        )
+        name = next((n for n in table.column_names if n.strip().lower() == "amount"), None)
+        if name is None:
+            raise ValueError("No amount column in the file.")
+        amounts = table[name]
+        if pa.types.is_integer(amounts.type) or pa.types.is_floating(amounts.type):
+            amounts = pc.cast(amounts, pa.float64())
+            ok = pc.and_(pc.is_finite(amounts), pc.greater(amounts, 0))
+        else:
+            # Mixed column read as text: parse it the way the csv path does
+            amounts = pa.array(
+                [_parse_amount(v) for v in amounts.to_pylist()], pa.float64()
+            )
+            ok = pc.greater(amounts, 0)
+        ok = pc.fill_null(ok, False)
+        valid = pc.sum(ok).as_py() or 0
+        total = pc.sum(pc.filter(amounts, ok)).as_py() or 0
+        return {"total_records": table.num_rows, "valid_records": valid,
+                "invalid_records": table.num_rows - valid, "total_amount": total}
+
+    rows = csv.reader(io.StringIO(str(raw, "utf-8-sig")))
+    header = [h.strip().lower() for h in next(rows, [])]
+    if "amount" not in header:
+        raise ValueError("No amount column in the file.")
+    col = header.index("amount")
+    count = valid = 0
+    total = 0.0
+    for row in rows:
+        if not row:
+            continue
+        count += 1
+        amount = _parse_amount(row[col]) if col < len(row) else None
+        if amount is not None and amount > 0:
+            valid += 1
+            total += amount
+    return {"total_records": count, "valid_records": valid,
+            "invalid_records": count - valid, "total_amount": total}
+
+
 # ═══════════════════════════════════════════════════════════
 # 1. CORE PAYMENT
 # ═══════════════════════════════════════════════════════════
 
+# Response types for the payment hot path — field order is the JSON key order
+@dataclass(slots=True)
+class PaymentResult:
+    transaction_id: str
+    beneficiary_id: str
+    amount: float
+    currency: str
+    payment_mode: str
+    remarks: str
+    scheduled_date: str
+    status: str
+    timestamp: str
+
+
+@dataclass(slots=True)
+class PaymentStatus:
+    transaction_id: str
+    status: str
+    amount: float
+    currency: str
+    payment_mode: str
+    utr_number: str
+    timestamp: str
+
+
+@dataclass(slots=True)
+class CancelResult:
+    transaction_id: str
+    status: str
+    reason: str
+    timestamp: str
+
+
+@dataclass(slots=True)
+class RetryResult:
+    original_transaction_id: str
+    new_transaction_id: str
+    status: str
+    timestamp: str
+
+
+@dataclass(slots=True)
+class ReceiptResult:
+    transaction_id: str
+    format: str
+    download_url: str
+
+
 @mcp.tool()
+@tool_handler
 def initiate_payment(
     api_key: str,
     beneficiary_id: str,
@@ -87,7 +428,7 @@ def initiate_payment(
     currency: str = "INR",
     remarks: str = "",
     scheduled_date: str = "",
-) -> dict:
+) -> PaymentResult:
     """
     Send money to any beneficiary.
 
@@ -107,29 +448,26 @@ def initiate_payment(
         initiate_payment("key", "BENE001", 50000, "NEFT")
         Returns: {"transaction_id": "TXN...", "status": "INITIATED", ...}
     """
-    logger.info(f"Initiating payment: beneficiary={beneficiary_id}, amount={amount}, mode={payment_mode}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "beneficiary_id": beneficiary_id,
-            "amount": amount,
-            "currency": currency,
-            "payment_mode": payment_mode,
-            "remarks": remarks,
-            "scheduled_date": scheduled_date or "Immediate",
-            "status": "INITIATED",
-            "timestamp": _ts(),
-        }
-        logger.info(f"Payment initiated successfully: {result['transaction_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error initiating payment: {e}")
-        raise
+    logger.info("Initiating payment: beneficiary=%s, amount=%s, mode=%s", beneficiary_id, amount, payment_mode)
+    result = PaymentResult(
+        transaction_id=_uid("TXN"),
+        beneficiary_id=beneficiary_id,
+        amount=amount,
+        currency=currency,
+        payment_mode=payment_mode,
+        remarks=remarks,
+        scheduled_date=scheduled_date or "Immediate",
+        status="INITIATED",
+        timestamp=_ts(),
+    )
+    logger.info("Payment initiated successfully: %s", result.transaction_id)
+    _invalidate()
+    return result
 
 
 @mcp.tool()
-def get_payment_status(api_key: str, transaction_id: str) -> dict:
+@tool_handler
+def get_payment_status(api_key: str, transaction_id: str) -> PaymentStatus:
     """
     Track any payment by its transaction or reference ID.
 
@@ -144,27 +482,23 @@ def get_payment_status(api_key: str, transaction_id: str) -> dict:
         get_payment_status("key", "TXN1234567890")
         Returns: {"transaction_id": "TXN...", "status": "SUCCESS", "utr_number": "UTR..."}
     """
-    logger.info(f"Fetching payment status: transaction_id={transaction_id}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": transaction_id,
-            "status": "SUCCESS",
-            "amount": 50000,
-            "currency": "INR",
-            "payment_mode": "NEFT",
-            "utr_number": _uid("UTR"),
-            "timestamp": _ts(),
-        }
-        logger.info(f"Payment status fetched: {result['status']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching payment status: {e}")
-        raise
+    logger.info("Fetching payment status: transaction_id=%s", transaction_id)
+    result = PaymentStatus(
+        transaction_id=transaction_id,
+        status="SUCCESS",
+        amount=50000,
+        currency="INR",
+        payment_mode="NEFT",
+        utr_number=_uid("UTR"),
+        timestamp=_ts(),
+    )
+    logger.info("Payment status fetched: %s", result.status)
+    return result
 
 
 @mcp.tool()
-def cancel_payment(api_key: str, transaction_id: str, reason: str = "User requested") -> dict:
+@tool_handler
+def cancel_payment(api_key: str, transaction_id: str, reason: str = "User requested") -> CancelResult:
     """
     Cancel a pending or scheduled payment.
 
@@ -180,19 +514,16 @@ def cancel_payment(api_key: str, transaction_id: str, reason: str = "User reques
         cancel_payment("key", "TXN123", "Duplicate payment")
         Returns: {"transaction_id": "TXN123", "status": "CANCELLED", ...}
     """
-    logger.info(f"Cancelling payment: transaction_id={transaction_id}")
-    try:
-        _auth(api_key)
-        result = {"transaction_id": transaction_id, "status": "CANCELLED", "reason": reason, "timestamp": _ts()}
-        logger.info(f"Payment cancelled successfully")
-        return result
-    except Exception as e:
-        logger.error(f"Error cancelling payment: {e}")
-        raise
+    logger.info("Cancelling payment: transaction_id=%s", transaction_id)
+    result = CancelResult(transaction_id=transaction_id, status="CANCELLED", reason=reason, timestamp=_ts())
+    logger.info("Payment cancelled successfully")
+    _invalidate()
+    return result
 
 
 @mcp.tool()
-def retry_payment(api_key: str, transaction_id: str) -> dict:
+@tool_handler
+def retry_payment(api_key: str, transaction_id: str) -> RetryResult:
     """
     Retry a failed payment.
 
@@ -207,24 +538,21 @@ def retry_payment(api_key: str, transaction_id: str) -> dict:
         retry_payment("key", "TXN123")
         Returns: {"original_transaction_id": "TXN123", "new_transaction_id": "TXN...", "status": "INITIATED"}
     """
-    logger.info(f"Retrying payment: transaction_id={transaction_id}")
-    try:
-        _auth(api_key)
-        result = {
-            "original_transaction_id": transaction_id,
-            "new_transaction_id": _uid("TXN"),
-            "status": "INITIATED",
-            "timestamp": _ts(),
-        }
-        logger.info(f"Payment retry initiated: {result['new_transaction_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error retrying payment: {e}")
-        raise
+    logger.info("Retrying payment: transaction_id=%s", transaction_id)
+    result = RetryResult(
+        original_transaction_id=transaction_id,
+        new_transaction_id=_uid("TXN"),
+        status="INITIATED",
+        timestamp=_ts(),
+    )
+    logger.info("Payment retry initiated: %s", result.new_transaction_id)
+    _invalidate()
+    return result
 
 
 @mcp.tool()
-def get_payment_receipt(api_key: str, transaction_id: str, format: str = "PDF") -> dict:
+@tool_handler
+def get_payment_receipt(api_key: str, transaction_id: str, format: str = "PDF") -> ReceiptResult:
     """
     Download payment receipt or acknowledgment.
 
@@ -240,22 +568,18 @@ def get_payment_receipt(api_key: str, transaction_id: str, format: str = "PDF")
         get_payment_receipt("key", "TXN123", "PDF")
         Returns: {"transaction_id": "TXN123", "download_url": "https://..."}
     """
-    logger.info(f"Fetching payment receipt: transaction_id={transaction_id}, format={format}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": transaction_id,
-            "format": format,
-            "download_url": f"https://bank.example.com/receipts/{transaction_id}.{format.lower()}",
-        }
-        logger.info(f"Receipt URL generated successfully")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching receipt: {e}")
-        raise
+    logger.info("Fetching payment receipt: transaction_id=%s, format=%s", transaction_id, format)
+    result = ReceiptResult(
+        transaction_id=transaction_id,
+        format=format,
+        download_url=_RECEIPT_URL(transaction_id, _FMT_EXT.get(format) or format.lower()),
+    )
+    logger.info("Receipt URL generated successfully")
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def validate_beneficiary(
     api_key: str,
     account_number: str = "",
@@ -278,20 +602,23 @@ def validate_beneficiary(
         validate_beneficiary("key", account_number="1234567890", ifsc_code="HDFC0001234")
         Returns: {"valid": True, "account_holder_name": "ABC Enterprises Pvt Ltd", ...}
     """
-    logger.info(f"Validating beneficiary: account={account_number}, upi={upi_id}")
-    try:
-        _auth(api_key)
+    logger.info("Validating beneficiary: account=%s, upi=%s", account_number, upi_id)
+    errors = []
+    if ifsc_code and not _IFSC_RE.match(ifsc_code.strip().upper()):
+        errors.append("Invalid IFSC format (expected e.g. HDFC0001234)")
+    if upi_id and not _UPI_RE.match(upi_id.strip()):
+        errors.append("Invalid UPI ID format (expected e.g. name@bank)")
+    if errors:
+        result = {"valid": False, "errors": errors}
+    else:
         result = {
             "valid": True,
             "account_holder_name": "ABC Enterprises Pvt Ltd",
             "bank": "HDFC Bank",
             "branch": "Mumbai Main",
         }
-        logger.info(f"Beneficiary validation result: {result['valid']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error validating beneficiary: {e}")
-        raise
+    logger.info("Beneficiary validation result: %s", result['valid'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
@@ -299,6 +626,7 @@ def validate_beneficiary(
 # ═══════════════════════════════════════════════════════════
 
 @mcp.tool()
+@tool_handler
 def upload_bulk_payment(
     api_key: str,
     file_name: str,
@@ -323,28 +651,30 @@ def upload_bulk_payment(
         upload_bulk_payment("key", "payments.csv", "base64...", "CSV")
         Returns: {"upload_id": "UPL...", "total_records": 150, "valid_records": 148, ...}
     """
-    logger.info(f"Uploading bulk payment file: {file_name}, format={file_format}")
-    try:
-        _auth(api_key)
-        result = {
-            "upload_id": _uid("UPL"),
-            "file_name": file_name,
-            "file_format": file_format,
-            "total_records": 150,
-            "valid_records": 148,
-            "invalid_records": 2,
-            "total_amount": 1500000,
-            "status": "VALIDATION_COMPLETE",
-            "payment_date": payment_date or "Immediate",
-        }
-        logger.info(f"Bulk upload processed: {result['upload_id']}, valid={result['valid_records']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error uploading bulk payment: {e}")
-        raise
-
-
-@mcp.tool()
+    logger.info("Uploading bulk payment file: %s, format=%s", file_name, file_format)
+    result = {
+        "upload_id": _uid("UPL"),
+        "file_name": file_name,
+        "file_format": file_format,
+        "total_records": 150,
+        "valid_records": 148,
+        "invalid_records": 2,
+        "total_amount": 1500000,
+        "status": "VALIDATION_COMPLETE",
+        "payment_date": payment_date or "Immediate",
+    }
+    if file_format.upper() == "CSV":
+        try:
+            result.update(_bulk_csv_summary(_b64decode(file_base64)))
+        except (ValueError, csv.Error) as e:   # not base64 / not a usable CSV
+            result.update(total_records=0, valid_records=0, invalid_records=0,
+                          total_amount=0, status="INVALID_FILE", error=str(e))
+    logger.info("Bulk upload processed: %s, valid=%s", result['upload_id'], result['valid_records'])
+    return result
+
+
+@mcp.tool()
+@tool_handler
 def validate_payment_file(api_key: str, upload_id: str) -> dict:
     """
     Validate an uploaded bulk payment file before processing.
@@ -360,20 +690,15 @@ def validate_payment_file(api_key: str, upload_id: str) -> dict:
         validate_payment_file("key", "UPL1234567890")
         Returns: {"upload_id": "UPL...", "validation_status": "PASSED", "errors": [], ...}
     """
-    logger.info(f"Validating payment file: upload_id={upload_id}")
-    try:
-        _auth(api_key)
-        result = {
-            "upload_id": upload_id,
-            "validation_status": "PASSED",
-            "errors": [],
-            "warnings": [{"row": 5, "message": "Duplicate entry detected"}],
-        }
-        logger.info(f"File validation status: {result['validation_status']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error validating payment file: {e}")
-        raise
+    logger.info("Validating payment file: upload_id=%s", upload_id)
+    result = {
+        "upload_id": upload_id,
+        "validation_status": "PASSED",
+        "errors": [],
+        "warnings": [{"row": 5, "message": "Duplicate entry detected"}],
+    }
+    logger.info("File validation status: %s", result['validation_status'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
@@ -381,6 +706,7 @@ def validate_payment_file(api_key: str, upload_id: str) -> dict:
 # ═══════════════════════════════════════════════════════════
 
 @mcp.tool()
+@tool_handler
 def onboard_business_partner(
     api_key: str,
     company_name: str,
@@ -411,26 +737,28 @@ def onboard_business_partner(
         onboard_business_partner("key", "XYZ Corp", "27ABCDE1234F1Z5", "ABCDE1234F", ...)
         Returns: {"partner_id": "PART...", "status": "ONBOARDED", "kyc_status": "VERIFIED"}
     """
-    logger.info(f"Onboarding business partner: {company_name}, GSTIN={gstin}")
-    try:
-        _auth(api_key)
-        result = {
-            "partner_id": _uid("PART"),
-            "company_name": company_name,
-            "gstin": gstin,
-            "pan": pan,
-            "status": "ONBOARDED",
-            "kyc_status": "VERIFIED",
-            "timestamp": _ts(),
-        }
-        logger.info(f"Partner onboarded: {result['partner_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error onboarding partner: {e}")
-        raise
-
-
-@mcp.tool()
+    logger.info("Onboarding business partner: %s, GSTIN=%s", company_name, gstin)
+    if not _GSTIN_RE.match(gstin.strip().upper()):
+        raise ValueError(f"Invalid GSTIN format: {gstin}")
+    if not _PAN_RE.match(pan.strip().upper()):
+        raise ValueError(f"Invalid PAN format: {pan}")
+    if ifsc_code and not _IFSC_RE.match(ifsc_code.strip().upper()):
+        raise ValueError(f"Invalid IFSC format: {ifsc_code}")
+    result = {
+        "partner_id": _uid("PART"),
+        "company_name": company_name,
+        "gstin": gstin,
+        "pan": pan,
+        "status": "ONBOARDED",
+        "kyc_status": "VERIFIED",
+        "timestamp": _ts(),
+    }
+    logger.info("Partner onboarded: %s", result['partner_id'])
+    return result
+
+
+@mcp.tool()
+@tool_handler
 def send_invoice(
     api_key: str,
     partner_id: str,
@@ -459,27 +787,29 @@ def send_invoice(
         send_invoice("key", "PART001", "INV-2026-001", "2026-02-01", "2026-03-01", 100000, 18000)
         Returns: {"invoice_id": "INV...", "status": "SENT", "sent_at": "..."}
     """
-    logger.info(f"Sending invoice: partner={partner_id}, invoice={invoice_number}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "invoice_id": _uid("INV"),
-            "partner_id": partner_id,
-            "invoice_number": invoice_number,
-            "amount": amount,
-            "gst_amount": gst_amount,
-            "total_amount": amount + gst_amount,
-            "status": "SENT",
-            "sent_at": _ts(),
-        }
-        logger.info(f"Invoice sent: {result['invoice_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error sending invoice: {e}")
-        raise
+    logger.info("Sending invoice: partner=%s, invoice=%s, amount=%s", partner_id, invoice_number, amount)
+    result = {
+        "invoice_id": _uid("INV"),
+        "partner_id": partner_id,
+        "invoice_number": invoice_number,
+        "amount": amount,
+        "gst_amount": gst_amount,
+        "total_amount": amount + gst_amount,
+        "status": "SENT",
+        "sent_at": _ts(),
+    }
+    logger.info("Invoice sent: %s", result['invoice_id'])
+    return result
+
+
+_RECEIVED_INVOICES = (
+    {"invoice_id": "INV001", "partner": "XYZ Corp", "amount": 120000, "due_date": "2026-03-15", "status": "PENDING"},
+    {"invoice_id": "INV002", "partner": "ABC Ltd",  "amount":  85000, "due_date": "2026-02-28", "status": "OVERDUE"},
+)
 
 
 @mcp.tool()
+@tool_handler
 def get_received_invoices(
     api_key: str,
     status: str = "ALL",
@@ -504,24 +834,17 @@ def get_received_invoices(
         get_received_invoices("key", status="PENDING")
         Returns: {"total": 25, "invoices": [...]}
     """
-    logger.info(f"Fetching received invoices: status={status}")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 25,
-            "invoices": [
-                {"invoice_id": "INV001", "partner": "XYZ Corp", "amount": 120000, "due_date": "2026-03-15", "status": "PENDING"},
-                {"invoice_id": "INV002", "partner": "ABC Ltd",  "amount":  85000, "due_date": "2026-02-28", "status": "OVERDUE"},
-            ],
-        }
-        logger.info(f"Received invoices fetched: total={result['total']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching received invoices: {e}")
-        raise
+    logger.info("Fetching received invoices: status=%s", status)
+    result = {
+        "total": 25,
+        "invoices": _RECEIVED_INVOICES,
+    }
+    logger.info("Received invoices fetched: total=%s", result['total'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def acknowledge_payment(
     api_key: str,
     invoice_id: str,
@@ -544,24 +867,20 @@ def acknowledge_payment(
         acknowledge_payment("key", "INV001", "TXN123")
         Returns: {"acknowledgment_id": "ACK...", "status": "ACKNOWLEDGED", ...}
     """
-    logger.info(f"Acknowledging payment: invoice={invoice_id}, txn={transaction_id}")
-    try:
-        _auth(api_key)
-        result = {
-            "acknowledgment_id": _uid("ACK"),
-            "invoice_id": invoice_id,
-            "transaction_id": transaction_id,
-            "status": "ACKNOWLEDGED",
-            "sent_at": _ts(),
-        }
-        logger.info(f"Payment acknowledged: {result['acknowledgment_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error acknowledging payment: {e}")
-        raise
+    logger.info("Acknowledging payment: invoice=%s, txn=%s", invoice_id, transaction_id)
+    result = {
+        "acknowledgment_id": _uid("ACK"),
+        "invoice_id": invoice_id,
+        "transaction_id": transaction_id,
+        "status": "ACKNOWLEDGED",
+        "sent_at": _ts(),
+    }
+    logger.info("Payment acknowledged: %s", result['acknowledgment_id'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def create_proforma_invoice(
     api_key: str,
     partner_id: str,
@@ -586,25 +905,21 @@ def create_proforma_invoice(
         create_proforma_invoice("key", "PART001", "2026-03-31", 100000, "IT Services")
         Returns: {"proforma_id": "PFI...", "status": "CREATED"}
     """
-    logger.info(f"Creating proforma invoice: partner={partner_id}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "proforma_id": _uid("PFI"),
-            "partner_id": partner_id,
-            "amount": amount,
-            "description": description,
-            "validity_date": validity_date,
-            "status": "CREATED",
-        }
-        logger.info(f"Proforma invoice created: {result['proforma_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error creating proforma invoice: {e}")
-        raise
+    logger.info("Creating proforma invoice: partner=%s, amount=%s", partner_id, amount)
+    result = {
+        "proforma_id": _uid("PFI"),
+        "partner_id": partner_id,
+        "amount": amount,
+        "description": description,
+        "validity_date": validity_date,
+        "status": "CREATED",
+    }
+    logger.info("Proforma invoice created: %s", result['proforma_id'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def create_cd_note(
     api_key: str,
     partner_id: str,
@@ -631,26 +946,22 @@ def create_cd_note(
         create_cd_note("key", "PART001", "CREDIT", "INV001", 5000, "Return of goods")
         Returns: {"note_id": "CDN...", "note_type": "CREDIT", "status": "CREATED"}
     """
-    logger.info(f"Creating CD note: partner={partner_id}, type={note_type}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "note_id": _uid("CDN"),
-            "partner_id": partner_id,
-            "note_type": note_type,
-            "original_invoice_id": original_invoice_id,
-            "amount": amount,
-            "reason": reason,
-            "status": "CREATED",
-        }
-        logger.info(f"CD note created: {result['note_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error creating CD note: {e}")
-        raise
+    logger.info("Creating CD note: partner=%s, type=%s, amount=%s", partner_id, note_type, amount)
+    result = {
+        "note_id": _uid("CDN"),
+        "partner_id": partner_id,
+        "note_type": note_type,
+        "original_invoice_id": original_invoice_id,
+        "amount": amount,
+        "reason": reason,
+        "status": "CREATED",
+    }
+    logger.info("CD note created: %s", result['note_id'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def create_purchase_order(
     api_key: str,
     partner_id: str,
@@ -677,30 +988,32 @@ def create_purchase_order(
         create_purchase_order("key", "PART001", "2026-02-26", "2026-03-15", 200000, "Office supplies")
         Returns: {"po_id": "PO...", "status": "RAISED"}
     """
-    logger.info(f"Creating purchase order: partner={partner_id}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "po_id": _uid("PO"),
-            "partner_id": partner_id,
-            "amount": amount,
-            "po_date": po_date,
-            "delivery_date": delivery_date,
-            "description": description,
-            "status": "RAISED",
-        }
-        logger.info(f"Purchase order created: {result['po_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error creating purchase order: {e}")
-        raise
+    logger.info("Creating purchase order: partner=%s, amount=%s", partner_id, amount)
+    result = {
+        "po_id": _uid("PO"),
+        "partner_id": partner_id,
+        "amount": amount,
+        "po_date": po_date,
+        "delivery_date": delivery_date,
+        "description": description,
+        "status": "RAISED",
+    }
+    logger.info("Purchase order created: %s", result['po_id'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # 4. INSURANCE
 # ═══════════════════════════════════════════════════════════
 
+_INSURANCE_DUES = (
+    {"policy_number": "POL001", "insurer": "LIC",      "premium": 25000, "due_date": "2026-03-01", "type": "Life"},
+    {"policy_number": "POL002", "insurer": "New India", "premium": 18000, "due_date": "2026-03-10", "type": "Health"},
+)
+
+
 @mcp.tool()
+@tool_handler
 def fetch_insurance_dues(api_key: str, policy_number: str = "") -> dict:
     """
     Check upcoming insurance premium dues for all or a specific policy.
@@ -716,23 +1029,16 @@ def fetch_insurance_dues(api_key: str, policy_number: str = "") -> dict:
         fetch_insurance_dues("key")
         Returns: {"dues": [{"policy_number": "POL001", "premium": 25000, "due_date": "2026-03-01", ...}]}
     """
-    logger.info(f"Fetching insurance dues: policy={policy_number or 'ALL'}")
-    try:
-        _auth(api_key)
-        result = {
-            "dues": [
-                {"policy_number": "POL001", "insurer": "LIC",      "premium": 25000, "due_date": "2026-03-01", "type": "Life"},
-                {"policy_number": "POL002", "insurer": "New India", "premium": 18000, "due_date": "2026-03-10", "type": "Health"},
-            ]
-        }
-        logger.info(f"Insurance dues fetched: {len(result['dues'])} policies")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching insurance dues: {e}")
-        raise
+    logger.info("Fetching insurance dues: policy=%s", policy_number or 'ALL')
+    result = {
+        "dues": _INSURANCE_DUES
+    }
+    logger.info("Insurance dues fetched: %s policies", len(result['dues']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def pay_insurance_premium(
     api_key: str,
     policy_number: str,
@@ -755,25 +1061,22 @@ def pay_insurance_premium(
         pay_insurance_premium("key", "POL001", 25000, "IMPS")
         Returns: {"transaction_id": "TXN...", "policy_number": "POL001", "status": "SUCCESS"}
     """
-    logger.info(f"Paying insurance premium: policy={policy_number}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "policy_number": policy_number,
-            "amount": amount,
-            "payment_mode": payment_mode,
-            "status": "SUCCESS",
-            "timestamp": _ts(),
-        }
-        logger.info(f"Insurance premium paid: {result['transaction_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error paying insurance premium: {e}")
-        raise
+    logger.info("Paying insurance premium: policy=%s, amount=%s", policy_number, amount)
+    result = {
+        "transaction_id": _uid("TXN"),
+        "policy_number": policy_number,
+        "amount": amount,
+        "payment_mode": payment_mode,
+        "status": "SUCCESS",
+        "timestamp": _ts(),
+    }
+    logger.info("Insurance premium paid: %s", result['transaction_id'])
+    _invalidate()
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_insurance_payment_history(
     api_key: str,
     from_date: str = "",
@@ -796,25 +1099,27 @@ def get_insurance_payment_history(
         get_insurance_payment_history("key", from_date="2026-01-01")
         Returns: {"total": 12, "payments": [...]}
     """
-    logger.info(f"Fetching insurance payment history: policy={policy_number or 'ALL'}")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 12,
-            "payments": [{"policy_number": "POL001", "amount": 25000, "paid_on": "2026-01-01", "status": "SUCCESS"}],
-        }
-        logger.info(f"Insurance payment history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching insurance history: {e}")
-        raise
+    logger.info("Fetching insurance payment history: policy=%s", policy_number or 'ALL')
+    result = {
+        "total": 12,
+        "payments": [{"policy_number": "POL001", "amount": 25000, "paid_on": "2026-01-01", "status": "SUCCESS"}],
+    }
+    logger.info("Insurance payment history fetched: %s records", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # 5. BANK STATEMENT
 # ═══════════════════════════════════════════════════════════
 
+_STATEMENT_TRANSACTIONS = (
+    {"date": "2026-02-01", "description": "NEFT Credit",   "amount": 100000, "type": "CREDIT", "balance": 600000},
+    {"date": "2026-02-05", "description": "Vendor Payment", "amount":  50000, "type": "DEBIT",  "balance": 550000},
+)
+
+
 @mcp.tool()
+@tool_handler
 def fetch_bank_statement(
     api_key: str,
     account_number: str,
@@ -837,30 +1142,23 @@ def fetch_bank_statement(
         fetch_bank_statement("key", "1234567890", "2026-02-01", "2026-02-28")
         Returns: {"opening_balance": 500000, "closing_balance": 650000, "transactions": [...]}
     """
-    logger.info(f"Fetching bank statement: account={account_number}, {from_date} to {to_date}")
-    try:
-        _auth(api_key)
-        result = {
-            "account_number": account_number,
-            "from_date": from_date,
-            "to_date": to_date,
-            "opening_balance": 500000,
-            "closing_balance": 650000,
-            "total_credits": 300000,
-            "total_debits": 150000,
-            "transactions": [
-                {"date": "2026-02-01", "description": "NEFT Credit",   "amount": 100000, "type": "CREDIT", "balance": 600000},
-                {"date": "2026-02-05", "description": "Vendor Payment", "amount":  50000, "type": "DEBIT",  "balance": 550000},
-            ],
-        }
-        logger.info(f"Bank statement fetched: {len(result['transactions'])} transactions")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching bank statement: {e}")
-        raise
+    logger.info("Fetching bank statement: account=%s, %s to %s", account_number, from_date, to_date)
+    result = {
+        "account_number": account_number,
+        "from_date": from_date,
+        "to_date": to_date,
+        "opening_balance": 500000,
+        "closing_balance": 650000,
+        "total_credits": 300000,
+        "total_debits": 150000,
+        "transactions": _STATEMENT_TRANSACTIONS,
+    }
+    logger.info("Bank statement fetched: %s transactions", len(result['transactions']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def download_bank_statement(
     api_key: str,
     account_number: str,
@@ -885,21 +1183,17 @@ def download_bank_statement(
         download_bank_statement("key", "1234567890", "2026-02-01", "2026-02-28", "PDF")
         Returns: {"download_url": "https://...", "format": "PDF"}
     """
-    logger.info(f"Generating statement download: account={account_number}, format={format}")
-    try:
-        _auth(api_key)
-        result = {
-            "download_url": f"https://bank.example.com/statements/{account_number}_{from_date}_{to_date}.{format.lower()}",
-            "format": format,
-        }
-        logger.info(f"Statement download URL generated")
-        return result
-    except Exception as e:
-        logger.error(f"Error generating statement download: {e}")
-        raise
+    logger.info("Generating statement download: account=%s, format=%s", account_number, format)
+    result = {
+        "download_url": f"https://bank.example.com/statements/{account_number}_{from_date}_{to_date}.{_FMT_EXT.get(format) or format.lower()}",
+        "format": format,
+    }
+    logger.info("Statement download URL generated")
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_account_balance(api_key: str, account_number: str) -> dict:
     """
     Get real-time account balance.
@@ -915,24 +1209,37 @@ def get_account_balance(api_key: str, account_number: str) -> dict:
         get_account_balance("key", "1234567890")
         Returns: {"account_number": "1234567890", "available_balance": 650000, "current_balance": 660000}
     """
-    logger.info(f"Fetching account balance: account={account_number}")
-    try:
-        _auth(api_key)
-        result = {
-            "account_number": account_number,
-            "available_balance": 650000,
-            "current_balance": 660000,
-            "currency": "INR",
-            "as_of": _ts(),
-        }
-        logger.info(f"Balance fetched: available={result['available_balance']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching account balance: {e}")
-        raise
-
-
-@mcp.tool()
+    logger.info("Fetching account balance: account=%s", account_number)
+    result = {
+        "account_number": account_number,
+        "available_balance": 650000,
+        "current_balance": 660000,
+        "currency": "INR",
+        "as_of": _ts(),
+    }
+    logger.info("Balance fetched: available=%s", result['available_balance'])
+    return result
+
+
+_TXN_HISTORY_ROWS = (
+    {"date": "2026-03-03", "description": "Vendor Payment — Infosys Ltd",         "amount": 250000,  "type": "DEBIT",  "mode": "NEFT", "balance": 650000,  "status": "SUCCESS"},
+    {"date": "2026-03-02", "description": "GST Payment — GSTIN 27AABCU9603R1ZX",  "amount": 125000,  "type": "DEBIT",  "mode": "RTGS", "balance": 900000,  "status": "SUCCESS"},
+    {"date": "2026-03-01", "description": "Client Receipt — Tata Motors",         "amount": 500000,  "type": "CREDIT", "mode": "IMPS", "balance": 1025000, "status": "SUCCESS"},
+    {"date": "2026-02-28", "description": "EPF Contribution — Feb 2026",          "amount": 192100,  "type": "DEBIT",  "mode": "NEFT", "balance": 525000,  "status": "SUCCESS"},
+    {"date": "2026-02-27", "description": "ESIC Contribution — Feb 2026",         "amount": 83750,   "type": "DEBIT",  "mode": "NEFT", "balance": 717100,  "status": "SUCCESS"},
+    {"date": "2026-02-26", "description": "Insurance Premium — HDFC Ergo",        "amount": 25000,   "type": "DEBIT",  "mode": "UPI",  "balance": 800850,  "status": "SUCCESS"},
+    {"date": "2026-02-25", "description": "Payroll Disbursement — Feb 2026",      "amount": 1850000, "type": "DEBIT",  "mode": "RTGS", "balance": 825850,  "status": "SUCCESS"},
+    {"date": "2026-02-24", "description": "Client Receipt — Reliance Industries", "amount": 750000,  "type": "CREDIT", "mode": "RTGS", "balance": 2675850, "status": "SUCCESS"},
+    {"date": "2026-02-23", "description": "TDS Payment — Q3 2025-26",             "amount": 450000,  "type": "DEBIT",  "mode": "NEFT", "balance": 1925850, "status": "SUCCESS"},
+    {"date": "2026-02-22", "description": "Custom Duty — BOE2026021501",          "amount": 320000,  "type": "DEBIT",  "mode": "RTGS", "balance": 2375850, "status": "SUCCESS"},
+    {"date": "2026-02-21", "description": "Vendor Payment — Wipro Ltd",           "amount": 180000,  "type": "DEBIT",  "mode": "NEFT", "balance": 2695850, "status": "SUCCESS"},
+    {"date": "2026-02-20", "description": "Client Receipt — L&T Engineering",     "amount": 620000,  "type": "CREDIT", "mode": "IMPS", "balance": 2875850, "status": "SUCCESS"},
+)
+
+
+@mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_transaction_history(
     api_key: str,
     account_number: str,
@@ -959,46 +1266,42 @@ def get_transaction_history(
         get_transaction_history("key", "1234567890", txn_type="CREDIT", limit=20)
         Returns: {"account_number": "...", "total": 120, "transactions": [...]}
     """
-    logger.info(f"Fetching transaction history: account={account_number}, type={txn_type}, limit={limit}")
-    try:
-        _auth(api_key)
-        all_transactions = [
-            {"txn_id": _uid("TXN"), "date": "2026-03-03", "description": "Vendor Payment — Infosys Ltd",         "amount": 250000,  "type": "DEBIT",  "mode": "NEFT", "balance": 650000,  "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-03-02", "description": "GST Payment — GSTIN 27AABCU9603R1ZX",  "amount": 125000,  "type": "DEBIT",  "mode": "RTGS", "balance": 900000,  "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-03-01", "description": "Client Receipt — Tata Motors",         "amount": 500000,  "type": "CREDIT", "mode": "IMPS", "balance": 1025000, "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-28", "description": "EPF Contribution — Feb 2026",          "amount": 192100,  "type": "DEBIT",  "mode": "NEFT", "balance": 525000,  "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-27", "description": "ESIC Contribution — Feb 2026",         "amount": 83750,   "type": "DEBIT",  "mode": "NEFT", "balance": 717100,  "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-26", "description": "Insurance Premium — HDFC Ergo",        "amount": 25000,   "type": "DEBIT",  "mode": "UPI",  "balance": 800850,  "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-25", "description": "Payroll Disbursement — Feb 2026",      "amount": 1850000, "type": "DEBIT",  "mode": "RTGS", "balance": 825850,  "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-24", "description": "Client Receipt — Reliance Industries", "amount": 750000,  "type": "CREDIT", "mode": "RTGS", "balance": 2675850, "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-23", "description": "TDS Payment — Q3 2025-26",             "amount": 450000,  "type": "DEBIT",  "mode": "NEFT", "balance": 1925850, "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-22", "description": "Custom Duty — BOE2026021501",          "amount": 320000,  "type": "DEBIT",  "mode": "RTGS", "balance": 2375850, "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-21", "description": "Vendor Payment — Wipro Ltd",           "amount": 180000,  "type": "DEBIT",  "mode": "NEFT", "balance": 2695850, "status": "SUCCESS"},
-            {"txn_id": _uid("TXN"), "date": "2026-02-20", "description": "Client Receipt — L&T Engineering",     "amount": 620000,  "type": "CREDIT", "mode": "IMPS", "balance": 2875850, "status": "SUCCESS"},
-        ]
-        if txn_type != "ALL":
-            all_transactions = [t for t in all_transactions if t["type"] == txn_type]
-        transactions = all_transactions[:limit]
-        result = {
-            "account_number": account_number,
-            "total":          120,
-            "returned":       len(transactions),
-            "from_date":      from_date or "2026-02-01",
-            "to_date":        to_date   or "2026-03-04",
-            "transactions":   transactions,
-        }
-        logger.info(f"Transaction history fetched: {result['total']} total, returning {result['returned']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching transaction history: {e}")
-        raise
+    logger.info("Fetching transaction history: account=%s, type=%s, limit=%s", account_number, txn_type, limit)
+    rows = _TXN_HISTORY_ROWS
+    if txn_type != "ALL":
+        rows = [t for t in rows if t["type"] == txn_type]
+    # Only the returned rows get a fresh txn_id
+    transactions = [{"txn_id": _uid("TXN"), **t} for t in rows[:limit]]
+    result = {
+        "account_number": account_number,
+        "total":          120,
+        "returned":       len(transactions),
+        "from_date":      from_date or "2026-02-01",
+        "to_date":        to_date   or "2026-03-04",
+        "transactions":   transactions,
+    }
+    logger.info("Transaction history fetched: %s total, returning %s", result['total'], result['returned'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # 6. CUSTOM / SEZ
 # ═══════════════════════════════════════════════════════════
 
+@dataclass(slots=True)
+class CustomDutyPayment:
+    transaction_id: str
+    bill_of_entry_number: str
+    amount: float
+    port_code: str
+    importer_code: str
+    status: str
+    challan_number: str
+    timestamp: str
+
+
 @mcp.tool()
+@tool_handler
 def pay_custom_duty(
     api_key: str,
     bill_of_entry_number: str,
@@ -1006,7 +1309,7 @@ def pay_custom_duty(
     port_code: str,
     importer_code: str,
     payment_mode: str = "NEFT",
-) -> dict:
+) -> CustomDutyPayment:
     """
     Pay custom duty instantly with complete tracking.
 
@@ -1025,27 +1328,49 @@ def pay_custom_duty(
         pay_custom_duty("key", "BOE12345", 250000, "INMAA1", "IEC001", "NEFT")
         Returns: {"transaction_id": "TXN...", "challan_number": "CHAL...", "status": "SUCCESS"}
     """
-    logger.info(f"Paying custom duty: BOE={bill_of_entry_number}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "bill_of_entry_number": bill_of_entry_number,
-            "amount": amount,
-            "port_code": port_code,
-            "importer_code": importer_code,
-            "status": "SUCCESS",
-            "challan_number": _uid("CHAL"),
-            "timestamp": _ts(),
-        }
-        logger.info(f"Custom duty paid: {result['transaction_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error paying custom duty: {e}")
-        raise
+    logger.info("Paying custom duty: BOE=%s, amount=%s", bill_of_entry_number, amount)
+    result = CustomDutyPayment(
+        transaction_id=_uid("TXN"),
+        bill_of_entry_number=bill_of_entry_number,
+        amount=amount,
+        port_code=port_code,
+        importer_code=importer_code,
+        status="SUCCESS",
+        challan_number=_uid("CHAL"),
+        timestamp=_ts(),
+    )
+    logger.info("Custom duty paid: %s", result.transaction_id)
+    _invalidate("get_custom_duty_history", importer_code=importer_code)
+    return result
 
 
 @mcp.tool()
+@tool_handler
+def pay_custom_duty_bulk(api_key: str, payments: List[dict]) -> dict:
+    """
+    Make several custom duty payments in one request with a single authentication.
+
+    Args:
+        api_key: Master backend API key for authentication.
+        payments: List of pay_custom_duty arguments (without api_key) — bill_of_entry_number, amount, port_code, importer_code, payment_mode.
+
+    Returns:
+        Dictionary with batch ID, success/failure counts, total amount, and one
+        pay_custom_duty result (or error) per record, in order.
+
+    Example:
+        pay_custom_duty_bulk("key", [{"bill_of_entry_number": "BOE123", "amount": 45000, "port_code": "INMAA1", "importer_code": "IEC001"}])
+        Returns: {"batch_id": "BATCH...", "total_records": 1, "succeeded": 1, "failed": 0, ...}
+    """
+    logger.info("Processing bulk custom duty payment: records=%d", len(payments))
+    result = _pay_bulk("pay_custom_duty", api_key, payments)
+    logger.info("Bulk custom duty processed: %s, succeeded=%s", result['batch_id'], result['succeeded'])
+    return result
+
+
+@mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def track_custom_duty_payment(api_key: str, transaction_id: str) -> dict:
     """
     Track custom duty payment status.
@@ -1061,23 +1386,25 @@ def track_custom_duty_payment(api_key: str, transaction_id: str) -> dict:
         track_custom_duty_payment("key", "TXN123")
         Returns: {"transaction_id": "TXN123", "status": "CLEARED", "challan_number": "CHAL..."}
     """
-    logger.info(f"Tracking custom duty payment: transaction_id={transaction_id}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": transaction_id,
-            "status": "CLEARED",
-            "challan_number": "CHAL123456",
-            "cleared_at": _ts(),
-        }
-        logger.info(f"Custom duty status: {result['status']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error tracking custom duty payment: {e}")
-        raise
+    logger.info("Tracking custom duty payment: transaction_id=%s", transaction_id)
+    result = {
+        "transaction_id": transaction_id,
+        "status": "CLEARED",
+        "challan_number": "CHAL123456",
+        "cleared_at": _ts(),
+    }
+    logger.info("Custom duty status: %s", result['status'])
+    return result
+
+
+_CUSTOM_DUTY_PAYMENTS = (
+    {"transaction_id": "TXN001", "amount": 250000, "status": "CLEARED", "paid_on": "2026-01-15"},
+)
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_custom_duty_history(
     api_key: str,
     from_date: str = "",
@@ -1100,25 +1427,40 @@ def get_custom_duty_history(
         get_custom_duty_history("key", from_date="2026-01-01")
         Returns: {"total": 8, "payments": [...]}
     """
-    logger.info(f"Fetching custom duty history: IEC={importer_code or 'ALL'}")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 8,
-            "payments": [{"transaction_id": "TXN001", "amount": 250000, "status": "CLEARED", "paid_on": "2026-01-15"}],
-        }
-        logger.info(f"Custom duty history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching custom duty history: {e}")
-        raise
+    logger.info("Fetching custom duty history: IEC=%s", importer_code or 'ALL')
+    result = {
+        "total": 8,
+        "payments": _CUSTOM_DUTY_PAYMENTS,
+    }
+    logger.info("Custom duty history fetched: %s records", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # 7. GST
 # ═══════════════════════════════════════════════════════════
 
+@dataclass(slots=True)
+class GSTPayment:
+    transaction_id: str
+    gstin: str
+    challan_number: str
+    amount: float
+    tax_type: str
+    status: str
+    payment_reference: str
+    timestamp: str
+
+
+_GST_DUES = (
+    {"return_type": "GSTR3B", "period": "Jan 2026", "amount": 125000, "due_date": "2026-02-20", "status": "PENDING"},
+    {"return_type": "GSTR1",  "period": "Jan 2026", "amount": 0,      "due_date": "2026-02-11", "status": "FILED"},
+)
+
+
 @mcp.tool()
+@tool_handler
+@coalesce()
 def fetch_gst_dues(api_key: str, gstin: str, return_type: str = "ALL") -> dict:
     """
     Fetch pending GST dues from GSTN portal.
@@ -1135,24 +1477,17 @@ def fetch_gst_dues(api_key: str, gstin: str, return_type: str = "ALL") -> dict:
         fetch_gst_dues("key", "27ABCDE1234F1Z5", "GSTR3B")
         Returns: {"gstin": "...", "dues": [{"return_type": "GSTR3B", "amount": 125000, ...}]}
     """
-    logger.info(f"Fetching GST dues: GSTIN={gstin}, type={return_type}")
-    try:
-        _auth(api_key)
-        result = {
-            "gstin": gstin,
-            "dues": [
-                {"return_type": "GSTR3B", "period": "Jan 2026", "amount": 125000, "due_date": "2026-02-20", "status": "PENDING"},
-                {"return_type": "GSTR1",  "period": "Jan 2026", "amount": 0,      "due_date": "2026-02-11", "status": "FILED"},
-            ],
-        }
-        logger.info(f"GST dues fetched: {len(result['dues'])} returns")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching GST dues: {e}")
-        raise
+    logger.info("Fetching GST dues: GSTIN=%s, type=%s", gstin, return_type)
+    result = {
+        "gstin": gstin,
+        "dues": _GST_DUES,
+    }
+    logger.info("GST dues fetched: %s returns", len(result['dues']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def pay_gst(
     api_key: str,
     gstin: str,
@@ -1160,7 +1495,7 @@ def pay_gst(
     amount: float,
     tax_type: str,
     payment_mode: str = "NEFT",
-) -> dict:
+) -> GSTPayment:
     """
     Pay GST directly from bank account.
 
@@ -1179,27 +1514,48 @@ def pay_gst(
         pay_gst("key", "27ABCDE1234F1Z5", "CPIN001", 125000, "CGST", "NEFT")
         Returns: {"transaction_id": "TXN...", "status": "SUCCESS", "payment_reference": "PAY..."}
     """
-    logger.info(f"Paying GST: GSTIN={gstin}, challan={challan_number}, amount={amount}, type={tax_type}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "gstin": gstin,
-            "challan_number": challan_number,
-            "amount": amount,
-            "tax_type": tax_type,
-            "status": "SUCCESS",
-            "payment_reference": _uid("PAY"),
-            "timestamp": _ts(),
-        }
-        logger.info(f"GST paid successfully: {result['transaction_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error paying GST: {e}")
-        raise
+    logger.info("Paying GST: GSTIN=%s, challan=%s, amount=%s, type=%s", gstin, challan_number, amount, tax_type)
+    result = GSTPayment(
+        transaction_id=_uid("TXN"),
+        gstin=gstin,
+        challan_number=challan_number,
+        amount=amount,
+        tax_type=tax_type,
+        status="SUCCESS",
+        payment_reference=_uid("PAY"),
+        timestamp=_ts(),
+    )
+    logger.info("GST paid successfully: %s", result.transaction_id)
+    _invalidate("fetch_gst_dues", "get_gst_payment_history", gstin=gstin)
+    return result
 
 
 @mcp.tool()
+@tool_handler
+def pay_gst_bulk(api_key: str, payments: List[dict]) -> dict:
+    """
+    Make several GST payments in one request with a single authentication.
+
+    Args:
+        api_key: Master backend API key for authentication.
+        payments: List of pay_gst arguments (without api_key) — gstin, challan_number, amount, tax_type, payment_mode.
+
+    Returns:
+        Dictionary with batch ID, success/failure counts, total amount, and one
+        pay_gst result (or error) per record, in order.
+
+    Example:
+        pay_gst_bulk("key", [{"gstin": "27AAPFU0939F1ZV", "challan_number": "CPIN123", "amount": 50000, "tax_type": "IGST"}])
+        Returns: {"batch_id": "BATCH...", "total_records": 1, "succeeded": 1, "failed": 0, ...}
+    """
+    logger.info("Processing bulk GST payment: records=%d", len(payments))
+    result = _pay_bulk("pay_gst", api_key, payments)
+    logger.info("Bulk GST processed: %s, succeeded=%s", result['batch_id'], result['succeeded'])
+    return result
+
+
+@mcp.tool()
+@tool_handler
 def create_gst_challan(
     api_key: str,
     gstin: str,
@@ -1228,30 +1584,32 @@ def create_gst_challan(
         create_gst_challan("key", "27ABCDE1234F1Z5", "012026", cgst=62500, sgst=62500)
         Returns: {"cpin": "CPIN...", "total_amount": 125000, "valid_until": "2026-03-15"}
     """
-    logger.info(f"Creating GST challan: GSTIN={gstin}, period={return_period}")
-    try:
-        _auth(api_key)
-        total = igst + cgst + sgst + cess
-        result = {
-            "cpin": _uid("CPIN"),
-            "gstin": gstin,
-            "return_period": return_period,
-            "igst": igst,
-            "cgst": cgst,
-            "sgst": sgst,
-            "cess": cess,
-            "total_amount": total,
-            "valid_until": "2026-03-15",
-            "status": "CREATED",
-        }
-        logger.info(f"GST challan created: {result['cpin']}, total={result['total_amount']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error creating GST challan: {e}")
-        raise
+    logger.info("Creating GST challan: GSTIN=%s, period=%s", gstin, return_period)
+    total = igst + cgst + sgst + cess
+    result = {
+        "cpin": _uid("CPIN"),
+        "gstin": gstin,
+        "return_period": return_period,
+        "igst": igst,
+        "cgst": cgst,
+        "sgst": sgst,
+        "cess": cess,
+        "total_amount": total,
+        "valid_until": "2026-03-15",
+        "status": "CREATED",
+    }
+    logger.info("GST challan created: %s, total=%s", result['cpin'], result['total_amount'])
+    return result
+
+
+_GST_PAYMENTS = (
+    {"cpin": "CPIN001", "amount": 120000, "paid_on": "2026-01-20", "status": "SUCCESS"},
+)
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_gst_payment_history(
     api_key: str,
     gstin: str,
@@ -1274,26 +1632,34 @@ def get_gst_payment_history(
         get_gst_payment_history("key", "27ABCDE1234F1Z5", from_date="2026-01-01")
         Returns: {"gstin": "...", "total": 12, "payments": [...]}
     """
-    logger.info(f"Fetching GST payment history: GSTIN={gstin}")
-    try:
-        _auth(api_key)
-        result = {
-            "gstin": gstin,
-            "total": 12,
-            "payments": [{"cpin": "CPIN001", "amount": 120000, "paid_on": "2026-01-20", "status": "SUCCESS"}],
-        }
-        logger.info(f"GST payment history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching GST payment history: {e}")
-        raise
+    logger.info("Fetching GST payment history: GSTIN=%s", gstin)
+    result = {
+        "gstin": gstin,
+        "total": 12,
+        "payments": _GST_PAYMENTS,
+    }
+    logger.info("GST payment history fetched: %s records", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # 8. ESIC
 # ═══════════════════════════════════════════════════════════
 
+@dataclass(slots=True)
+class ESICPayment:
+    transaction_id: str
+    establishment_code: str
+    month: str
+    amount: float
+    status: str
+    challan_number: str
+    timestamp: str
+
+
 @mcp.tool()
+@tool_handler
+@coalesce()
 def fetch_esic_dues(api_key: str, establishment_code: str, month: str) -> dict:
     """
     Fetch ESIC contribution dues for a given month.
@@ -1310,33 +1676,29 @@ def fetch_esic_dues(api_key: str, establishment_code: str, month: str) -> dict:
         fetch_esic_dues("key", "EST001", "02-2026")
         Returns: {"total_due": 83750, "due_date": "2026-03-15", ...}
     """
-    logger.info(f"Fetching ESIC dues: establishment={establishment_code}, month={month}")
-    try:
-        _auth(api_key)
-        result = {
-            "establishment_code": establishment_code,
-            "month": month,
-            "employee_count": 85,
-            "employer_contribution": 62500,
-            "employee_contribution": 21250,
-            "total_due": 83750,
-            "due_date": "2026-03-15",
-        }
-        logger.info(f"ESIC dues fetched: total={result['total_due']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching ESIC dues: {e}")
-        raise
+    logger.info("Fetching ESIC dues: establishment=%s, month=%s", establishment_code, month)
+    result = {
+        "establishment_code": establishment_code,
+        "month": month,
+        "employee_count": 85,
+        "employer_contribution": 62500,
+        "employee_contribution": 21250,
+        "total_due": 83750,
+        "due_date": "2026-03-15",
+    }
+    logger.info("ESIC dues fetched: total=%s", result['total_due'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def pay_esic(
     api_key: str,
     establishment_code: str,
     month: str,
     amount: float,
     payment_mode: str = "NEFT",
-) -> dict:
+) -> ESICPayment:
     """
     Pay ESIC contribution for a given month.
 
@@ -1354,26 +1716,53 @@ def pay_esic(
         pay_esic("key", "EST001", "02-2026", 83750, "NEFT")
         Returns: {"transaction_id": "TXN...", "challan_number": "ESIC...", "status": "SUCCESS"}
     """
-    logger.info(f"Paying ESIC: establishment={establishment_code}, month={month}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "establishment_code": establishment_code,
-            "month": month,
-            "amount": amount,
-            "status": "SUCCESS",
-            "challan_number": _uid("ESIC"),
-            "timestamp": _ts(),
-        }
-        logger.info(f"ESIC paid: {result['transaction_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error paying ESIC: {e}")
-        raise
+    logger.info("Paying ESIC: establishment=%s, month=%s, amount=%s", establishment_code, month, amount)
+    result = ESICPayment(
+        transaction_id=_uid("TXN"),
+        establishment_code=establishment_code,
+        month=month,
+        amount=amount,
+        status="SUCCESS",
+        challan_number=_uid("ESIC"),
+        timestamp=_ts(),
+    )
+    logger.info("ESIC paid: %s", result.transaction_id)
+    _invalidate("fetch_esic_dues", "get_esic_payment_history", establishment_code=establishment_code)
+    return result
+
+
+@mcp.tool()
+@tool_handler
+def pay_esic_bulk(api_key: str, payments: List[dict]) -> dict:
+    """
+    Make several ESIC contributions in one request with a single authentication.
+
+    Args:
+        api_key: Master backend API key for authentication.
+        payments: List of pay_esic arguments (without api_key) — establishment_code, month, amount, payment_mode.
+
+    Returns:
+        Dictionary with batch ID, success/failure counts, total amount, and one
+        pay_esic result (or error) per record, in order.
+
+    Example:
+        pay_esic_bulk("key", [{"establishment_code": "ESIC001", "month": "2026-02", "amount": 12000}])
+        Returns: {"batch_id": "BATCH...", "total_records": 1, "succeeded": 1, "failed": 0, ...}
+    """
+    logger.info("Processing bulk ESIC payment: records=%d", len(payments))
+    result = _pay_bulk("pay_esic", api_key, payments)
+    logger.info("Bulk ESIC processed: %s, succeeded=%s", result['batch_id'], result['succeeded'])
+    return result
+
+
+_ESIC_PAYMENTS = (
+    {"month": "01-2026", "amount": 83750, "paid_on": "2026-02-10", "status": "SUCCESS"},
+)
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_esic_payment_history(
     api_key: str,
     establishment_code: str,
@@ -1396,26 +1785,34 @@ def get_esic_payment_history(
         get_esic_payment_history("key", "EST001", from_month="01-2026")
         Returns: {"total": 12, "payments": [...]}
     """
-    logger.info(f"Fetching ESIC payment history: establishment={establishment_code}")
-    try:
-        _auth(api_key)
-        result = {
-            "establishment_code": establishment_code,
-            "total": 12,
-            "payments": [{"month": "01-2026", "amount": 83750, "paid_on": "2026-02-10", "status": "SUCCESS"}],
-        }
-        logger.info(f"ESIC history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching ESIC history: {e}")
-        raise
+    logger.info("Fetching ESIC payment history: establishment=%s", establishment_code)
+    result = {
+        "establishment_code": establishment_code,
+        "total": 12,
+        "payments": _ESIC_PAYMENTS,
+    }
+    logger.info("ESIC history fetched: %s records", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # 9. EPF
 # ═══════════════════════════════════════════════════════════
 
+@dataclass(slots=True)
+class EPFPayment:
+    transaction_id: str
+    establishment_id: str
+    month: str
+    amount: float
+    status: str
+    trrn: str
+    timestamp: str
+
+
 @mcp.tool()
+@tool_handler
+@coalesce()
 def fetch_epf_dues(api_key: str, establishment_id: str, month: str) -> dict:
     """
     Fetch EPF contribution dues for a given wage month.
@@ -1432,27 +1829,23 @@ def fetch_epf_dues(api_key: str, establishment_id: str, month: str) -> dict:
         fetch_epf_dues("key", "PF/MH/12345", "02-2026")
         Returns: {"total_due": 192100, "due_date": "2026-03-15", ...}
     """
-    logger.info(f"Fetching EPF dues: establishment={establishment_id}, month={month}")
-    try:
-        _auth(api_key)
-        result = {
-            "establishment_id": establishment_id,
-            "month": month,
-            "employee_count": 85,
-            "employer_contribution": 102000,
-            "employee_contribution": 85000,
-            "admin_charges": 5100,
-            "total_due": 192100,
-            "due_date": "2026-03-15",
-        }
-        logger.info(f"EPF dues fetched: total={result['total_due']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching EPF dues: {e}")
-        raise
+    logger.info("Fetching EPF dues: establishment=%s, month=%s", establishment_id, month)
+    result = {
+        "establishment_id": establishment_id,
+        "month": month,
+        "employee_count": 85,
+        "employer_contribution": 102000,
+        "employee_contribution": 85000,
+        "admin_charges": 5100,
+        "total_due": 192100,
+        "due_date": "2026-03-15",
+    }
+    logger.info("EPF dues fetched: total=%s", result['total_due'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def pay_epf(
     api_key: str,
     establishment_id: str,
@@ -1460,7 +1853,7 @@ def pay_epf(
     amount: float,
     trrn: str = "",
     payment_mode: str = "NEFT",
-) -> dict:
+) -> EPFPayment:
     """
     Pay EPF contribution for a given wage month.
 
@@ -1479,26 +1872,53 @@ def pay_epf(
         pay_epf("key", "PF/MH/12345", "02-2026", 192100, payment_mode="NEFT")
         Returns: {"transaction_id": "TXN...", "trrn": "TRRN...", "status": "SUCCESS"}
     """
-    logger.info(f"Paying EPF: establishment={establishment_id}, month={month}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "establishment_id": establishment_id,
-            "month": month,
-            "amount": amount,
-            "status": "SUCCESS",
-            "trrn": trrn or _uid("TRRN"),
-            "timestamp": _ts(),
-        }
-        logger.info(f"EPF paid: {result['transaction_id']}, TRRN={result['trrn']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error paying EPF: {e}")
-        raise
+    logger.info("Paying EPF: establishment=%s, month=%s, amount=%s", establishment_id, month, amount)
+    result = EPFPayment(
+        transaction_id=_uid("TXN"),
+        establishment_id=establishment_id,
+        month=month,
+        amount=amount,
+        status="SUCCESS",
+        trrn=trrn or _uid("TRRN"),
+        timestamp=_ts(),
+    )
+    logger.info("EPF paid: %s, TRRN=%s", result.transaction_id, result.trrn)
+    _invalidate("fetch_epf_dues", "get_epf_payment_history", establishment_id=establishment_id)
+    return result
+
+
+@mcp.tool()
+@tool_handler
+def pay_epf_bulk(api_key: str, payments: List[dict]) -> dict:
+    """
+    Make several EPF contributions in one request with a single authentication.
+
+    Args:
+        api_key: Master backend API key for authentication.
+        payments: List of pay_epf arguments (without api_key) — establishment_id, month, amount, trrn, payment_mode.
+
+    Returns:
+        Dictionary with batch ID, success/failure counts, total amount, and one
+        pay_epf result (or error) per record, in order.
+
+    Example:
+        pay_epf_bulk("key", [{"establishment_id": "EPF001", "month": "2026-02", "amount": 36000}])
+        Returns: {"batch_id": "BATCH...", "total_records": 1, "succeeded": 1, "failed": 0, ...}
+    """
+    logger.info("Processing bulk EPF payment: records=%d", len(payments))
+    result = _pay_bulk("pay_epf", api_key, payments)
+    logger.info("Bulk EPF processed: %s, succeeded=%s", result['batch_id'], result['succeeded'])
+    return result
+
+
+_EPF_PAYMENTS = (
+    {"month": "01-2026", "amount": 192100, "trrn": "TRRN001", "paid_on": "2026-02-10", "status": "SUCCESS"},
+)
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_epf_payment_history(
     api_key: str,
     establishment_id: str,
@@ -1521,19 +1941,14 @@ def get_epf_payment_history(
         get_epf_payment_history("key", "PF/MH/12345", from_month="01-2026")
         Returns: {"total": 12, "payments": [...]}
     """
-    logger.info(f"Fetching EPF payment history: establishment={establishment_id}")
-    try:
-        _auth(api_key)
-        result = {
-            "establishment_id": establishment_id,
-            "total": 12,
-            "payments": [{"month": "01-2026", "amount": 192100, "trrn": "TRRN001", "paid_on": "2026-02-10", "status": "SUCCESS"}],
-        }
-        logger.info(f"EPF history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching EPF history: {e}")
-        raise
+    logger.info("Fetching EPF payment history: establishment=%s", establishment_id)
+    result = {
+        "establishment_id": establishment_id,
+        "total": 12,
+        "payments": _EPF_PAYMENTS,
+    }
+    logger.info("EPF history fetched: %s records", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
@@ -1541,6 +1956,7 @@ def get_epf_payment_history(
 # ═══════════════════════════════════════════════════════════
 
 @mcp.tool()
+@tool_handler
 def fetch_payroll_summary(api_key: str, month: str) -> dict:
     """
     View payroll summary for a specific month.
@@ -1556,25 +1972,21 @@ def fetch_payroll_summary(api_key: str, month: str) -> dict:
         fetch_payroll_summary("key", "02-2026")
         Returns: {"total_employees": 85, "total_gross": 4250000, "total_net": 3825000, ...}
     """
-    logger.info(f"Fetching payroll summary: month={month}")
-    try:
-        _auth(api_key)
-        result = {
-            "month": month,
-            "total_employees": 85,
-            "total_gross": 4250000,
-            "total_deductions": 425000,
-            "total_net": 3825000,
-            "status": "PENDING_APPROVAL",
-        }
-        logger.info(f"Payroll summary fetched: net={result['total_net']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching payroll summary: {e}")
-        raise
+    logger.info("Fetching payroll summary: month=%s", month)
+    result = {
+        "month": month,
+        "total_employees": 85,
+        "total_gross": 4250000,
+        "total_deductions": 425000,
+        "total_net": 3825000,
+        "status": "PENDING_APPROVAL",
+    }
+    logger.info("Payroll summary fetched: net=%s", result['total_net'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def process_payroll(
     api_key: str,
     month: str,
@@ -1597,27 +2009,30 @@ def process_payroll(
         process_payroll("key", "02-2026", "1234567890", "CFO_001")
         Returns: {"batch_id": "BATCH...", "total_amount": 3825000, "status": "PROCESSING"}
     """
-    logger.info(f"Processing payroll: month={month}, account={account_number}")
-    try:
-        _auth(api_key)
-        result = {
-            "batch_id": _uid("BATCH"),
-            "month": month,
-            "account_number": account_number,
-            "approved_by": approved_by,
-            "total_employees": 85,
-            "total_amount": 3825000,
-            "status": "PROCESSING",
-            "initiated_at": _ts(),
-        }
-        logger.info(f"Payroll processing started: {result['batch_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error processing payroll: {e}")
-        raise
+    logger.info("Processing payroll: month=%s, account=%s", month, account_number)
+    result = {
+        "batch_id": _uid("BATCH"),
+        "month": month,
+        "account_number": account_number,
+        "approved_by": approved_by,
+        "total_employees": 85,
+        "total_amount": 3825000,
+        "status": "PROCESSING",
+        "initiated_at": _ts(),
+    }
+    logger.info("Payroll processing started: %s", result['batch_id'])
+    _invalidate("get_payroll_history")
+    return result
+
+
+_PAYROLLS = (
+    {"month": "01-2026", "total_amount": 3825000, "employees": 85, "status": "COMPLETED", "processed_on": "2026-01-31"},
+)
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_payroll_history(
     api_key: str,
     from_month: str = "",
@@ -1638,25 +2053,42 @@ def get_payroll_history(
         get_payroll_history("key", from_month="01-2026")
         Returns: {"total": 12, "payrolls": [...]}
     """
-    logger.info(f"Fetching payroll history")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 12,
-            "payrolls": [{"month": "01-2026", "total_amount": 3825000, "employees": 85, "status": "COMPLETED", "processed_on": "2026-01-31"}],
-        }
-        logger.info(f"Payroll history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching payroll history: {e}")
-        raise
+    logger.info("Fetching payroll history")
+    result = {
+        "total": 12,
+        "payrolls": _PAYROLLS,
+    }
+    logger.info("Payroll history fetched: %s records", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # 11. TAXES
 # ═══════════════════════════════════════════════════════════
 
+@dataclass(slots=True)
+class DirectTaxPayment:
+    transaction_id: str
+    pan: str
+    tax_type: str
+    assessment_year: str
+    amount: float
+    challan_type: str
+    status: str
+    cin: str
+    timestamp: str
+
+
+_TAX_DUES = (
+    {"type": "TDS",         "period": "Q3 FY2026", "amount": 450000, "due_date": "2026-03-15"},
+    {"type": "ADVANCE_TAX", "period": "FY2026",    "amount": 200000, "due_date": "2026-03-15"},
+    {"type": "STATE_TAX",   "state": "Maharashtra", "amount":  75000, "due_date": "2026-03-20"},
+)
+
+
 @mcp.tool()
+@tool_handler
+@coalesce()
 def fetch_tax_dues(api_key: str, pan: str, tax_type: str = "ALL") -> dict:
     """
     Fetch all pending tax dues from the portal.
@@ -1673,25 +2105,17 @@ def fetch_tax_dues(api_key: str, pan: str, tax_type: str = "ALL") -> dict:
         fetch_tax_dues("key", "ABCDE1234F", "TDS")
         Returns: {"pan": "...", "dues": [{"type": "TDS", "amount": 450000, "due_date": "..."}]}
     """
-    logger.info(f"Fetching tax dues: PAN={pan}, type={tax_type}")
-    try:
-        _auth(api_key)
-        result = {
-            "pan": pan,
-            "dues": [
-                {"type": "TDS",         "period": "Q3 FY2026", "amount": 450000, "due_date": "2026-03-15"},
-                {"type": "ADVANCE_TAX", "period": "FY2026",    "amount": 200000, "due_date": "2026-03-15"},
-                {"type": "STATE_TAX",   "state": "Maharashtra", "amount":  75000, "due_date": "2026-03-20"},
-            ],
-        }
-        logger.info(f"Tax dues fetched: {len(result['dues'])} items")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching tax dues: {e}")
-        raise
+    logger.info("Fetching tax dues: PAN=%s, type=%s", pan, tax_type)
+    result = {
+        "pan": pan,
+        "dues": _TAX_DUES,
+    }
+    logger.info("Tax dues fetched: %s items", len(result['dues']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def pay_direct_tax(
     api_key: str,
     pan: str,
@@ -1700,7 +2124,7 @@ def pay_direct_tax(
     amount: float,
     challan_type: str,
     payment_mode: str = "NEFT",
-) -> dict:
+) -> DirectTaxPayment:
     """
     Pay direct taxes — TDS or Advance Tax via NEFT/RTGS.
 
@@ -1720,28 +2144,49 @@ def pay_direct_tax(
         pay_direct_tax("key", "ABCDE1234F", "TDS", "2026-27", 450000, "281", "NEFT")
         Returns: {"transaction_id": "TXN...", "cin": "CIN...", "status": "SUCCESS"}
     """
-    logger.info(f"Paying direct tax: PAN={pan}, type={tax_type}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "pan": pan,
-            "tax_type": tax_type,
-            "assessment_year": assessment_year,
-            "amount": amount,
-            "challan_type": challan_type,
-            "status": "SUCCESS",
-            "cin": _uid("CIN"),
-            "timestamp": _ts(),
-        }
-        logger.info(f"Direct tax paid: {result['transaction_id']}, CIN={result['cin']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error paying direct tax: {e}")
-        raise
+    logger.info("Paying direct tax: PAN=%s, type=%s, amount=%s", pan, tax_type, amount)
+    result = DirectTaxPayment(
+        transaction_id=_uid("TXN"),
+        pan=pan,
+        tax_type=tax_type,
+        assessment_year=assessment_year,
+        amount=amount,
+        challan_type=challan_type,
+        status="SUCCESS",
+        cin=_uid("CIN"),
+        timestamp=_ts(),
+    )
+    logger.info("Direct tax paid: %s, CIN=%s", result.transaction_id, result.cin)
+    _invalidate("fetch_tax_dues", "get_tax_payment_history", pan=pan)
+    return result
 
 
 @mcp.tool()
+@tool_handler
+def pay_direct_tax_bulk(api_key: str, payments: List[dict]) -> dict:
+    """
+    Make several direct tax payments in one request with a single authentication.
+
+    Args:
+        api_key: Master backend API key for authentication.
+        payments: List of pay_direct_tax arguments (without api_key) — pan, tax_type, assessment_year, amount, challan_type, payment_mode.
+
+    Returns:
+        Dictionary with batch ID, success/failure counts, total amount, and one
+        pay_direct_tax result (or error) per record, in order.
+
+    Example:
+        pay_direct_tax_bulk("key", [{"pan": "AAPFU0939F", "tax_type": "TDS", "assessment_year": "2026-27", "amount": 25000, "challan_type": "281"}])
+        Returns: {"batch_id": "BATCH...", "total_records": 1, "succeeded": 1, "failed": 0, ...}
+    """
+    logger.info("Processing bulk direct tax payment: records=%d", len(payments))
+    result = _pay_bulk("pay_direct_tax", api_key, payments)
+    logger.info("Bulk direct tax processed: %s, succeeded=%s", result['batch_id'], result['succeeded'])
+    return result
+
+
+@mcp.tool()
+@tool_handler
 def pay_state_tax(
     api_key: str,
     state: str,
@@ -1768,26 +2213,23 @@ def pay_state_tax(
         pay_state_tax("key", "Maharashtra", "Professional Tax", 75000, "FY2026", "NEFT")
         Returns: {"transaction_id": "TXN...", "state": "Maharashtra", "status": "SUCCESS"}
     """
-    logger.info(f"Paying state tax: state={state}, category={tax_category}, amount={amount}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": _uid("TXN"),
-            "state": state,
-            "tax_category": tax_category,
-            "amount": amount,
-            "assessment_period": assessment_period,
-            "status": "SUCCESS",
-            "timestamp": _ts(),
-        }
-        logger.info(f"State tax paid: {result['transaction_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error paying state tax: {e}")
-        raise
+    logger.info("Paying state tax: state=%s, category=%s, amount=%s", state, tax_category, amount)
+    result = {
+        "transaction_id": _uid("TXN"),
+        "state": state,
+        "tax_category": tax_category,
+        "amount": amount,
+        "assessment_period": assessment_period,
+        "status": "SUCCESS",
+        "timestamp": _ts(),
+    }
+    logger.info("State tax paid: %s", result['transaction_id'])
+    _invalidate("fetch_tax_dues", "get_tax_payment_history")
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def pay_bulk_tax(
     api_key: str,
     file_name: str,
@@ -1812,25 +2254,28 @@ def pay_bulk_tax(
         pay_bulk_tax("key", "tds_march.csv", "base64...", "TDS", "CSV")
         Returns: {"batch_id": "BATCH...", "total_records": 50, "status": "QUEUED"}
     """
-    logger.info(f"Processing bulk tax payment: file={file_name}, type={tax_type}")
-    try:
-        _auth(api_key)
-        result = {
-            "batch_id": _uid("BATCH"),
-            "file_name": file_name,
-            "tax_type": tax_type,
-            "total_records": 50,
-            "total_amount": 2500000,
-            "status": "QUEUED",
-        }
-        logger.info(f"Bulk tax queued: {result['batch_id']}, records={result['total_records']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error processing bulk tax: {e}")
-        raise
+    logger.info("Processing bulk tax payment: file=%s, type=%s", file_name, tax_type)
+    result = {
+        "batch_id": _uid("BATCH"),
+        "file_name": file_name,
+        "tax_type": tax_type,
+        "total_records": 50,
+        "total_amount": 2500000,
+        "status": "QUEUED",
+    }
+    logger.info("Bulk tax queued: %s, records=%s", result['batch_id'], result['total_records'])
+    _invalidate("fetch_tax_dues", "get_tax_payment_history")
+    return result
+
+
+_TAX_PAYMENTS = (
+    {"type": "TDS", "amount": 450000, "cin": "CIN001", "paid_on": "2026-01-15", "status": "SUCCESS"},
+)
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_tax_payment_history(
     api_key: str,
     pan: str,
@@ -1855,26 +2300,29 @@ def get_tax_payment_history(
         get_tax_payment_history("key", "ABCDE1234F", "TDS", from_date="2026-01-01")
         Returns: {"pan": "...", "total": 24, "payments": [...]}
     """
-    logger.info(f"Fetching tax payment history: PAN={pan}, type={tax_type}")
-    try:
-        _auth(api_key)
-        result = {
-            "pan": pan,
-            "total": 24,
-            "payments": [{"type": "TDS", "amount": 450000, "cin": "CIN001", "paid_on": "2026-01-15", "status": "SUCCESS"}],
-        }
-        logger.info(f"Tax history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching tax history: {e}")
-        raise
+    logger.info("Fetching tax payment history: PAN=%s, type=%s", pan, tax_type)
+    result = {
+        "pan": pan,
+        "total": 24,
+        "payments": _TAX_PAYMENTS,
+    }
+    logger.info("Tax history fetched: %s records", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # ACCOUNT MANAGEMENT
 # ═══════════════════════════════════════════════════════════
 
+_SUMMARY_ACCOUNTS = (
+    {"account_number": "XXXX1234", "type": "Current", "balance": 650000, "currency": "INR", "status": "ACTIVE"},
+    {"account_number": "XXXX5678", "type": "Savings",  "balance": 120000, "currency": "INR", "status": "ACTIVE"},
+)
+
+
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_account_summary(api_key: str) -> dict:
     """
     View all linked accounts and their balances.
@@ -1890,22 +2338,16 @@ def get_account_summary(api_key: str) -> dict:
         Returns: {"accounts": [{"account_number": "XXXX1234", "type": "Current", "balance": 650000}]}
     """
     logger.info("Fetching account summary")
-    try:
-        _auth(api_key)
-        result = {
-            "accounts": [
-                {"account_number": "XXXX1234", "type": "Current", "balance": 650000, "currency": "INR", "status": "ACTIVE"},
-                {"account_number": "XXXX5678", "type": "Savings",  "balance": 120000, "currency": "INR", "status": "ACTIVE"},
-            ]
-        }
-        logger.info(f"Account summary fetched: {len(result['accounts'])} accounts")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching account summary: {e}")
-        raise
+    result = {
+        "accounts": _SUMMARY_ACCOUNTS
+    }
+    logger.info("Account summary fetched: %s accounts", len(result['accounts']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_account_details(api_key: str, account_number: str) -> dict:
     """
     Fetch specific account details including IFSC, type, and branch.
@@ -1921,26 +2363,29 @@ def get_account_details(api_key: str, account_number: str) -> dict:
         get_account_details("key", "1234567890")
         Returns: {"account_number": "...", "type": "Current", "ifsc": "HDFC0001234", ...}
     """
-    logger.info(f"Fetching account details: account={account_number}")
-    try:
-        _auth(api_key)
-        result = {
-            "account_number": account_number,
-            "type": "Current",
-            "ifsc": "HDFC0001234",
-            "bank": "HDFC Bank",
-            "branch": "Mumbai Main",
-            "holder_name": "ABC Pvt Ltd",
-            "status": "ACTIVE",
-        }
-        logger.info(f"Account details fetched for {account_number}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching account details: {e}")
-        raise
+    logger.info("Fetching account details: account=%s", account_number)
+    result = {
+        "account_number": account_number,
+        "type": "Current",
+        "ifsc": "HDFC0001234",
+        "bank": "HDFC Bank",
+        "branch": "Mumbai Main",
+        "holder_name": "ABC Pvt Ltd",
+        "status": "ACTIVE",
+    }
+    logger.info("Account details fetched for %s", account_number)
+    return result
+
+
+_LINKED_ACCOUNTS = (
+    {"account_number": "XXXX1234", "bank": "HDFC", "type": "Current"},
+    {"account_number": "XXXX5678", "bank": "SBI",  "type": "Savings"},
+)
 
 
 @mcp.tool()
+@tool_handler
+@coalesce(ttl=SNAPSHOT_TTL)
 def get_linked_accounts(api_key: str) -> dict:
     """
     List all accounts linked to the user.
@@ -1956,23 +2401,16 @@ def get_linked_accounts(api_key: str) -> dict:
         Returns: {"total": 3, "accounts": [...]}
     """
     logger.info("Fetching linked accounts")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 3,
-            "accounts": [
-                {"account_number": "XXXX1234", "bank": "HDFC", "type": "Current"},
-                {"account_number": "XXXX5678", "bank": "SBI",  "type": "Savings"},
-            ],
-        }
-        logger.info(f"Linked accounts fetched: {result['total']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching linked accounts: {e}")
-        raise
+    result = {
+        "total": 3,
+        "accounts": _LINKED_ACCOUNTS,
+    }
+    logger.info("Linked accounts fetched: %s", result['total'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def set_default_account(api_key: str, account_number: str) -> dict:
     """
     Set a primary account for all payments.
@@ -1988,15 +2426,11 @@ def set_default_account(api_key: str, account_number: str) -> dict:
         set_default_account("key", "1234567890")
         Returns: {"account_number": "1234567890", "is_default": True}
     """
-    logger.info(f"Setting default account: {account_number}")
-    try:
-        _auth(api_key)
-        result = {"account_number": account_number, "is_default": True, "updated_at": _ts()}
-        logger.info(f"Default account set: {account_number}")
-        return result
-    except Exception as e:
-        logger.error(f"Error setting default account: {e}")
-        raise
+    logger.info("Setting default account: %s", account_number)
+    result = {"account_number": account_number, "is_default": True, "updated_at": _ts()}
+    logger.info("Default account set: %s", account_number)
+    _invalidate("get_linked_accounts")
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
@@ -2004,6 +2438,7 @@ def set_default_account(api_key: str, account_number: str) -> dict:
 # ═══════════════════════════════════════════════════════════
 
 @mcp.tool()
+@tool_handler
 def search_transactions(
     api_key: str,
     query: str = "",
@@ -2034,18 +2469,14 @@ def search_transactions(
         search_transactions("key", query="vendor", txn_type="DEBIT", status="SUCCESS")
         Returns: {"total": 45, "transactions": [...]}
     """
-    logger.info(f"Searching transactions: query={query}, type={txn_type}, status={status}")
-    try:
-        _auth(api_key)
-        result = {"total": 45, "transactions": []}
-        logger.info(f"Transactions found: {result['total']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error searching transactions: {e}")
-        raise
+    logger.info("Searching transactions: query=%s, type=%s, status=%s", query, txn_type, status)
+    result = {"total": 45, "transactions": []}
+    logger.info("Transactions found: %s", result['total'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_transaction_details(api_key: str, transaction_id: str) -> dict:
     """
     Get detailed information about a specific transaction.
@@ -2061,27 +2492,23 @@ def get_transaction_details(api_key: str, transaction_id: str) -> dict:
         get_transaction_details("key", "TXN1234567890")
         Returns: {"transaction_id": "...", "amount": 50000, "mode": "NEFT", "status": "SUCCESS", ...}
     """
-    logger.info(f"Fetching transaction details: transaction_id={transaction_id}")
-    try:
-        _auth(api_key)
-        result = {
-            "transaction_id": transaction_id,
-            "amount": 50000,
-            "txn_type": "DEBIT",
-            "mode": "NEFT",
-            "beneficiary": "XYZ Corp",
-            "utr": "UTR001",
-            "status": "SUCCESS",
-            "timestamp": _ts(),
-        }
-        logger.info(f"Transaction details fetched: status={result['status']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching transaction details: {e}")
-        raise
+    logger.info("Fetching transaction details: transaction_id=%s", transaction_id)
+    result = {
+        "transaction_id": transaction_id,
+        "amount": 50000,
+        "txn_type": "DEBIT",
+        "mode": "NEFT",
+        "beneficiary": "XYZ Corp",
+        "utr": "UTR001",
+        "status": "SUCCESS",
+        "timestamp": _ts(),
+    }
+    logger.info("Transaction details fetched: status=%s", result['status'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def download_transaction_report(
     api_key: str,
     from_date: str,
@@ -2106,21 +2533,17 @@ def download_transaction_report(
         download_transaction_report("key", "2026-01-01", "2026-01-31", "XLSX")
         Returns: {"download_url": "https://...", "format": "XLSX"}
     """
-    logger.info(f"Generating transaction report: {from_date} to {to_date}, format={format}")
-    try:
-        _auth(api_key)
-        result = {
-            "download_url": f"https://bank.example.com/reports/txn_{from_date}_{to_date}.{format.lower()}",
-            "format": format,
-        }
-        logger.info(f"Transaction report URL generated")
-        return result
-    except Exception as e:
-        logger.error(f"Error generating transaction report: {e}")
-        raise
+    logger.info("Generating transaction report: %s to %s, format=%s", from_date, to_date, format)
+    result = {
+        "download_url": f"https://bank.example.com/reports/txn_{from_date}_{to_date}.{_FMT_EXT.get(format) or format.lower()}",
+        "format": format,
+    }
+    logger.info("Transaction report URL generated")
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_pending_transactions(api_key: str, account_number: str = "") -> dict:
     """
     View all pending or in-process payments.
@@ -2136,25 +2559,30 @@ def get_pending_transactions(api_key: str, account_number: str = "") -> dict:
         get_pending_transactions("key")
         Returns: {"total": 3, "transactions": [...]}
     """
-    logger.info(f"Fetching pending transactions: account={account_number or 'ALL'}")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 3,
-            "transactions": [{"transaction_id": "TXN001", "amount": 50000, "mode": "NEFT", "status": "PENDING", "initiated_at": _ts()}],
-        }
-        logger.info(f"Pending transactions fetched: {result['total']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching pending transactions: {e}")
-        raise
+    logger.info("Fetching pending transactions: account=%s", account_number or 'ALL')
+    result = {
+        "total": 3,
+        "transactions": [{"transaction_id": "TXN001", "amount": 50000, "mode": "NEFT", "status": "PENDING", "initiated_at": _ts()}],
+    }
+    logger.info("Pending transactions fetched: %s", result['total'])
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
 # DUES & REMINDERS
 # ═══════════════════════════════════════════════════════════
 
+_UPCOMING_DUES = (
+    {"type": "GST",       "amount": 125000, "due_date": "2026-02-20", "status": "PENDING"},
+    {"type":  "Insurance", "amount":  25000, "due_date": "2026-03-01", "status": "PENDING"},
+    {"type": "EPF",       "amount": 192100, "due_date": "2026-03-15", "status": "PENDING"},
+    {"type": "ESIC",      "amount":  83750, "due_date": "2026-03-15", "status": "PENDING"},
+    {"type": "TDS",       "amount": 450000, "due_date": "2026-03-15", "status": "PENDING"},
+)
+
+
 @mcp.tool()
+@tool_handler
 def get_upcoming_dues(api_key: str, days_ahead: int = 30) -> dict:
     """
     Fetch all upcoming dues — GST, EPF, ESIC, Tax, Insurance, etc.
@@ -2170,27 +2598,17 @@ def get_upcoming_dues(api_key: str, days_ahead: int = 30) -> dict:
         get_upcoming_dues("key", days_ahead=15)
         Returns: {"dues": [{"type": "GST", "amount": 125000, "due_date": "2026-02-20"}, ...]}
     """
-    logger.info(f"Fetching upcoming dues: days_ahead={days_ahead}")
-    try:
-        _auth(api_key)
-        result = {
-            "days_ahead": days_ahead,
-            "dues": [
-                {"type": "GST",       "amount": 125000, "due_date": "2026-02-20", "status": "PENDING"},
-                {"type":  "Insurance", "amount":  25000, "due_date": "2026-03-01", "status": "PENDING"},
-                {"type": "EPF",       "amount": 192100, "due_date": "2026-03-15", "status": "PENDING"},
-                {"type": "ESIC",      "amount":  83750, "due_date": "2026-03-15", "status": "PENDING"},
-                {"type": "TDS",       "amount": 450000, "due_date": "2026-03-15", "status": "PENDING"},
-            ],
-        }
-        logger.info(f"Upcoming dues fetched: {len(result['dues'])} items")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching upcoming dues: {e}")
-        raise
+    logger.info("Fetching upcoming dues: days_ahead=%s", days_ahead)
+    result = {
+        "days_ahead": days_ahead,
+        "dues": _UPCOMING_DUES,
+    }
+    logger.info("Upcoming dues fetched: %s items", len(result['dues']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_overdue_payments(api_key: str) -> dict:
     """
     Fetch all overdue or missed payments.
@@ -2206,20 +2624,16 @@ def get_overdue_payments(api_key: str) -> dict:
         Returns: {"total": 2, "overdue": [{"type": "GST", "amount": 95000, "days_overdue": 37}]}
     """
     logger.info("Fetching overdue payments")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 2,
-            "overdue": [{"type": "GST", "amount": 95000, "due_date": "2026-01-20", "days_overdue": 37}],
-        }
-        logger.info(f"Overdue payments fetched: {result['total']} items")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching overdue payments: {e}")
-        raise
+    result = {
+        "total": 2,
+        "overdue": [{"type": "GST", "amount": 95000, "due_date": "2026-01-20", "days_overdue": 37}],
+    }
+    logger.info("Overdue payments fetched: %s items", result['total'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def set_payment_reminder(
     api_key: str,
     title: str,
@@ -2246,26 +2660,22 @@ def set_payment_reminder(
         set_payment_reminder("key", "GST Payment", "2026-02-20", 125000, "GST", 5)
         Returns: {"reminder_id": "REM...", "title": "GST Payment", "status": "SET"}
     """
-    logger.info(f"Setting payment reminder: {title}, due={due_date}")
-    try:
-        _auth(api_key)
-        result = {
-            "reminder_id": _uid("REM"),
-            "title": title,
-            "due_date": due_date,
-            "amount": amount,
-            "payment_type": payment_type,
-            "notify_days_before": notify_days_before,
-            "status": "SET",
-        }
-        logger.info(f"Reminder set: {result['reminder_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error setting reminder: {e}")
-        raise
+    logger.info("Setting payment reminder: %s, due=%s", title, due_date)
+    result = {
+        "reminder_id": _uid("REM"),
+        "title": title,
+        "due_date": due_date,
+        "amount": amount,
+        "payment_type": payment_type,
+        "notify_days_before": notify_days_before,
+        "status": "SET",
+    }
+    logger.info("Reminder set: %s", result['reminder_id'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_reminder_list(api_key: str) -> dict:
     """
     View all active payment reminders.
@@ -2281,20 +2691,16 @@ def get_reminder_list(api_key: str) -> dict:
         Returns: {"total": 5, "reminders": [{"reminder_id": "REM001", "title": "GST Payment", ...}]}
     """
     logger.info("Fetching reminder list")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 5,
-            "reminders": [{"reminder_id": "REM001", "title": "GST Payment", "due_date": "2026-02-20", "notify_days_before": 3}],
-        }
-        logger.info(f"Reminders fetched: {result['total']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching reminders: {e}")
-        raise
+    result = {
+        "total": 5,
+        "reminders": [{"reminder_id": "REM001", "title": "GST Payment", "due_date": "2026-02-20", "notify_days_before": 3}],
+    }
+    logger.info("Reminders fetched: %s", result['total'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def delete_reminder(api_key: str, reminder_id: str) -> dict:
     """
     Remove a payment reminder.
@@ -2310,15 +2716,10 @@ def delete_reminder(api_key: str, reminder_id: str) -> dict:
         delete_reminder("key", "REM001")
         Returns: {"reminder_id": "REM001", "deleted": True}
     """
-    logger.info(f"Deleting reminder: {reminder_id}")
-    try:
-        _auth(api_key)
-        result = {"reminder_id": reminder_id, "deleted": True, "timestamp": _ts()}
-        logger.info(f"Reminder deleted: {reminder_id}")
-        return result
-    except Exception as e:
-        logger.error(f"Error deleting reminder: {e}")
-        raise
+    logger.info("Deleting reminder: %s", reminder_id)
+    result = {"reminder_id": reminder_id, "deleted": True, "timestamp": _ts()}
+    logger.info("Reminder deleted: %s", reminder_id)
+    return result
 
 
 # ═══════════════════════════════════════════════════════════
@@ -2326,6 +2727,7 @@ def delete_reminder(api_key: str, reminder_id: str) -> dict:
 # ═══════════════════════════════════════════════════════════
 
 @mcp.tool()
+@tool_handler
 def get_dashboard_summary(api_key: str) -> dict:
     """
     Overview of account health, dues, and payments.
@@ -2341,26 +2743,30 @@ def get_dashboard_summary(api_key: str) -> dict:
         Returns: {"total_balance": 770000, "pending_dues": 875850, "account_health": "GOOD", ...}
     """
     logger.info("Fetching dashboard summary")
-    try:
-        _auth(api_key)
-        result = {
-            "total_balance": 770000,
-            "pending_dues": 875850,
-            "overdue_amount": 95000,
-            "payments_this_month": 1250000,
-            "upcoming_dues_count": 5,
-            "recent_transactions": 12,
-            "account_health": "GOOD",
-            "as_of": _ts(),
-        }
-        logger.info(f"Dashboard summary fetched: health={result['account_health']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching dashboard summary: {e}")
-        raise
-
-
-@mcp.tool()
+    result = {
+        "total_balance": 770000,
+        "pending_dues": 875850,
+        "overdue_amount": 95000,
+        "payments_this_month": 1250000,
+        "upcoming_dues_count": 5,
+        "recent_transactions": 12,
+        "account_health": "GOOD",
+        "as_of": _ts(),
+    }
+    logger.info("Dashboard summary fetched: health=%s", result['account_health'])
+    return result
+
+
+_SPENDING_CATEGORIES = (
+    {"category": "Vendor Payments",  "amount": 500000, "percentage": 40},
+    {"category": "Tax & Compliance", "amount": 375000, "percentage": 30},
+    {"category": "Payroll",          "amount": 250000, "percentage": 20},
+    {"category": "Others",           "amount": 125000, "percentage": 10},
+)
+
+
+@mcp.tool()
+@tool_handler
 def get_spending_analytics(
     api_key: str,
     from_date: str = "",
@@ -2381,25 +2787,16 @@ def get_spending_analytics(
         get_spending_analytics("key", from_date="2026-01-01", to_date="2026-01-31")
         Returns: {"categories": [{"category": "Vendor Payments", "amount": 500000, "percentage": 40}, ...]}
     """
-    logger.info(f"Fetching spending analytics")
-    try:
-        _auth(api_key)
-        result = {
-            "categories": [
-                {"category": "Vendor Payments",  "amount": 500000, "percentage": 40},
-                {"category": "Tax & Compliance", "amount": 375000, "percentage": 30},
-                {"category": "Payroll",          "amount": 250000, "percentage": 20},
-                {"category": "Others",           "amount": 125000, "percentage": 10},
-            ]
-        }
-        logger.info(f"Spending analytics fetched: {len(result['categories'])} categories")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching spending analytics: {e}")
-        raise
+    logger.info("Fetching spending analytics")
+    result = {
+        "categories": _SPENDING_CATEGORIES
+    }
+    logger.info("Spending analytics fetched: %s categories", len(result['categories']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_cashflow_summary(api_key: str, month: str = "") -> dict:
     """
     Inflow vs outflow cash flow summary.
@@ -2415,23 +2812,19 @@ def get_cashflow_summary(api_key: str, month: str = "") -> dict:
         get_cashflow_summary("key", "02-2026")
         Returns: {"total_inflow": 3000000, "total_outflow": 2350000, "net_cashflow": 650000}
     """
-    logger.info(f"Fetching cashflow summary: month={month or 'current'}")
-    try:
-        _auth(api_key)
-        result = {
-            "total_inflow": 3000000,
-            "total_outflow": 2350000,
-            "net_cashflow": 650000,
-            "month": month or "02-2026",
-        }
-        logger.info(f"Cashflow summary: net={result['net_cashflow']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching cashflow summary: {e}")
-        raise
+    logger.info("Fetching cashflow summary: month=%s", month or 'current')
+    result = {
+        "total_inflow": 3000000,
+        "total_outflow": 2350000,
+        "net_cashflow": 650000,
+        "month": month or "02-2026",
+    }
+    logger.info("Cashflow summary: net=%s", result['net_cashflow'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_monthly_report(api_key: str, month: str) -> dict:
     """
     Monthly financial summary report.
@@ -2447,24 +2840,26 @@ def get_monthly_report(api_key: str, month: str) -> dict:
         get_monthly_report("key", "02-2026")
         Returns: {"month": "02-2026", "total_payments": 45, "total_amount": 2350000, ...}
     """
-    logger.info(f"Generating monthly report: month={month}")
-    try:
-        _auth(api_key)
-        result = {
-            "month": month,
-            "total_payments": 45,
-            "total_amount": 2350000,
-            "compliance_paid": 875850,
-            "download_url": f"https://bank.example.com/reports/monthly_{month}.pdf",
-        }
-        logger.info(f"Monthly report generated for {month}")
-        return result
-    except Exception as e:
-        logger.error(f"Error generating monthly report: {e}")
-        raise
+    logger.info("Generating monthly report: month=%s", month)
+    result = {
+        "month": month,
+        "total_payments": 45,
+        "total_amount": 2350000,
+        "compliance_paid": 875850,
+        "download_url": f"https://bank.example.com/reports/monthly_{month}.pdf",
+    }
+    logger.info("Monthly report generated for %s", month)
+    return result
+
+
+_VENDOR_PAYMENTS = (
+    {"name": "XYZ Corp", "total_paid": 500000, "payment_count": 5},
+    {"name": "ABC Ltd",  "total_paid": 350000, "payment_count": 3},
+)
 
 
 @mcp.tool()
+@tool_handler
 def get_vendor_payment_summary(
     api_key: str,
     from_date: str = "",
@@ -2487,26 +2882,19 @@ def get_vendor_payment_summary(
         get_vendor_payment_summary("key", top_n=5)
         Returns: {"vendors": [{"name": "XYZ Corp", "total_paid": 500000, "payment_count": 5}, ...]}
     """
-    logger.info(f"Fetching vendor payment summary: top_n={top_n}")
-    try:
-        _auth(api_key)
-        result = {
-            "vendors": [
-                {"name": "XYZ Corp", "total_paid": 500000, "payment_count": 5},
-                {"name": "ABC Ltd",  "total_paid": 350000, "payment_count": 3},
-            ]
-        }
-        logger.info(f"Vendor summary fetched: {len(result['vendors'])} vendors")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching vendor summary: {e}")
-        raise
+    logger.info("Fetching vendor payment summary: top_n=%s", top_n)
+    result = {
+        "vendors": _VENDOR_PAYMENTS
+    }
+    logger.info("Vendor summary fetched: %s vendors", len(result['vendors']))
+    return result
 
 
 # BUSINESS / COMPANY MANAGEMENT
 
 
 @mcp.tool()
+@tool_handler
 def get_company_profile(api_key: str) -> dict:
     """
     View company details and KYC information.
@@ -2522,23 +2910,19 @@ def get_company_profile(api_key: str) -> dict:
         Returns: {"company_name": "Demo Pvt Ltd", "pan": "AAAPD1234F", "kyc_status": "VERIFIED"}
     """
     logger.info("Fetching company profile")
-    try:
-        _auth(api_key)
-        result = {
-            "company_name": "Demo Pvt Ltd",
-            "pan": "AAAPD1234F",
-            "gstin": "27AAAPD1234F1ZK",
-            "cin": "U12345MH2020PTC123456",
-            "kyc_status": "VERIFIED",
-        }
-        logger.info("Company profile fetched")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching company profile: {e}")
-        raise
+    result = {
+        "company_name": "Demo Pvt Ltd",
+        "pan": "AAAPD1234F",
+        "gstin": "27AAAPD1234F1ZK",
+        "cin": "U12345MH2020PTC123456",
+        "kyc_status": "VERIFIED",
+    }
+    logger.info("Company profile fetched")
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def update_company_details(api_key: str, field: str, value: str) -> dict:
     """
     Update a specific company information field.
@@ -2555,18 +2939,14 @@ def update_company_details(api_key: str, field: str, value: str) -> dict:
         update_company_details("key", "address", "123 Main Street, Mumbai")
         Returns: {"field": "address", "value": "123 Main Street, Mumbai", "updated": True}
     """
-    logger.info(f"Updating company details: field={field}")
-    try:
-        _auth(api_key)
-        result = {"field": field, "value": value, "updated": True, "updated_at": _ts()}
-        logger.info(f"Company field updated: {field}")
-        return result
-    except Exception as e:
-        logger.error(f"Error updating company details: {e}")
-        raise
+    logger.info("Updating company details: field=%s", field)
+    result = {"field": field, "value": value, "updated": True, "updated_at": _ts()}
+    logger.info("Company field updated: %s", field)
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_gst_profile(api_key: str) -> dict:
     """
     Fetch all linked GST numbers for the company.
@@ -2582,19 +2962,15 @@ def get_gst_profile(api_key: str) -> dict:
         Returns: {"gst_numbers": [{"gstin": "27AAAPD1234F1ZK", "state": "Maharashtra", "status": "ACTIVE"}]}
     """
     logger.info("Fetching GST profile")
-    try:
-        _auth(api_key)
-        result = {
-            "gst_numbers": [{"gstin": "27AAAPD1234F1ZK", "state": "Maharashtra", "status": "ACTIVE"}]
-        }
-        logger.info(f"GST profile fetched: {len(result['gst_numbers'])} GSTINs")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching GST profile: {e}")
-        raise
+    result = {
+        "gst_numbers": [{"gstin": "27AAAPD1234F1ZK", "state": "Maharashtra", "status": "ACTIVE"}]
+    }
+    logger.info("GST profile fetched: %s GSTINs", len(result['gst_numbers']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_authorized_signatories(api_key: str) -> dict:
     """
     View list of authorized persons and signatories.
@@ -2610,19 +2986,15 @@ def get_authorized_signatories(api_key: str) -> dict:
         Returns: {"signatories": [{"name": "John Doe", "role": "Director", "status": "ACTIVE"}]}
     """
     logger.info("Fetching authorized signatories")
-    try:
-        _auth(api_key)
-        result = {
-            "signatories": [{"name": "John Doe", "role": "Director", "pan": "ABCPD1234E", "status": "ACTIVE"}]
-        }
-        logger.info(f"Signatories fetched: {len(result['signatories'])}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching signatories: {e}")
-        raise
+    result = {
+        "signatories": [{"name": "John Doe", "role": "Director", "pan": "ABCPD1234E", "status": "ACTIVE"}]
+    }
+    logger.info("Signatories fetched: %s", len(result['signatories']))
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def manage_user_roles(api_key: str, user_id: str, role: str, action: str) -> dict:
     """
     Assign or update roles for team members.
@@ -2640,15 +3012,10 @@ def manage_user_roles(api_key: str, user_id: str, role: str, action: str) -> dic
         manage_user_roles("key", "USR001", "CHECKER", "ASSIGN")
         Returns: {"user_id": "USR001", "role": "CHECKER", "action": "ASSIGN"}
     """
-    logger.info(f"Managing user role: user={user_id}, role={role}, action={action}")
-    try:
-        _auth(api_key)
-        result = {"user_id": user_id, "role": role, "action": action, "updated_at": _ts()}
-        logger.info(f"Role updated: user={user_id}, role={role}")
-        return result
-    except Exception as e:
-        logger.error(f"Error managing user role: {e}")
-        raise
+    logger.info("Managing user role: user=%s, role=%s, action=%s", user_id, role, action)
+    result = {"user_id": user_id, "role": role, "action": action, "updated_at": _ts()}
+    logger.info("Role updated: user=%s, role=%s", user_id, role)
+    return result
 
 
 
@@ -2656,6 +3023,7 @@ def manage_user_roles(api_key: str, user_id: str, role: str, action: str) -> dic
 
 
 @mcp.tool()
+@tool_handler
 def raise_support_ticket(
     api_key: str,
     category: str,
@@ -2680,25 +3048,21 @@ def raise_support_ticket(
         raise_support_ticket("key", "PAYMENT_ISSUE", "Payment stuck", "NEFT payment pending for 2 days", "HIGH")
         Returns: {"ticket_id": "TKT...", "status": "OPEN", "created_at": "..."}
     """
-    logger.info(f"Raising support ticket: category={category}, priority={priority}")
-    try:
-        _auth(api_key)
-        result = {
-            "ticket_id": _uid("TKT"),
-            "category": category,
-            "subject": subject,
-            "priority": priority,
-            "status": "OPEN",
-            "created_at": _ts(),
-        }
-        logger.info(f"Support ticket raised: {result['ticket_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error raising support ticket: {e}")
-        raise
+    logger.info("Raising support ticket: category=%s, priority=%s", category, priority)
+    result = {
+        "ticket_id": _uid("TKT"),
+        "category": category,
+        "subject": subject,
+        "priority": priority,
+        "status": "OPEN",
+        "created_at": _ts(),
+    }
+    logger.info("Support ticket raised: %s", result['ticket_id'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_ticket_history(api_key: str, status: str = "ALL") -> dict:
     """
     View all past support tickets.
@@ -2714,21 +3078,17 @@ def get_ticket_history(api_key: str, status: str = "ALL") -> dict:
         get_ticket_history("key", status="OPEN")
         Returns: {"total": 8, "tickets": [...]}
     """
-    logger.info(f"Fetching ticket history: status={status}")
-    try:
-        _auth(api_key)
-        result = {
-            "total": 8,
-            "tickets": [{"ticket_id": "TKT001", "subject": "Payment stuck", "status": "CLOSED", "created_at": "2026-01-15"}],
-        }
-        logger.info(f"Ticket history fetched: {result['total']} records")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching ticket history: {e}")
-        raise
+    logger.info("Fetching ticket history: status=%s", status)
+    result = {
+        "total": 8,
+        "tickets": [{"ticket_id": "TKT001", "subject": "Payment stuck", "status": "CLOSED", "created_at": "2026-01-15"}],
+    }
+    logger.info("Ticket history fetched: %s records", result['total'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def chat_with_support(api_key: str, issue_summary: str) -> dict:
     """
     Initiate a live agent chat session.
@@ -2744,24 +3104,20 @@ def chat_with_support(api_key: str, issue_summary: str) -> dict:
         chat_with_support("key", "Need help with GST payment failure")
         Returns: {"session_id": "CHAT...", "agent": "Support Agent", "wait_time_minutes": 2}
     """
-    logger.info(f"Initiating support chat: issue={issue_summary[:50]}")
-    try:
-        _auth(api_key)
-        result = {
-            "session_id": _uid("CHAT"),
-            "agent": "Support Agent",
-            "status": "CONNECTED",
-            "wait_time_minutes": 2,
-            "started_at": _ts(),
-        }
-        logger.info(f"Support chat initiated: {result['session_id']}")
-        return result
-    except Exception as e:
-        logger.error(f"Error initiating support chat: {e}")
-        raise
+    logger.info("Initiating support chat: issue=%s", issue_summary[:50])
+    result = {
+        "session_id": _uid("CHAT"),
+        "agent": "Support Agent",
+        "status": "CONNECTED",
+        "wait_time_minutes": 2,
+        "started_at": _ts(),
+    }
+    logger.info("Support chat initiated: %s", result['session_id'])
+    return result
 
 
 @mcp.tool()
+@tool_handler
 def get_contact_details(api_key: str, category: str = "GENERAL") -> dict:
     """
     Fetch bank or fintech support contact information.
@@ -2777,26 +3133,82 @@ def get_contact_details(api_key: str, category: str = "GENERAL") -> dict:
         get_contact_details("key", "PAYMENTS")
         Returns: {"category": "PAYMENTS", "phone": "1800-XXX-XXXX", "email": "payments@bank.example.com"}
     """
-    logger.info(f"Fetching contact details: category={category}")
-    try:
-        _auth(api_key)
-        result = {
-            "category": category,
-            "phone": "1800-XXX-XXXX",
-            "email": f"{category.lower()}@bank.example.com",
-            "hours": "Mon-Sat 9AM-6PM",
-            "chat_available": True,
-        }
-        logger.info(f"Contact details fetched for {category}")
-        return result
-    except Exception as e:
-        logger.error(f"Error fetching contact details: {e}")
-        raise
+    logger.info("Fetching contact details: category=%s", category)
+    result = {
+        "category": category,
+        "phone": "1800-XXX-XXXX",
+        "email": f"{category.lower()}@bank.example.com",
+        "hours": "Mon-Sat 9AM-6PM",
+        "chat_available": True,
+    }
+    logger.info("Contact details fetched for %s", category)
+    return result
+
+
+# ═══════════════════════════════════════════════════════════
+# BATCH
+# ═══════════════════════════════════════════════════════════
+
+@mcp.tool()
+@tool_handler
+def batch_execute(api_key: str, calls: List[dict]) -> dict:
+    """
+    Run several bank tools in one request with a single authentication.
+
+    Args:
+        api_key: Master backend API key for authentication.
+        calls: List of {"tool": <tool name>, "args": {...}} — args exclude api_key.
+
+    Returns:
+        Dictionary with one entry per call, in order: the tool's result, or
+        an error message for that call only.
+
+    Example:
+        batch_execute("key", [{"tool": "get_account_balance", "args": {"account_number": "123"}}])
+        Returns: {"count": 1, "results": [{"tool": "get_account_balance", "result": {...}}]}
+    """
+    logger.info("Executing batch of %d calls", len(calls))
+    results = []
+    for call in calls:
+        name = call.get("tool", "")
+        try:
+            results.append({"tool": name, "result": _call_impl(name, api_key, call.get("args", {}))})
+        except Exception as e:
+            logger.error("Error in batch call %s: %s", name, e)
+            results.append({"tool": name, "error": str(e)})
+    result = {"count": len(results), "results": results}
+    logger.info("Batch executed: %d calls", len(results))
+    return result
+
+
+# batch_execute dispatches only to single tools, never to itself
+del _TOOL_IMPLS["batch_execute"]
 
 
 # ─────────────────────────────────────────────
 # Main Entry Point
 # ─────────────────────────────────────────────
+def _install_uvloop() -> bool:
+    """Drive the stdio transport on uvloop when it is installed.
+
+    uvicorn[standard] already pulls uvloop in; without it the server keeps
+    plain asyncio. Only called from __main__, so importing this module never
+    changes the host's loop policy.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 if __name__ == "__main__":
+    _install_uvloop()
+
+    log_listener = _start_log_listener()
     logger.info("Starting Bank AI Assistant MCP Server...")
-    mcp.run()
\ No newline at end of file
+    try:
+        mcp.run()
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -6,6 +6,7 @@ Fallback: local calculation if API is unreachable
 from typing import Dict, List, Any, Optional
 import httpx
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,9 @@ logger = logging.getLogger(__name__)
 GST_API_BASE    = "http://localhost:3000"
 GST_CALC_URL    = f"{GST_API_BASE}/gst-calculation"
 API_TIMEOUT     = 10.0 
+# One keep-alive pool per process instead of a new connection per calculation
+HTTP_LIMITS     = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+_GSTIN_RE       = re.compile(r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[A-Z0-9]{1}Z[A-Z0-9]{1}$')
 
 
 class GSTCalculator:
@@ -23,6 +27,7 @@ class GSTCalculator:
         self.api_url        = api_url or GST_CALC_URL
         self.api_key        = api_key
         self.use_local_api  = True   # always try localhost:3000 first
+        self._http: Optional[httpx.AsyncClient] = None   # created on first API call
 
         # Optional: load gstin_validator.py if present in workspace
         # To enable real API validation: add gstin_validator.py to your project root
@@ -47,7 +52,7 @@ class GSTCalculator:
         try:
             return await self._call_gst_api(base_amount, gst_rate)
         except Exception as e:
-            logger.warning(f"localhost:3000/gst-calculation unreachable ({e}) — using local calc")
+            logger.warning("localhost:3000/gst-calculation unreachable (%s) — using local calc", e)
             return self._calculate_locally(base_amount, gst_rate)
 
     async def _call_gst_api(self, base_amount: float, gst_rate: float) -> Dict[str, Any]:
@@ -66,12 +71,11 @@ class GSTCalculator:
             "gst_rate":    gst_rate
         }
 
-        async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
-            response = await client.post(self.api_url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._client().post(self.api_url, json=payload, headers=headers)
+        response.raise_for_status()
+        data = response.json()
 
-        logger.info(f"localhost:3000/gst-calculation responded: {data}")
+        logger.info("localhost:3000/gst-calculation responded: %s", data)
 
         # Normalise response — ensure all expected keys exist
         return {
@@ -82,6 +86,19 @@ class GSTCalculator:
             "source":       "localhost_api"
         }
 
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=API_TIMEOUT, limits=HTTP_LIMITS)
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the keep-alive pool (and the GSTIN validator's, if loaded)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._gstin_validator is not None:
+            await self._gstin_validator.aclose()
+
     def _calculate_locally(self, base_amount: float, gst_rate: float) -> Dict[str, Any]:
         if base_amount < 0 or gst_rate < 0:
             raise ValueError("Amount and rate must be positive")
@@ -204,11 +221,9 @@ class GSTCalculator:
 
     def validate_gstin(self, gstin: str) -> Dict[str, Any]:
         """Sync local regex validation"""
-        import re
         if not gstin or not isinstance(gstin, str):
             return {"valid": False, "error": "GSTIN must be a non-empty string"}
-        pattern = re.compile(r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[A-Z0-9]{1}Z[A-Z0-9]{1}$')
-        if not pattern.match(gstin.strip().upper()):
+        if not _GSTIN_RE.match(gstin.strip().upper()):
             return {
                 "valid": False,
                 "error": "Invalid GSTIN format",
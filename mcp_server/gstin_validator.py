@@ -17,7 +17,7 @@ import re
 import os
 import logging
 import httpx
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,7 @@ STATE_CODES: Dict[str, str] = {
 }
 
 GSTIN_REGEX = r"^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[A-Z0-9]{1}Z[A-Z0-9]{1}$"
+_GSTIN_RE   = re.compile(GSTIN_REGEX)
 
 
 class GSTINValidator:
@@ -49,9 +50,10 @@ class GSTINValidator:
         self.api_key      = os.getenv("GSTIN_API_KEY", "")
         self.api_provider = os.getenv("GSTIN_API_PROVIDER", "local").lower()
         self.timeout      = 8  # seconds
+        self._http: Optional[httpx.AsyncClient] = None   # shared keep-alive pool, created on first use
 
         if self.api_key:
-            logger.info(f"✓ GSTIN API configured: provider={self.api_provider}")
+            logger.info("✓ GSTIN API configured: provider=%s", self.api_provider)
         else:
             logger.info("ℹ  No GSTIN_API_KEY found — using local validation only")
 
@@ -78,15 +80,29 @@ class GSTINValidator:
                 else:
                     return await self._gst_suvidha(gstin)
             except httpx.TimeoutException:
-                logger.warning(f"GSTIN API timeout for {gstin} — falling back to local")
+                logger.warning("GSTIN API timeout for %s — falling back to local", gstin)
             except httpx.HTTPStatusError as e:
-                logger.warning(f"GSTIN API HTTP {e.response.status_code} — falling back to local")
+                logger.warning("GSTIN API HTTP %s — falling back to local", e.response.status_code)
             except Exception as e:
-                logger.warning(f"GSTIN API error: {e} — falling back to local")
+                logger.warning("GSTIN API error: %s — falling back to local", e)
 
         # Local fallback
         return local
 
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout = self.timeout,
+                limits  = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the keep-alive pool; the next call opens a fresh one."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     # ── Provider: GST Suvidha (sandbox + production) ──────────────────────────
 
     async def _gst_suvidha(self, gstin: str) -> Dict[str, Any]:
@@ -104,10 +120,9 @@ class GSTINValidator:
         }
         payload = {"gstin": gstin}
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await self._client().post(url, json=payload, headers=headers)
+        resp.raise_for_status()
+        data = resp.json()
 
         # Map provider response → standard format
         taxpayer = data.get("data", {})
@@ -144,10 +159,9 @@ class GSTINValidator:
             "password":   os.getenv("GSTIN_API_PASSWORD", ""),
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await self._client().get(url, headers=headers)
+        resp.raise_for_status()
+        data = resp.json()
 
         taxpayer = data.get("taxpayerInfo", {})
         return {
@@ -171,7 +185,7 @@ class GSTINValidator:
         Offline structural validation — no API call needed.
         Checks: format, state code, embedded PAN structure.
         """
-        if not re.match(GSTIN_REGEX, gstin):
+        if not _GSTIN_RE.match(gstin):
             return {
                 "valid": False,
                 "gstin": gstin,
@@ -221,6 +235,11 @@ class GSTINValidator:
 gstin_validator = GSTINValidator()
 
 
+async def aclose() -> None:
+    """Shutdown hook — release the singleton's HTTP pool."""
+    await gstin_validator.aclose()
+
+
 # ── Convenience wrapper for sync callers ──────────────────────────────────────
 async def validate_gstin(gstin: str) -> Dict[str, Any]:
     return await gstin_validator.validate(gstin)
\ No newline at end of file
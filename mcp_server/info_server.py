@@ -6,7 +6,6 @@ NO actual registration - information only
 from fastmcp import FastMCP
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 mcp = FastMCP("Onboarding Info Server")
@@ -472,5 +471,9 @@ def get_common_errors() -> dict:
 
 
 if __name__ == "__main__":
+    # Only when run as a server — MCPClient also imports this module
+    # in-process, where the API owns logging setup. force: FastMCP() has
+    # already installed its own root handler by this point.
+    logging.basicConfig(level=logging.INFO, force=True)
     logger.info("Starting Onboarding Info MCP Server...")
     mcp.run()
\ No newline at end of file
@@ -13,8 +13,9 @@ Tools:
 
 from fastmcp import FastMCP
 from typing import Optional
-from datetime import datetime, date
+from datetime import date
 import logging
+import string
 import urllib.parse
 
 logging.basicConfig(level=logging.INFO)
@@ -35,6 +36,34 @@ POPULAR_CITIES = [
     "Bhopal", "Chandigarh", "Lucknow", "Patna", "Goa"
 ]
 
+# ── URL helpers ────────────────────────────────────────────────────────────────
+# RedBus wants DD-Mon-YYYY with English month names; formatting it by hand
+# avoids strptime/strftime (and %b's locale dependence) on every request.
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# "New Delhi" → "new-delhi" in one pass
+_SLUG_TABLE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "-")
+
+
+def _redbus_date(d: date) -> str:
+    """date → RedBus DD-Mon-YYYY, e.g. 01-Mar-2026."""
+    return f"{d.day:02d}-{_MONTH_ABBR[d.month - 1]}-{d.year}"
+
+
+def _city_slug(city: str) -> str:
+    return _POPULAR_CITY_SLUGS.get(city) or city.translate(_SLUG_TABLE)
+
+
+def _city_param(city: str) -> str:
+    """URL-quoted city for query strings — precomputed for popular cities."""
+    return _POPULAR_CITY_QUOTED.get(city) or urllib.parse.quote(city)
+
+
+# Most lookups are for POPULAR_CITIES, so their encodings are built once here
+_POPULAR_CITY_SLUGS  = {c: c.translate(_SLUG_TABLE) for c in POPULAR_CITIES}
+_POPULAR_CITY_QUOTED = {c: urllib.parse.quote(c) for c in POPULAR_CITIES}
+
 
 # ── Tool 1: Bus Search Redirect ────────────────────────────────────────────────
 @mcp.tool()
@@ -60,25 +89,21 @@ def redbus_search_redirect(
     Example:
         redbus_search_redirect("Bangalore", "Mumbai", "2026-03-01", "web")
     """
-    logger.info(f"RedBus search: {source_city} → {destination_city} on {travel_date}")
+    logger.info("RedBus search: %s → %s on %s", source_city, destination_city, travel_date)
 
     # Default to today if no date provided
     if not travel_date:
-        travel_date = date.today().strftime("%Y-%m-%d")
+        travel_date = date.today().isoformat()
 
     # Format date for RedBus URL: DD-Mon-YYYY (e.g., 01-Mar-2026)
     try:
-        dt = datetime.strptime(travel_date, "%Y-%m-%d")
-        redbus_date = dt.strftime("%d-%b-%Y")  # 01-Mar-2026
+        year, month, day = travel_date.split("-")
+        redbus_date = _redbus_date(date(int(year), int(month), int(day)))
     except ValueError:
-        redbus_date = datetime.today().strftime("%d-%b-%Y")
-
-    # Encode city names for URL
-    src_encoded  = urllib.parse.quote(source_city.strip())
-    dst_encoded  = urllib.parse.quote(destination_city.strip())
+        redbus_date = _redbus_date(date.today())
 
     # Web URL: https://www.redbus.in/bus-tickets/bangalore-to-mumbai?doj=01-Mar-2026
-    route_slug = f"{source_city.lower().replace(' ', '-')}-to-{destination_city.lower().replace(' ', '-')}"
+    route_slug = f"{_city_slug(source_city)}-to-{_city_slug(destination_city)}"
     web_url    = f"{REDBUS_WEB_BASE}/bus-tickets/{route_slug}?doj={redbus_date}"
 
     # App deep link: redbus://search?src=Bangalore&dst=Mumbai&doj=01-Mar-2026
@@ -114,7 +139,7 @@ def redbus_search_redirect(
     else:
         result["redirect_url"] = web_url
 
-    logger.info(f"RedBus URL generated: {result['redirect_url']}")
+    logger.debug("RedBus URL generated: %s", result["redirect_url"])
     return result
 
 
@@ -137,7 +162,7 @@ def redbus_booking_redirect(
     Example:
         redbus_booking_redirect("TIN123456789")
     """
-    logger.info(f"RedBus booking redirect: TIN={tin}")
+    logger.info("RedBus booking redirect: TIN=%s", tin)
 
     tin_clean = tin.strip().upper()
 
@@ -154,7 +179,7 @@ def redbus_booking_redirect(
         "redirect_message": f"Click here to view your booking → {web_url}"
     }
 
-    logger.info(f"Booking URL: {result['redirect_url']}")
+    logger.debug("Booking URL: %s", result["redirect_url"])
     return result
 
 
@@ -177,15 +202,14 @@ def redbus_offers_redirect(
     Example:
         redbus_offers_redirect("Bangalore", "web")
     """
-    logger.info(f"RedBus offers redirect: city={source_city}")
-
-    web_url = f"{REDBUS_WEB_BASE}/offers"
-    if source_city:
-        web_url += f"?src={urllib.parse.quote(source_city)}"
+    logger.info("RedBus offers redirect: city=%s", source_city)
 
+    web_url      = f"{REDBUS_WEB_BASE}/offers"
     app_deeplink = f"{REDBUS_APP_SCHEME}offers"
     if source_city:
-        app_deeplink += f"?src={urllib.parse.quote(source_city)}"
+        src = f"?src={_city_param(source_city)}"
+        web_url      += src
+        app_deeplink += src
 
     city_text = f" from {source_city}" if source_city else ""
 
@@ -199,7 +223,7 @@ def redbus_offers_redirect(
         "redirect_message": f"Click here to view offers → {web_url}"
     }
 
-    logger.info(f"Offers URL: {result['redirect_url']}")
+    logger.debug("Offers URL: %s", result["redirect_url"])
     return result
 
 
@@ -222,7 +246,7 @@ def redbus_tracking_redirect(
     Example:
         redbus_tracking_redirect("TIN123456789")
     """
-    logger.info(f"RedBus tracking redirect: TIN={tin}")
+    logger.info("RedBus tracking redirect: TIN=%s", tin)
 
     tin_clean    = tin.strip().upper()
     web_url      = f"{REDBUS_WEB_BASE}/mybookings/track-my-bus?tin={tin_clean}"
@@ -238,7 +262,7 @@ def redbus_tracking_redirect(
         "redirect_message": f"Click here to track your bus → {web_url}"
     }
 
-    logger.info(f"Tracking URL: {result['redirect_url']}")
+    logger.debug("Tracking URL: %s", result["redirect_url"])
     return result
 
 
@@ -259,7 +283,7 @@ def get_popular_routes(
     Example:
         get_popular_routes("Bangalore")
     """
-    logger.info(f"Popular routes: source={source_city}")
+    logger.info("Popular routes: source=%s", source_city)
 
     # Popular routes database
     all_routes = {
@@ -271,7 +295,7 @@ def get_popular_routes(
         "Pune":      ["Mumbai", "Goa", "Bangalore", "Nashik", "Kolhapur", "Shirdi"],
     }
 
-    today = date.today().strftime("%d-%b-%Y")
+    today = _redbus_date(date.today())
 
     if source_city and source_city in all_routes:
         destinations = all_routes[source_city]
@@ -331,7 +355,7 @@ def open_redbus(
         open_redbus("app")      → mobile app deep link
         open_redbus("both")     → both URLs
     """
-    logger.info(f"Open RedBus: redirect_to={redirect_to}")
+    logger.info("Open RedBus: redirect_to=%s", redirect_to)
 
     web_url      = REDBUS_WEB_BASE                  # https://www.redbus.in
     app_deeplink = f"{REDBUS_APP_SCHEME}home"        # redbus://home
@@ -365,7 +389,7 @@ def open_redbus(
         "tip":             "You can also say 'book bus from Bangalore to Mumbai' to search directly!"
     }
 
-    logger.info(f"Open RedBus URL: {redirect_url}")
+    logger.debug("Open RedBus URL: %s", redirect_url)
     return result
 
 # ── Entry point ────────────────────────────────────────────────────────────────
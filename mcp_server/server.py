@@ -10,7 +10,6 @@ from typing import List
 import logging
 import time
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # ── Init ───────────────────────────────────────────────────────────────────────
@@ -42,7 +41,7 @@ def _log(tool_name: str, intents: list, latency_ms: float, success: bool, error:
                 error      = error,
             )
         except Exception as e:
-            logger.warning(f"Logging failed: {e}")
+            logger.warning("Logging failed: %s", e)
 
 
 # ── Tools ──────────────────────────────────────────────────────────────────────
@@ -63,16 +62,16 @@ async def calculate_gst(base_amount: float, gst_rate: float) -> dict:
         calculate_gst(10000, 18)
         Returns: {"base_amount": 10000, "gst_amount": 1800, "total_amount": 11800, "gst_rate": 18}
     """
-    logger.info(f"Calculating GST: base={base_amount}, rate={gst_rate}")
+    logger.info("Calculating GST: base=%s, rate=%s", base_amount, gst_rate)
     t0 = time.time()
     try:
         result = await calculator.calculate_gst(base_amount, gst_rate)
         _log("calculate_gst", ["calculate_gst"], (time.time()-t0)*1000, True)
-        logger.info(f"GST calculated: {result}")
+        logger.info("GST calculated: %s", result)
         return result
     except Exception as e:
         _log("calculate_gst", ["calculate_gst"], (time.time()-t0)*1000, False, str(e))
-        logger.error(f"Error calculating GST: {e}")
+        logger.error("Error calculating GST: %s", e)
         raise
 
 
@@ -92,7 +91,7 @@ def reverse_calculate_gst(total_amount: float, gst_rate: float) -> dict:
         reverse_calculate_gst(11800, 18)
         Returns: {"total_amount": 11800, "base_amount": 10000, "gst_amount": 1800, "gst_rate": 18}
     """
-    logger.info(f"Reverse GST: total={total_amount}, rate={gst_rate}")
+    logger.info("Reverse GST: total=%s, rate=%s", total_amount, gst_rate)
     t0 = time.time()
     try:
         result = calculator.reverse_calculate_gst(total_amount, gst_rate)
@@ -100,7 +99,7 @@ def reverse_calculate_gst(total_amount: float, gst_rate: float) -> dict:
         return result
     except Exception as e:
         _log("reverse_calculate_gst", ["reverse_gst"], (time.time()-t0)*1000, False, str(e))
-        logger.error(f"Error in reverse calculation: {e}")
+        logger.error("Error in reverse calculation: %s", e)
         raise
 
 
@@ -121,7 +120,7 @@ async def gst_breakdown(base_amount: float, gst_rate: float, is_intra_state: boo
         gst_breakdown(10000, 18, True)
         Returns: {"base_amount": 10000, ..., "breakdown": {"cgst": 900, "sgst": 900, "igst": 0}}
     """
-    logger.info(f"GST breakdown: base={base_amount}, rate={gst_rate}, intra={is_intra_state}")
+    logger.info("GST breakdown: base=%s, rate=%s, intra=%s", base_amount, gst_rate, is_intra_state)
     t0 = time.time()
     try:
         result = await calculator.get_gst_breakdown_async(base_amount, gst_rate, is_intra_state)
@@ -129,7 +128,7 @@ async def gst_breakdown(base_amount: float, gst_rate: float, is_intra_state: boo
         return result
     except Exception as e:
         _log("gst_breakdown", ["gst_breakdown"], (time.time()-t0)*1000, False, str(e))
-        logger.error(f"Error in breakdown: {e}")
+        logger.error("Error in breakdown: %s", e)
         raise
 
 
@@ -148,7 +147,7 @@ async def compare_gst_rates(base_amount: float, rates: List[float]) -> dict:
     Example:
         compare_gst_rates(10000, [5, 12, 18])
     """
-    logger.info(f"Comparing GST rates: base={base_amount}, rates={rates}")
+    logger.info("Comparing GST rates: base=%s, rates=%s", base_amount, rates)
     t0 = time.time()
     try:
         result = await calculator.compare_gst_rates_async(base_amount, rates)
@@ -156,7 +155,7 @@ async def compare_gst_rates(base_amount: float, rates: List[float]) -> dict:
         return result
     except Exception as e:
         _log("compare_gst_rates", ["compare_rates"], (time.time()-t0)*1000, False, str(e))
-        logger.error(f"Error in rate comparison: {e}")
+        logger.error("Error in rate comparison: %s", e)
         raise
 
 
@@ -180,21 +179,30 @@ async def validate_gstin(gstin: str) -> dict:
         Add to .env:  GSTIN_API_KEY=your_key
                       GSTIN_API_PROVIDER=gst_suvidha   # or mastergst
     """
-    logger.info(f"Validating GSTIN: {gstin}")
+    logger.info("Validating GSTIN: %s", gstin)
     t0 = time.time()
     try:
         # Uses real API if configured, local regex fallback otherwise
         result = await calculator.validate_gstin_async(gstin)
         _log("validate_gstin", ["validate_gstin"], (time.time()-t0)*1000, True)
-        logger.info(f"GSTIN valid={result.get('valid')} source={result.get('source','local')}")
+        logger.info("GSTIN valid=%s source=%s", result.get('valid'), result.get('source','local'))
         return result
     except Exception as e:
         _log("validate_gstin", ["validate_gstin"], (time.time()-t0)*1000, False, str(e))
-        logger.error(f"Error validating GSTIN: {e}")
+        logger.error("Error validating GSTIN: %s", e)
         raise
 
 
+async def aclose() -> None:
+    """Shutdown hook for in-process hosts — MCPClient.close() awaits it."""
+    await calculator.aclose()
+
+
 # ── Entry point ────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
+    # Only when run as a server — MCPClient also imports this module
+    # in-process, where the API owns logging setup. force: FastMCP() has
+    # already installed its own root handler by this point.
+    logging.basicConfig(level=logging.INFO, force=True)
     logger.info("Starting GST Calculator MCP Server...")
     mcp.run()
\ No newline at end of file
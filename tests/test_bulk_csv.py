@@ -0,0 +1,62 @@
+"""
+Tests for the bulk-payment CSV summary used by upload_bulk_payment
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("BANK_API_KEY", "test-key")
+
+from mcp_server import data_server
+
+
+MIXED_CSV = b"name,amount\na,100\nb,1e3\nc,abc\nd,-5\ne,nan\nf, 2.5 \n"
+
+
+def test_pyarrow_path_matches_csv_path(monkeypatch):
+    """pyarrow and the csv fallback must count and total the same rows"""
+    pytest.importorskip("pyarrow")
+    for text in (MIXED_CSV, b"name,amount\na,100\nb,250.5\nc,0\n"):
+        fast = data_server._bulk_csv_summary(memoryview(text))
+        with monkeypatch.context() as m:
+            m.setattr(data_server, "pacsv", None)
+            slow = data_server._bulk_csv_summary(memoryview(text))
+        assert fast == slow
+
+
+def test_pyarrow_path_no_amount_column():
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ValueError):
+        data_server._bulk_csv_summary(memoryview(b"name,value\na,1\n"))
+
+
+@pytest.fixture
+def csv_only(monkeypatch):
+    """Force the csv-module path whether or not pyarrow is installed"""
+    monkeypatch.setattr(data_server, "pacsv", None)
+
+
+def test_csv_summary_counts_valid_rows(csv_only):
+    summary = data_server._bulk_csv_summary(memoryview(MIXED_CSV))
+    assert summary == {"total_records": 6, "valid_records": 3,
+                       "invalid_records": 3, "total_amount": 1102.5}
+
+
+def test_csv_summary_rejects_undecodable_file(csv_only):
+    with pytest.raises(ValueError):
+        data_server._bulk_csv_summary(memoryview(b"name,amount\n\xff\xfe,1\n"))
+
+
+def test_csv_summary_requires_amount_column(csv_only):
+    with pytest.raises(ValueError):
+        data_server._bulk_csv_summary(memoryview(b"name,value\na,1\n"))
+
+
+def test_upload_reports_invalid_file():
+    upload = data_server.upload_bulk_payment.__wrapped__
+    result = upload("test-key", "payments.csv", "bmFtZSx2YWx1ZQphLDEK")   # name,value
+    assert result["status"] == "INVALID_FILE"
+    assert result["valid_records"] == 0
+    assert "amount" in result["error"]
@@ -0,0 +1,79 @@
+"""
+Tests for the request coalescer shared by the read-only bank tools
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_server import coalescer as coalescer_module
+from mcp_server.coalescer import Coalescer
+
+
+def test_in_flight_calls_share_one_run():
+    """Identical async calls made while one is pending share its result"""
+    c = Coalescer()
+    runs = []
+
+    async def history(api_key, gstin):
+        runs.append(gstin)
+        await asyncio.sleep(0.01)
+        return {"gstin": gstin, "run": len(runs)}
+
+    wrapped = c.wrap(history, ttl=0)
+
+    async def main():
+        return await asyncio.gather(
+            wrapped("key-a", gstin="G1"),
+            wrapped("key-b", gstin="G1"),     # api_key is not part of the key
+            wrapped("key-a", gstin="G2"),
+        )
+
+    first, second, other = asyncio.run(main())
+    assert runs == ["G1", "G2"]
+    assert first is second
+    assert other["gstin"] == "G2"
+
+
+def test_results_expire_after_ttl(monkeypatch):
+    """A cached result is reused inside the ttl and recomputed after it"""
+    now = [1000.0]
+    monkeypatch.setattr(coalescer_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    c = Coalescer()
+    runs = []
+
+    def balance(api_key, account_number):
+        runs.append(account_number)
+        return len(runs)
+
+    wrapped = c.wrap(balance, ttl=5.0)
+    assert wrapped("key", account_number="1") == 1
+    now[0] += 4.0
+    assert wrapped("key", account_number="1") == 1
+    now[0] += 2.0
+    assert wrapped("key", account_number="1") == 2
+    assert runs == ["1", "1"]
+
+
+def test_invalidate_by_argument_match():
+    """Only entries whose arguments agree with the match are dropped"""
+    c = Coalescer()
+    runs = []
+
+    def history(api_key, gstin=None):
+        runs.append(gstin)
+        return len(runs)
+
+    wrapped = c.wrap(history, ttl=60)
+    wrapped("key", gstin="G1")
+    wrapped("key", gstin="G2")
+    wrapped("key")                            # unfiltered history
+    assert len(runs) == 3
+
+    c.invalidate("history", gstin="G1")
+    wrapped("key", gstin="G1")                # recomputed
+    wrapped("key", gstin="G2")                # still cached
+    wrapped("key")                            # no gstin argument — also dropped
+    assert runs == ["G1", "G2", None, "G1", None]
@@ -0,0 +1,124 @@
+"""
+Tests for the bank MCP server's entry point and multi-record tools
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("BANK_API_KEY", "test-key")
+
+from mcp_server import data_server
+
+
+@pytest.fixture
+def restore_loop_policy():
+    yield
+    asyncio.set_event_loop_policy(None)
+
+
+def test_import_leaves_loop_policy_alone():
+    """uvloop is only installed by __main__, never by importing the module"""
+    assert type(asyncio.get_event_loop_policy()).__module__.startswith("asyncio")
+
+
+def test_install_uvloop_sets_policy(restore_loop_policy):
+    uvloop = pytest.importorskip("uvloop")
+    assert data_server._install_uvloop() is True
+    assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+
+
+def test_install_uvloop_without_uvloop(monkeypatch, restore_loop_policy):
+    monkeypatch.setitem(sys.modules, "uvloop", None)     # import raises ImportError
+    before = asyncio.get_event_loop_policy()
+    assert data_server._install_uvloop() is False
+    assert asyncio.get_event_loop_policy() is before
+
+
+KEY = os.environ["BANK_API_KEY"]
+GST_PAYMENT = {"gstin": "27AAPFU0939F1ZV", "challan_number": "CPIN123", "tax_type": "IGST"}
+
+
+def batch(*calls):
+    return data_server.batch_execute.__wrapped__(KEY, list(calls))["results"]
+
+
+def test_batch_coerces_args_like_a_direct_call():
+    (entry,) = batch({"tool": "pay_gst", "args": {**GST_PAYMENT, "amount": "50000"}})
+    assert entry["result"].amount == 50000.0
+    assert isinstance(entry["result"].amount, float)
+
+
+def test_batch_rejects_unknown_tools_and_keys():
+    unknown, extra = batch(
+        {"tool": "no_such_tool", "args": {}},
+        {"tool": "pay_gst", "args": {**GST_PAYMENT, "amount": 1, "bogus": 1}},
+    )
+    assert unknown["error"] == "Unknown tool: no_such_tool"
+    assert extra["error"] == "Invalid arguments for pay_gst: bogus: Unexpected keyword argument"
+
+
+def test_batch_errors_are_field_msg_pairs():
+    (entry,) = batch({"tool": "pay_gst", "args": {"gstin": "27AAPFU0939F1ZV", "amount": "abc"}})
+    error = entry["error"]
+    assert "\n" not in error and "errors.pydantic.dev" not in error
+    assert error.startswith("Invalid arguments for pay_gst: ")
+    assert "challan_number: Missing required argument" in error
+    assert "amount: Input should be a valid number" in error
+
+
+def test_batch_rejects_per_call_api_key():
+    (entry,) = batch({"tool": "get_account_balance", "args": {"account_number": "1", "api_key": KEY}})
+    assert "api_key is passed once" in entry["error"]
+
+
+def test_batch_cannot_call_itself():
+    (entry,) = batch({"tool": "batch_execute", "args": {"calls": []}})
+    assert entry["error"] == "Unknown tool: batch_execute"
+
+
+def test_batch_failure_does_not_stop_later_calls():
+    failed, ok = batch(
+        {"tool": "no_such_tool", "args": {}},
+        {"tool": "get_account_balance", "args": {"account_number": "1"}},
+    )
+    assert "error" in failed
+    assert "result" in ok
+
+
+def test_bulk_reports_mixed_batch():
+    result = data_server.pay_gst_bulk.__wrapped__(KEY, [
+        {**GST_PAYMENT, "amount": 0.1},
+        {**GST_PAYMENT, "amount": "abc"},
+        {**GST_PAYMENT, "amount": 0.2},
+        {**GST_PAYMENT, "amount": "100"},
+    ])
+    assert (result["total_records"], result["succeeded"], result["failed"]) == (4, 3, 1)
+    assert result["total_amount"] == 100.3
+    bad = result["results"][1]
+    assert bad["payment"]["amount"] == "abc"
+    assert bad["error"] == "Invalid arguments for pay_gst: amount: Input should be a valid number, unable to parse string as a number"
+
+
+def test_bulk_total_has_no_float_drift():
+    payments = [{**GST_PAYMENT, "amount": 0.1}] * 10
+    result = data_server.pay_gst_bulk.__wrapped__(KEY, payments)
+    assert result["total_amount"] == 1.0
+
+
+def test_bulk_tax_writes_invalidate_tax_reads():
+    dues = data_server._TOOL_IMPLS["fetch_tax_dues"]
+    first = dues(api_key=KEY, pan="AAPFU0939F")
+    assert dues(api_key=KEY, pan="AAPFU0939F") is first          # cached
+
+    data_server.pay_bulk_tax.__wrapped__(KEY, "tds.csv", "", "TDS")
+    second = dues(api_key=KEY, pan="AAPFU0939F")
+    assert second is not first
+
+    data_server.pay_direct_tax_bulk.__wrapped__(KEY, [{
+        "pan": "AAPFU0939F", "tax_type": "TDS", "assessment_year": "2026-27",
+        "amount": 25000, "challan_type": "281",
+    }])
+    assert dues(api_key=KEY, pan="AAPFU0939F") is not second
@@ -0,0 +1,176 @@
+"""
+Tests for LocalMLService's query result cache, per-query call dedup and
+classifier cache
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from client import llm_service
+from client.llm_service import LocalMLService, RESULT_CACHE_TTL_SECS
+
+
+GST_CALL     = {"tool_name": "calculate_gst", "parameters": {"amount": 1000, "gst_rate": 18}}
+PAYMENT_CALL = {"tool_name": "pay_gst", "parameters": {"gstin": "27AAPFU0939F1ZV", "amount": 500}}
+
+
+class StubClassifier:
+    """Returns the tool calls registered for a message, whatever its case"""
+
+    def __init__(self, tool_calls):
+        self.tool_calls = tool_calls
+        self.calls      = []
+
+    def process_query(self, message):
+        self.calls.append(message)
+        return {
+            "intents_detected": ["stub"],
+            "tool_calls": [
+                {"tool_name": c["tool_name"], "parameters": dict(c["parameters"])}
+                for c in self.tool_calls
+            ],
+            "entities": {},
+        }
+
+
+class StubClient:
+    """MCP client that serves every tool and counts the calls it receives"""
+
+    def __init__(self, tools):
+        self.available_tools = [{"name": t} for t in tools]
+        self.calls           = []
+
+    async def call_tool(self, name, arguments):
+        self.calls.append(name)
+        return {"success": True, "result": '{"call": %d}' % len(self.calls), "is_error": False}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_service, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def make_service(monkeypatch, *tool_calls):
+    """A LocalMLService wired to a stub classifier and one stub MCP client"""
+    classifier = StubClassifier(tool_calls)
+    monkeypatch.setitem(sys.modules, "ml_intent_classifier",
+                        SimpleNamespace(intent_classifier=classifier))
+    client = StubClient(["calculate_gst", "pay_gst"])
+    empty  = StubClient([])
+
+    async def get_all():
+        return [client, empty, empty]
+
+    monkeypatch.setattr(llm_service, "mcp_registry", SimpleNamespace(get_all=get_all))
+    return LocalMLService(), client, classifier
+
+
+def ask(service, message):
+    return asyncio.run(service.process_query(message))
+
+
+def test_repeated_pure_query_is_served_from_cache(monkeypatch, clock):
+    service, client, _ = make_service(monkeypatch, GST_CALL)
+    first  = ask(service, "gst on 1000")
+    second = ask(service, "gst on 1000")
+    assert second == first
+    assert client.calls == ["calculate_gst"]
+
+
+def test_cached_result_expires_after_ttl(monkeypatch, clock):
+    service, client, _ = make_service(monkeypatch, GST_CALL)
+    ask(service, "gst on 1000")
+    clock[0] += RESULT_CACHE_TTL_SECS + 1
+    ask(service, "gst on 1000")
+    assert client.calls == ["calculate_gst", "calculate_gst"]
+
+
+def test_cached_result_is_isolated_from_callers(monkeypatch, clock):
+    service, _, _ = make_service(monkeypatch, GST_CALL)
+    first = ask(service, "gst on 1000")
+    first["tool_calls"][0]["result"]["call"] = 99
+    second = ask(service, "gst on 1000")
+    assert second["tool_calls"][0]["result"] == {"call": 1}
+    second["response"] = "changed"
+    assert ask(service, "gst on 1000")["response"] != "changed"
+
+
+def test_payment_queries_are_never_cached(monkeypatch, clock):
+    service, client, _ = make_service(monkeypatch, PAYMENT_CALL)
+    ask(service, "pay gst 500")
+    ask(service, "pay gst 500")
+    assert client.calls == ["pay_gst", "pay_gst"]
+
+
+def test_queries_mixing_pure_and_payment_tools_are_never_cached(monkeypatch, clock):
+    service, client, _ = make_service(monkeypatch, GST_CALL, PAYMENT_CALL)
+    ask(service, "gst on 1000 and pay it")
+    ask(service, "gst on 1000 and pay it")
+    assert client.calls.count("pay_gst") == 2
+    assert client.calls.count("calculate_gst") == 2
+
+
+def test_cache_key_is_stripped_but_not_case_folded(monkeypatch, clock):
+    """Entities such as GSTINs and transaction IDs are case-sensitive"""
+    service, client, _ = make_service(monkeypatch, GST_CALL)
+    ask(service, "gst on 1000")
+    ask(service, "  gst on 1000\n")
+    assert client.calls == ["calculate_gst"]
+    ask(service, "GST ON 1000")
+    assert client.calls == ["calculate_gst", "calculate_gst"]
+
+
+def test_identical_pure_calls_in_one_query_run_once(monkeypatch, clock):
+    service, client, _ = make_service(monkeypatch, GST_CALL, GST_CALL)
+    response = ask(service, "gst on 1000 twice")
+    assert client.calls == ["calculate_gst"]
+    first, second = response["tool_calls"]
+    assert first["success"] and second["success"]
+    assert first["result"] == second["result"]
+
+
+def test_pure_calls_with_different_args_are_not_merged(monkeypatch, clock):
+    other = {"tool_name": "calculate_gst", "parameters": {"amount": 2000, "gst_rate": 18}}
+    service, client, _ = make_service(monkeypatch, GST_CALL, other)
+    ask(service, "gst on 1000 and 2000")
+    assert client.calls == ["calculate_gst", "calculate_gst"]
+
+
+def test_identical_payment_calls_are_never_merged(monkeypatch, clock):
+    service, client, _ = make_service(monkeypatch, PAYMENT_CALL, PAYMENT_CALL)
+    response = ask(service, "pay gst 500 twice")
+    assert client.calls == ["pay_gst", "pay_gst"]
+    first, second = response["tool_calls"]
+    assert first["result"] != second["result"]
+
+
+def test_cached_classification_matches_a_fresh_one(monkeypatch):
+    service, _, classifier = make_service(monkeypatch, GST_CALL, PAYMENT_CALL)
+    first  = service._classify("gst on 1000 and pay it")
+    cached = service._classify("gst on 1000 and pay it ")
+    assert classifier.calls == ["gst on 1000 and pay it"]
+    assert cached == first == classifier.process_query("gst on 1000 and pay it")
+
+    # callers get private copies — api_key injection mutates tool specs
+    cached["tool_calls"][0]["parameters"]["api_key"] = "key"
+    assert "api_key" not in service._classify("gst on 1000 and pay it")["tool_calls"][0]["parameters"]
+
+
+def test_classifier_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(llm_service, "CLASSIFIER_CACHE_SIZE", 2)
+    service, _, classifier = make_service(monkeypatch, GST_CALL)
+    service._classify("a")
+    service._classify("b")
+    service._classify("a")              # refreshes a
+    service._classify("c")              # evicts b, the least recently used
+    assert len(service._intent_cache) == 2
+    service._classify("a")
+    service._classify("b")
+    assert classifier.calls == ["a", "b", "c", "b"]
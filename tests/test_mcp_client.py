@@ -0,0 +1,218 @@
+"""
+Tests for MCPClient's circuit breaker, result cache, required-argument
+precheck and in-process server loading
+"""
+import asyncio
+import logging
+import os
+import sys
+from types import SimpleNamespace
+
+import anyio
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from client import mcp_client
+from client.mcp_client import MCPClient, MCPRegistry, CIRCUIT_COOLDOWN_SECS, CIRCUIT_FAIL_THRESHOLD
+
+
+class FakeServer:
+    """Stands in for an in-process FastMCP instance"""
+
+    def __init__(self, fail: bool = False):
+        self.fail  = fail
+        self.calls = []
+
+    async def call_tool(self, name, arguments):
+        self.calls.append(name)
+        if self.fail:
+            raise RuntimeError("server down")
+        return [SimpleNamespace(text=f"{name} ok", is_error=False)]
+
+
+class DeadSession:
+    """A stdio session whose server process has exited"""
+
+    async def call_tool(self, name, arguments):
+        raise anyio.ClosedResourceError()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mcp_client, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def make_client(server: FakeServer) -> MCPClient:
+    client = MCPClient("mcp_server.fake", "Fake Server", in_process=True)
+    client._local = server
+    return client
+
+
+def test_circuit_opens_after_threshold_and_closes_after_cooldown(clock):
+    server = FakeServer(fail=True)
+    client = make_client(server)
+
+    for _ in range(CIRCUIT_FAIL_THRESHOLD):
+        response = asyncio.run(client.call_tool("get_account_balance", {}))
+        assert response["error"] == "server down"
+    assert len(server.calls) == CIRCUIT_FAIL_THRESHOLD
+
+    # open: fails fast without reaching the server
+    response = asyncio.run(client.call_tool("get_account_balance", {}))
+    assert "circuit open" in response["error"]
+    assert len(server.calls) == CIRCUIT_FAIL_THRESHOLD
+
+    # after the cooldown calls go through again and a success resets it
+    clock[0] += CIRCUIT_COOLDOWN_SECS + 1
+    server.fail = False
+    response = asyncio.run(client.call_tool("get_account_balance", {}))
+    assert response["success"]
+    assert client._breaker.fail_count == 0
+
+
+def test_dead_server_is_not_respawned_inside_cooldown(clock, monkeypatch):
+    """The breaker lives on the registry slot, so reconnecting doesn't reset it"""
+    spawns = []
+
+    async def connect(self):
+        spawns.append(self)
+        self._session = DeadSession()
+
+    monkeypatch.setattr(MCPClient, "connect", connect)
+    registry = MCPRegistry([("bank", "Fake Bank", "mcp_server.fake", False)])
+
+    async def main():
+        for _ in range(CIRCUIT_FAIL_THRESHOLD):
+            client   = await registry.get(0)
+            response = await client.call_tool("get_account_balance", {})
+            assert "connection lost" in response["error"]
+            assert not client.connected
+        with pytest.raises(ConnectionError, match="circuit open"):
+            await registry.get(0)
+        assert len(spawns) == CIRCUIT_FAIL_THRESHOLD
+
+        clock[0] += CIRCUIT_COOLDOWN_SECS + 1
+        await registry.get(0)
+        assert len(spawns) == CIRCUIT_FAIL_THRESHOLD + 1
+
+    asyncio.run(main())
+
+
+def test_connect_failures_trip_the_breaker(clock, monkeypatch):
+    spawns = []
+
+    async def connect(self):
+        spawns.append(self)
+        raise OSError("server exited during startup")
+
+    monkeypatch.setattr(MCPClient, "connect", connect)
+    registry = MCPRegistry([("bank", "Fake Bank", "mcp_server.fake", False)])
+
+    async def main():
+        for _ in range(CIRCUIT_FAIL_THRESHOLD):
+            with pytest.raises(OSError):
+                await registry.get(0)
+        with pytest.raises(ConnectionError, match="circuit open"):
+            await registry.get(0)
+
+    asyncio.run(main())
+    assert len(spawns) == CIRCUIT_FAIL_THRESHOLD
+
+
+def test_cacheable_results_are_reused_until_ttl(clock):
+    server = FakeServer()
+    client = make_client(server)
+    args = {"amount": 1000, "gst_rate": 18}
+
+    first  = asyncio.run(client.call_tool("calculate_gst", args))
+    second = asyncio.run(client.call_tool("calculate_gst", dict(reversed(args.items()))))
+    assert first == second
+    assert server.calls == ["calculate_gst"]
+
+    clock[0] += mcp_client.TOOL_CACHE_TTL_SECS + 1
+    asyncio.run(client.call_tool("calculate_gst", args))
+    assert server.calls == ["calculate_gst", "calculate_gst"]
+
+
+def test_non_cacheable_tools_always_call_the_server(clock):
+    server = FakeServer()
+    client = make_client(server)
+
+    asyncio.run(client.call_tool("validate_gstin", {"gstin": "27AAPFU0939F1ZV"}))
+    asyncio.run(client.call_tool("validate_gstin", {"gstin": "27AAPFU0939F1ZV"}))
+    assert server.calls == ["validate_gstin", "validate_gstin"]
+
+
+GST_SCHEMA = {
+    "type": "object",
+    "properties": {"amount": {"type": "number"}, "gst_rate": {"type": "number"}},
+    "required": ["amount", "gst_rate"],
+}
+
+
+def make_indexed_client(server: FakeServer) -> MCPClient:
+    client = make_client(server)
+    client.available_tools = [
+        {"name": "gst_breakdown", "description": "GST breakdown", "input_schema": GST_SCHEMA},
+    ]
+    client._index_tools()
+    return client
+
+
+def test_missing_required_argument_fails_fast():
+    server = FakeServer()
+    client = make_indexed_client(server)
+
+    response = asyncio.run(client.call_tool("gst_breakdown", {"gst_rate": 18}))
+    assert response["success"] is False
+    assert response["is_error"] is True
+    assert response["error"] == "Missing required argument(s) for gst_breakdown: amount"
+
+    response = asyncio.run(client.call_tool("gst_breakdown", {}))
+    assert response["error"] == "Missing required argument(s) for gst_breakdown: amount, gst_rate"
+    assert server.calls == []
+
+
+def test_lax_types_still_reach_the_server():
+    """Only presence is checked; coercion ("18" -> 18) is left to the server"""
+    server = FakeServer()
+    client = make_indexed_client(server)
+
+    response = asyncio.run(client.call_tool("gst_breakdown", {"amount": "1000", "gst_rate": "18"}))
+    assert response["success"]
+    assert server.calls == ["gst_breakdown"]
+
+
+def test_real_gst_server_coerces_string_numbers():
+    client = MCPClient("mcp_server.server", "GST Calculator", in_process=True)
+
+    async def main():
+        await client.connect()
+        try:
+            return await client.call_tool("calculate_gst", {"base_amount": "1000", "gst_rate": "18"})
+        finally:
+            await client.close()
+
+    response = asyncio.run(main())
+    assert response["success"]
+    assert '"total_amount": 1180.0' in response["result"]
+
+
+def test_in_process_import_leaves_root_logging_alone(monkeypatch):
+    """FastMCP() calls logging.basicConfig; the host's setup must survive it"""
+    monkeypatch.delitem(sys.modules, "mcp_server.info_server", raising=False)
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])        # an unconfigured host
+    monkeypatch.setattr(root, "level", logging.WARNING)
+    client = MCPClient("mcp_server.info_server", "Onboarding Info", in_process=True)
+
+    async def main():
+        await client.connect()
+        await client.close()
+
+    asyncio.run(main())
+    assert root.handlers == []
+    assert root.level == logging.WARNING